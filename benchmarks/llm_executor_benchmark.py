@@ -0,0 +1,137 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 저장소 루트에서 function_list를 불러올 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_openai import ChatOpenAI
+from langchain_core.prompts import PromptTemplate
+from function_list.llm_executor import LLMExecutor
+from gpt_llm_prompt.llm_it_notice_check import PROMPT_TEMPLATE, ITNoticeCheckStage, parser as it_notice_parser
+
+
+class FakeOpenAIServer(ThreadingHTTPServer):
+    """
+    OpenAI Chat Completions API를 흉내 내는 로컬 서버.
+
+    요청마다 latency초(±jitter) 뒤에 "True"를 응답하고, 동시 요청이 capacity를 넘으면 429를 반환합니다.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, latency, capacity, jitter=0.1):
+        super().__init__(('127.0.0.1', 0), FakeOpenAIHandler)
+        self.latency = latency
+        self.capacity = capacity
+        self.jitter = jitter
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+
+class FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """FakeOpenAIServer의 요청 처리 클래스."""
+
+    def log_message(self, *args):
+        pass  # 요청 로그 출력 안 함
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        with server.lock:
+            if server.in_flight >= server.capacity:
+                server.throttled += 1
+                throttled = True
+            else:
+                throttled = False
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        if throttled:
+            self._send(429, {'error': {'message': 'Rate limit reached', 'type': 'requests'}}, {'Retry-After': '0.2'})
+            return
+        try:
+            time.sleep(server.latency * (1 + random.uniform(-server.jitter, server.jitter)))
+            prompt_tokens = sum(len(message['content']) for message in request['messages']) // 2
+            self._send(200, {
+                'id': 'chatcmpl-fake',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': request['model'],
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': 'True'},
+                    'finish_reason': 'stop',
+                }],
+                'usage': {'prompt_tokens': prompt_tokens, 'completion_tokens': 1, 'total_tokens': prompt_tokens + 1},
+            })
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+# 벤치마크용 LLM 단계 생성 함수
+def fake_stage(base_url):
+    """
+    가짜 서버를 사용하는 IT 공고 판단 단계를 만듭니다.
+
+    Args:
+        base_url (str): 가짜 서버 주소.
+
+    Returns:
+        ITNoticeCheckStage: IT 공고 판단 단계.
+    """
+    prompt = PromptTemplate.from_template(PROMPT_TEMPLATE).partial(
+        instructions=it_notice_parser.get_format_instructions()
+    )
+    # 429를 실행기가 직접 처리하도록 클라이언트 재시도는 끔
+    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0, base_url=base_url, api_key="fake", max_retries=0)
+    return ITNoticeCheckStage(prompt, llm, it_notice_parser)
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="가짜 OpenAI 서버로 순차 실행과 LLMExecutor를 비교합니다.")
+    arg_parser.add_argument('--notices', type=int, default=100, help="공고 수")
+    arg_parser.add_argument('--latency', type=float, default=0.2, help="요청당 응답 지연 (초)")
+    arg_parser.add_argument('--capacity', type=int, default=12, help="서버가 동시에 처리하는 요청 수 (넘으면 429)")
+    arg_parser.add_argument('--concurrency', type=int, default=32, help="실행기의 최대 동시 요청 수")
+    arg_parser.add_argument('--rpm', type=float, default=None, help="분당 요청 수 제한")
+    arg_parser.add_argument('--tpm', type=float, default=None, help="분당 토큰 수 제한")
+    arg_parser.add_argument('--skip-sequential', action='store_true', help="순차 실행 측정 생략")
+    args = arg_parser.parse_args()
+
+    server = FakeOpenAIServer(args.latency, args.capacity)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    stage = fake_stage(f"http://127.0.0.1:{server.server_address[1]}/v1")
+    texts = [f"공고 {n}: 인공지능 기반 데이터 분석 시스템 구축 " * 20 for n in range(args.notices)]
+
+    if not args.skip_sequential:
+        start = time.perf_counter()
+        sequential = [stage.run(text) for text in texts]
+        elapsed = time.perf_counter() - start
+        print(f"순차 실행: {elapsed:.2f}초 ({len(texts) / elapsed:.1f}건/초)")
+
+    server.max_in_flight = server.throttled = 0
+    executor = LLMExecutor(max_concurrency=args.concurrency, requests_per_minute=args.rpm, tokens_per_minute=args.tpm)
+    start = time.perf_counter()
+    results = executor.run_many(stage, texts)
+    elapsed = time.perf_counter() - start
+    failed = sum(isinstance(result, Exception) for result in results)
+    print(f"LLMExecutor: {elapsed:.2f}초 ({len(texts) / elapsed:.1f}건/초), 실패 {failed}건")
+    print(f"  서버 최대 동시 요청 {server.max_in_flight}, 429 응답 {server.throttled}회, 실행기 통계 {executor.summary()}")
+    server.shutdown()
@@ -0,0 +1,316 @@
+import io
+import os
+import sys
+import json
+import time
+import zlib
+import zipfile
+import argparse
+import platform
+import tracemalloc
+
+# 저장소 루트에서 function_list를 불러올 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import olefile
+from pypdf import PdfReader
+from function_list.g2b_func import NOTICE_TEXT_LIMIT, LOADER_VERSIONS, extract_file_text
+from function_list.hwp_loader import HWPLoader
+from function_list.hwpx_loader import section_paragraphs
+from function_list.text_normalize import DEFAULT_NORMALIZER
+from synthetic_docs import make_hwp, make_hwpx, make_pdf
+
+# 크기별 합성 문서 설정 (HWP/HWPX는 (섹션별 문단 수, 섹션 수), PDF는 페이지 수)
+CORPUS_SIZES = {
+    'small': {'hwp': (100, 2), 'hwpx': (100, 2), 'pdf': 3},
+    'medium': {'hwp': (1000, 4), 'hwpx': (1000, 3), 'pdf': 30},
+    'large': {'hwp': (4000, 8), 'hwpx': (4000, 6), 'pdf': 150},
+}
+
+# 파일 유형별 확장자
+EXTENSIONS = {'hwp': '.hwp', 'hwpx': '.hwpx', 'pdf': '.pdf'}
+
+# 합성 문서 생성 함수
+def build_corpus(size):
+    """
+    크기 설정에 맞는 HWP(압축), HWPX, PDF 문서를 만듭니다.
+
+    Args:
+        size (str): CORPUS_SIZES의 키.
+
+    Returns:
+        dict: 로더 이름 -> 파일 내용(bytes).
+    """
+    config = CORPUS_SIZES[size]
+    return {
+        'hwp': make_hwp(*config['hwp']),
+        'hwpx': make_hwpx(*config['hwpx']),
+        'pdf': make_pdf(config['pdf']),
+    }
+
+# 메모리 파일 생성 함수
+def as_file(loader, data):
+    """extract_file_text()에 넘길 수 있도록 이름이 있는 BytesIO를 만듭니다."""
+    source = io.BytesIO(data)
+    source.name = 'benchmark' + EXTENSIONS[loader]
+    return source
+
+# 실행 시간 측정 함수
+def best_time(func, repeat):
+    """
+    함수를 여러 번 실행하여 가장 짧은 실행 시간과 결과를 반환합니다.
+
+    Args:
+        func (Callable): 인자 없이 호출할 함수.
+        repeat (int): 반복 횟수.
+
+    Returns:
+        tuple: (가장 짧은 실행 시간(초), 결과).
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+# 최대 메모리 사용량 측정 함수
+def peak_memory(func):
+    """
+    tracemalloc으로 함수 실행 중 최대 메모리 할당량을 측정합니다.
+
+    측정 중에는 실행이 느려지므로 실행 시간 측정과 따로 한 번 실행합니다.
+
+    Args:
+        func (Callable): 인자 없이 호출할 함수.
+
+    Returns:
+        float: 최대 메모리 할당량 (MB).
+    """
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 1e6
+
+# HWP 단계별 시간 측정 함수
+def hwp_stages(data):
+    """
+    HWPLoader의 처리 과정을 단계별로 나누어 실행 시간을 측정합니다.
+
+    Args:
+        data (bytes): HWP 파일 내용.
+
+    Returns:
+        dict: 단계 이름 -> 실행 시간(초).
+    """
+    loader = HWPLoader(io.BytesIO(data))
+    times = {}
+
+    start = time.perf_counter()
+    ole = olefile.OleFileIO(io.BytesIO(data))
+    file_dir = ole.listdir()
+    compressed = loader._is_compressed(ole)
+    times['ole_open'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    streams = []
+    for section in loader._get_body_sections(file_dir):
+        with ole.openstream(section) as stream:
+            streams.append(stream.read())
+    times['stream_read'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if compressed:
+        streams = [zlib.decompress(stream, -15) for stream in streams]
+    times['inflate'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sections = [loader._scan_para_text(stream)[0] for stream in streams]
+    times['scan'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for texts in sections:
+        DEFAULT_NORMALIZER.normalize_lines(texts)
+    times['normalize'] = time.perf_counter() - start
+    ole.close()
+    return times
+
+# HWPX 단계별 시간 측정 함수
+def hwpx_stages(data):
+    """
+    get_hwpx_text()의 처리 과정을 단계별로 나누어 실행 시간을 측정합니다.
+
+    Args:
+        data (bytes): HWPX 파일 내용.
+
+    Returns:
+        dict: 단계 이름 -> 실행 시간(초).
+    """
+    times = {}
+
+    start = time.perf_counter()
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        streams = [
+            zf.read(name) for name in zf.namelist()
+            if name.startswith('Contents/section') and name.endswith('.xml')
+        ]
+    times['unzip'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sections = [section_paragraphs(io.BytesIO(stream)) for stream in streams]
+    times['parse'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for paragraphs in sections:
+        DEFAULT_NORMALIZER.normalize_lines([text for _, text in paragraphs if text])
+    times['normalize'] = time.perf_counter() - start
+    return times
+
+# PDF 단계별 시간 측정 함수
+def pdf_stages(data):
+    """
+    PDF 추출 과정을 문서 열기와 페이지 텍스트 추출로 나누어 실행 시간을 측정합니다.
+
+    Args:
+        data (bytes): PDF 파일 내용.
+
+    Returns:
+        dict: 단계 이름 -> 실행 시간(초).
+    """
+    times = {}
+
+    start = time.perf_counter()
+    reader = PdfReader(io.BytesIO(data))
+    times['open'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for page in reader.pages:
+        page.extract_text()
+    times['extract_text'] = time.perf_counter() - start
+    return times
+
+# 로더별 단계 측정 함수
+STAGE_FUNCTIONS = {'hwp': hwp_stages, 'hwpx': hwpx_stages, 'pdf': pdf_stages}
+
+# 로더 하나의 벤치마크 함수
+def benchmark_loader(loader, data, repeat):
+    """
+    전체 추출과 글자 수 제한 추출의 처리량, 최대 메모리, 단계별 시간을 측정합니다.
+
+    Args:
+        loader (str): 로더 이름 ('hwp', 'hwpx', 'pdf').
+        data (bytes): 파일 내용.
+        repeat (int): 반복 횟수.
+
+    Returns:
+        dict: 측정 결과.
+    """
+    result = {'bytes': len(data)}
+    for mode, max_chars in (('full', None), ('budget', NOTICE_TEXT_LIMIT)):
+        run = lambda: extract_file_text(as_file(loader, data), max_chars)
+        seconds, text = best_time(run, repeat)
+        result[mode] = {
+            'seconds': round(seconds, 6),
+            'chars': len(text),
+            'mb_per_s': round(len(data) / seconds / 1e6, 3),
+            'chars_per_s': round(len(text) / seconds),
+            'peak_mb': round(peak_memory(run), 3),
+        }
+    stages = [STAGE_FUNCTIONS[loader](data) for _ in range(repeat)]
+    result['stages'] = {name: round(min(times[name] for times in stages), 6) for name in stages[0]}
+    return result
+
+# 결과 출력 함수
+def print_results(results):
+    """측정 결과를 크기와 로더별로 출력합니다."""
+    for size, loaders in results.items():
+        for loader, result in loaders.items():
+            print(f"[{size}/{loader}] {result['bytes'] / 1e6:.2f}MB")
+            for mode in ('full', 'budget'):
+                r = result[mode]
+                print(
+                    f"  {mode:6s} {r['seconds'] * 1000:9.2f}ms  {r['mb_per_s']:8.2f}MB/s  "
+                    f"{r['chars_per_s'] / 1e6:7.2f}M자/초  최대 메모리 {r['peak_mb']:.2f}MB  ({r['chars']}자)"
+                )
+            stages = ', '.join(f"{name} {seconds * 1000:.2f}ms" for name, seconds in result['stages'].items())
+            print(f"  단계별: {stages}")
+
+# 기준 결과 비교 함수
+def compare_baseline(results, baseline, threshold):
+    """
+    기준 결과와 비교하여 처리량(MB/s)이나 최대 메모리가 threshold 비율 넘게 나빠진 항목을 찾습니다.
+
+    Args:
+        results (dict): 이번 측정 결과.
+        baseline (dict): 저장된 기준 결과 파일 내용.
+        threshold (float): 허용하는 변화 비율 (0.2이면 20%).
+
+    Returns:
+        List[str]: 성능이 나빠진 항목 설명 리스트.
+    """
+    regressions = []
+    for size, loaders in results.items():
+        for loader, result in loaders.items():
+            base = baseline['results'].get(size, {}).get(loader)
+            if base is None:
+                continue
+            for mode in ('full', 'budget'):
+                now, before = result[mode], base[mode]
+                if now['mb_per_s'] < before['mb_per_s'] * (1 - threshold):
+                    regressions.append(
+                        f"{size}/{loader}/{mode} 처리량 {before['mb_per_s']} -> {now['mb_per_s']}MB/s"
+                    )
+                if now['peak_mb'] > before['peak_mb'] * (1 + threshold):
+                    regressions.append(
+                        f"{size}/{loader}/{mode} 최대 메모리 {before['peak_mb']} -> {now['peak_mb']}MB"
+                    )
+                if now['chars'] != before['chars']:
+                    regressions.append(
+                        f"{size}/{loader}/{mode} 추출 글자 수 {before['chars']} -> {now['chars']}"
+                    )
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="합성 HWP/HWPX/PDF 문서로 로더 성능을 측정합니다.")
+    parser.add_argument('--sizes', nargs='+', choices=list(CORPUS_SIZES), default=list(CORPUS_SIZES), help="문서 크기")
+    parser.add_argument('--loaders', nargs='+', choices=list(EXTENSIONS), default=list(EXTENSIONS), help="측정할 로더")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수")
+    parser.add_argument('--save-baseline', help="측정 결과를 기준 결과로 저장할 JSON 파일 경로")
+    parser.add_argument('--baseline', help="비교할 기준 결과 JSON 파일 경로")
+    parser.add_argument('--threshold', type=float, default=0.2, help="성능 저하로 판단할 변화 비율")
+    args = parser.parse_args()
+
+    results = {}
+    for size in args.sizes:
+        corpus = build_corpus(size)
+        results[size] = {loader: benchmark_loader(loader, corpus[loader], args.repeat) for loader in args.loaders}
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'loader_versions': LOADER_VERSIONS,
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"기준 결과 저장: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('loader_versions') != LOADER_VERSIONS:
+            print(f"로더 버전이 다릅니다: {baseline.get('loader_versions')} -> {LOADER_VERSIONS}")
+        regressions = compare_baseline(results, baseline, args.threshold)
+        if regressions:
+            print("성능 저하:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print(f"기준 결과 대비 성능 저하 없음 (허용 비율 {args.threshold:.0%})")
@@ -0,0 +1,97 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import unicodedata
+
+# 저장소 루트에서 function_list를 불러올 수 있도록 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from function_list.text_normalize import DEFAULT_NORMALIZER, removal_pattern
+
+# 기존 로더의 정제 방식 (문단마다 정규식 + 문자별 unicodedata.category)
+def legacy_normalize_lines(lines):
+    """
+    기존 HWPLoader/hwpx_loader와 같은 방식으로 문단 목록을 정제합니다.
+
+    Args:
+        lines (List[str]): 문단 텍스트 목록.
+
+    Returns:
+        str: 정제된 텍스트.
+    """
+    lines = [re.sub(r"[\u4e00-\u9fff]+", "", line) for line in lines]
+    lines = ["".join(ch for ch in line if unicodedata.category(ch)[0] != "C") for line in lines]
+    return "\n".join(lines)
+
+# 벤치마크용 문단 생성 함수
+def sample_lines(count, seed=0):
+    """
+    한글, 한자, 제어 문자, BMP 밖 문자가 섞인 문단 목록을 만듭니다.
+
+    Args:
+        count (int): 문단 수.
+        seed (int): 난수 시드.
+
+    Returns:
+        List[str]: 문단 텍스트 목록.
+    """
+    rng = random.Random(seed)
+    # 일반 단어 위주로, 제거 대상 문자는 드물게 섞음
+    words = ['과업', '지시서', '시스템', '구축', '데이터', '클라우드', '보안', 'AI', '운영', '- 항목', '■ 개요']
+    rare = ['人工', '知能', '\x02', '\r', '\t', '\n', '\u200b', '\ufeff', '\U0001F4C4']
+    population = words + rare
+    weights = [20] * len(words) + [1] * len(rare)
+    return [
+        ' '.join(rng.choices(population, weights, k=rng.randint(5, 40)))
+        for _ in range(count)
+    ]
+
+# 실행 시간 측정 함수
+def best_time(func, lines, repeat):
+    """
+    함수를 여러 번 실행하여 가장 짧은 실행 시간과 결과를 반환합니다.
+
+    Args:
+        func (Callable): 측정할 함수.
+        lines (List[str]): 함수에 전달할 문단 목록.
+        repeat (int): 반복 횟수.
+
+    Returns:
+        tuple: (가장 짧은 실행 시간(초), 결과 텍스트).
+    """
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(lines)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="텍스트 정제 성능을 기존 방식과 비교합니다.")
+    parser.add_argument('--lines', type=int, default=50000, help="문단 수")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수")
+    args = parser.parse_args()
+
+    lines = sample_lines(args.lines)
+    chars = sum(len(line) for line in lines)
+
+    # 정규식 생성 시간은 한 번만 들기 때문에 따로 측정
+    start = time.perf_counter()
+    removal_pattern(True, True, True)
+    print(f"정규식 생성: {time.perf_counter() - start:.3f}초 (프로세스당 한 번)")
+
+    legacy_time, legacy_text = best_time(legacy_normalize_lines, lines, args.repeat)
+    new_time, new_text = best_time(DEFAULT_NORMALIZER.normalize_lines, lines, args.repeat)
+
+    if legacy_text != new_text:
+        raise SystemExit("결과가 기존 방식과 다릅니다.")
+    print(f"문단 {len(lines)}개, {chars}자 (결과 일치)")
+    print(f"기존 방식: {legacy_time:.3f}초 ({chars / legacy_time / 1e6:.1f}M자/초)")
+    print(f"TextNormalizer: {new_time:.3f}초 ({chars / new_time / 1e6:.1f}M자/초)")
+    print(f"속도 향상: {legacy_time / new_time:.1f}배")
@@ -0,0 +1,281 @@
+import io
+import zlib
+import struct
+import random
+import zipfile
+
+# OLE(Compound File) 구조 상수
+SECTOR_SIZE = 512
+ENDOFCHAIN = 0xFFFFFFFE
+FREESECT = 0xFFFFFFFF
+FATSECT = 0xFFFFFFFD
+NOSTREAM = 0xFFFFFFFF
+MINI_STREAM_CUTOFF = 4096  # 이보다 작은 스트림은 미니 스트림에 저장되므로 모든 스트림을 이 크기 이상으로 채움
+HEADER_DIFAT_COUNT = 109  # 헤더에 들어가는 FAT 섹터 수 (약 7MB 파일까지 지원)
+
+# HWP 레코드 태그
+HWPTAG_PARA_HEADER = 66
+HWPTAG_PARA_TEXT = 67
+HWPTAG_PARA_CHAR_SHAPE = 68
+
+# HWPX 네임스페이스
+HWPX_PARAGRAPH_NS = 'http://www.hancom.co.kr/hwpml/2011/paragraph'
+HWPX_SECTION_NS = 'http://www.hancom.co.kr/hwpml/2011/section'
+
+# 문서에 사용할 단어 (한자는 정제 단계에서 제거되는 문자)
+KOREAN_WORDS = ['과업', '지시서', '시스템', '구축', '데이터', '클라우드', '人工', '보안', 'AI', '운영', '유지관리', '인공지능']
+ENGLISH_WORDS = ['task', 'system', 'cloud', 'data', 'security', 'AI', 'operation', 'build']
+
+# OLE 디렉토리 항목 생성 함수
+def _directory_entry(name, entry_type, right=NOSTREAM, child=NOSTREAM, start=0, size=0):
+    """
+    128바이트 OLE 디렉토리 항목을 만듭니다.
+
+    Args:
+        name (str): 항목 이름.
+        entry_type (int): 0=빈 항목, 1=저장소, 2=스트림, 5=루트.
+        right (int): 오른쪽 형제 항목 번호.
+        child (int): 첫 번째 자식 항목 번호.
+        start (int): 시작 섹터 번호.
+        size (int): 스트림 크기.
+
+    Returns:
+        bytes: 디렉토리 항목.
+    """
+    encoded = (name + '\0').encode('utf-16-le') if name else b''
+    entry = encoded.ljust(64, b'\0')
+    entry += struct.pack('<HBB', len(encoded), entry_type, 1)
+    entry += struct.pack('<III', NOSTREAM, right, child)
+    entry += b'\0' * 36
+    entry += struct.pack('<IQ', start, size)
+    return entry
+
+# OLE 파일 생성 함수
+def write_ole(streams):
+    """
+    스트림 목록으로 OLE(Compound File) 파일을 만듭니다.
+
+    형제 항목은 오른쪽 링크로만 연결하며, 저장소는 한 단계('BodyText/Section0')까지 지원합니다.
+
+    Args:
+        streams (dict): 스트림 경로 -> 내용(bytes).
+
+    Returns:
+        bytes: OLE 파일 내용.
+    """
+    tree = {}
+    for path, data in streams.items():
+        parts = path.split('/')
+        if len(parts) == 1:
+            tree[parts[0]] = data
+        else:
+            tree.setdefault(parts[0], {})[parts[1]] = data
+
+    sectors = []
+    chains = []  # (시작 섹터, 섹터 수)
+    entries = [None]  # 0번은 루트 항목
+
+    def allocate(data):
+        data = data.ljust(MINI_STREAM_CUTOFF, b'\0')
+        start = len(sectors)
+        count = (len(data) + SECTOR_SIZE - 1) // SECTOR_SIZE
+        for i in range(count):
+            sectors.append(data[i * SECTOR_SIZE:(i + 1) * SECTOR_SIZE].ljust(SECTOR_SIZE, b'\0'))
+        chains.append((start, count))
+        return start, len(data)
+
+    def add_children(children):
+        ids = []
+        for name, value in children.items():
+            index = len(entries)
+            entries.append(None)
+            if isinstance(value, dict):
+                child_ids = add_children(value)
+                entries[index] = {'name': name, 'type': 1, 'child': child_ids[0] if child_ids else NOSTREAM}
+            else:
+                start, size = allocate(value)
+                entries[index] = {'name': name, 'type': 2, 'start': start, 'size': size}
+            ids.append(index)
+        # 형제 항목을 오른쪽 링크로 연결
+        for left, right in zip(ids, ids[1:]):
+            entries[left]['right'] = right
+        return ids
+
+    top_ids = add_children(tree)
+    directory = _directory_entry('Root Entry', 5, child=top_ids[0], start=ENDOFCHAIN)
+    for entry in entries[1:]:
+        directory += _directory_entry(
+            entry['name'], entry['type'], right=entry.get('right', NOSTREAM),
+            child=entry.get('child', NOSTREAM), start=entry.get('start', 0), size=entry.get('size', 0),
+        )
+    while len(directory) % SECTOR_SIZE:
+        directory += _directory_entry('', 0)
+    directory_start = len(sectors)
+    directory_count = len(directory) // SECTOR_SIZE
+    for i in range(directory_count):
+        sectors.append(directory[i * SECTOR_SIZE:(i + 1) * SECTOR_SIZE])
+    chains.append((directory_start, directory_count))
+
+    # FAT 섹터 수 계산 (FAT 섹터 자신도 FAT에 기록됨)
+    entries_per_sector = SECTOR_SIZE // 4
+    fat_count = 1
+    while len(sectors) + fat_count > fat_count * entries_per_sector:
+        fat_count += 1
+    if fat_count > HEADER_DIFAT_COUNT:
+        raise ValueError("합성 OLE 파일이 너무 큽니다. 문단 수를 줄이세요.")
+    fat = [FREESECT] * (fat_count * entries_per_sector)
+    for start, count in chains:
+        for i in range(count):
+            fat[start + i] = start + i + 1 if i < count - 1 else ENDOFCHAIN
+    fat_start = len(sectors)
+    for i in range(fat_count):
+        fat[fat_start + i] = FATSECT
+
+    header = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1' + b'\0' * 16
+    header += struct.pack('<HHHHH', 0x3E, 3, 0xFFFE, 9, 6) + b'\0' * 6
+    header += struct.pack(
+        '<IIIIIIIII', 0, fat_count, directory_start, 0, MINI_STREAM_CUTOFF, ENDOFCHAIN, 0, ENDOFCHAIN, 0
+    )
+    difat = [fat_start + i for i in range(fat_count)] + [FREESECT] * (HEADER_DIFAT_COUNT - fat_count)
+    header += struct.pack('<%dI' % HEADER_DIFAT_COUNT, *difat)
+
+    out = io.BytesIO()
+    out.write(header)
+    for sector in sectors:
+        out.write(sector)
+    out.write(struct.pack('<%dI' % len(fat), *fat))
+    return out.getvalue()
+
+# HWP 레코드 생성 함수
+def hwp_record(tag, payload, level=0):
+    """
+    HWP 레코드(헤더 + 내용)를 만듭니다. 4095바이트 이상이면 확장 길이 필드를 사용합니다.
+
+    Args:
+        tag (int): 레코드 태그 ID.
+        payload (bytes): 레코드 내용.
+        level (int): 레코드 레벨.
+
+    Returns:
+        bytes: 레코드.
+    """
+    size = len(payload)
+    if size >= 0xFFF:
+        return struct.pack('<II', tag | (level << 10) | (0xFFF << 20), size) + payload
+    return struct.pack('<I', tag | (level << 10) | (size << 20)) + payload
+
+# 합성 HWP 파일 생성 함수
+def make_hwp(paragraphs_per_section, sections=3, compressed=True, seed=0):
+    """
+    문단 헤더/텍스트/글자 모양 레코드로 이루어진 HWP 5.0 파일을 만듭니다.
+
+    Args:
+        paragraphs_per_section (int): 섹션별 문단 수.
+        sections (int): 본문 섹션 수.
+        compressed (bool): BodyText 섹션 압축 여부.
+        seed (int): 난수 시드.
+
+    Returns:
+        bytes: HWP 파일 내용.
+    """
+    rng = random.Random(seed)
+    file_header = b'HWP Document File'.ljust(32, b'\0')
+    file_header += struct.pack('<II', 0x05000000, 1 if compressed else 0)
+    streams = {
+        'FileHeader': file_header.ljust(256, b'\0'),
+        '\x05HwpSummaryInformation': b'\0' * 64,
+    }
+    for section in range(sections):
+        body = io.BytesIO()
+        for _ in range(paragraphs_per_section):
+            text = ' '.join(rng.choice(KOREAN_WORDS) for _ in range(rng.randint(5, 40))) + '\r'
+            body.write(hwp_record(HWPTAG_PARA_HEADER, b'\0' * 22))
+            body.write(hwp_record(HWPTAG_PARA_TEXT, text.encode('utf-16-le'), level=1))
+            body.write(hwp_record(HWPTAG_PARA_CHAR_SHAPE, b'\0' * 12, level=1))
+        data = body.getvalue()
+        if compressed:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+            data = compressor.compress(data) + compressor.flush()
+        streams[f'BodyText/Section{section}'] = data
+    return write_ole(streams)
+
+# 합성 HWPX 파일 생성 함수
+def make_hwpx(paragraphs_per_section, sections=2, seed=0):
+    """
+    문단, 표, 쪽 나눔이 섞인 섹션 XML을 ZIP으로 묶은 HWPX 파일을 만듭니다.
+
+    Args:
+        paragraphs_per_section (int): 섹션별 문단 수.
+        sections (int): 섹션 수.
+        seed (int): 난수 시드.
+
+    Returns:
+        bytes: HWPX 파일 내용.
+    """
+    rng = random.Random(seed)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('mimetype', 'application/hwp+zip')
+        for section in range(sections):
+            parts = ['<?xml version="1.0" encoding="UTF-8"?>'
+                     f'<hs:sec xmlns:hs="{HWPX_SECTION_NS}" xmlns:hp="{HWPX_PARAGRAPH_NS}">']
+            for p in range(paragraphs_per_section):
+                text = ' '.join(rng.choice(KOREAN_WORDS) for _ in range(rng.randint(3, 20)))
+                page_break = '1' if p and p % 25 == 0 else '0'
+                parts.append(f'<hp:p pageBreak="{page_break}"><hp:run><hp:t>{text}</hp:t></hp:run>')
+                if p % 10 == 0:
+                    # 10문단마다 2칸짜리 표 추가
+                    cells = ''.join(
+                        f'<hp:tc><hp:subList><hp:p><hp:run><hp:t>{cell}</hp:t></hp:run></hp:p></hp:subList></hp:tc>'
+                        for cell in (f'셀{p}', rng.choice(KOREAN_WORDS))
+                    )
+                    parts.append(f'<hp:run><hp:tbl><hp:tr>{cells}</hp:tr></hp:tbl></hp:run>')
+                parts.append('</hp:p>')
+            parts.append('</hs:sec>')
+            zf.writestr(f'Contents/section{section}.xml', ''.join(parts))
+    return buffer.getvalue()
+
+# 합성 PDF 파일 생성 함수
+def make_pdf(pages, lines_per_page=40, seed=0):
+    """
+    Helvetica 글꼴로 영문 텍스트를 쓴 PDF 파일을 만듭니다.
+
+    Args:
+        pages (int): 페이지 수.
+        lines_per_page (int): 페이지별 줄 수.
+        seed (int): 난수 시드.
+
+    Returns:
+        bytes: PDF 파일 내용.
+    """
+    rng = random.Random(seed)
+    kids = ' '.join(f'{4 + 2 * i} 0 R' for i in range(pages))
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        f'<< /Type /Pages /Kids [{kids}] /Count {pages} >>'.encode(),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for i in range(pages):
+        lines = []
+        for line in range(lines_per_page):
+            text = ' '.join(rng.choice(ENGLISH_WORDS) for _ in range(rng.randint(3, 12)))
+            lines.append(f'BT /F1 10 Tf 40 {800 - line * 18} Td ({text}) Tj ET')
+        content = '\n'.join(lines).encode()
+        objects.append((
+            '<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+            f'/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>'
+        ).encode())
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) + content + b'\nendstream')
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n' % number + body + b'\nendobj\n')
+    xref = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b'%010d 00000 n \n' % offset)
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref))
+    return out.getvalue()
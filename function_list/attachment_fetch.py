@@ -0,0 +1,107 @@
+import os
+
+# 입찰공고 API 항목에 포함된 공고규격서 첨부파일 수 (ntceSpecDocUrl1 ~ ntceSpecDocUrl10)
+SPEC_DOC_COUNT = 10
+
+# 공고 첨부파일 목록 추출 함수
+def notice_attachments(item):
+    """
+    입찰공고 API 항목에서 첨부파일 이름과 다운로드 주소를 추출합니다.
+
+    Args:
+        item (dict): 입찰공고 API의 공고 항목.
+
+    Returns:
+        attachments(List[dict]): {'name': 파일 이름, 'url': 다운로드 주소} 리스트.
+    """
+    attachments = []
+    for n in range(1, SPEC_DOC_COUNT + 1):
+        url = item.get(f'ntceSpecDocUrl{n}')
+        name = item.get(f'ntceSpecFileNm{n}')
+        if url and name:
+            attachments.append({'name': name, 'url': url})
+    return attachments
+
+# 첨부파일 다운로드 함수
+def download_attachment(session, url, file_path, store=None, chunk_size=64 * 1024, timeout=30):
+    """
+    첨부파일을 메모리에 모으지 않고 디스크로 바로 스트리밍하여 저장합니다.
+
+    받는 동안에는 `.part` 파일에 쓰고, 다 받은 뒤에 최종 이름으로 바꿉니다.
+    store에 같은 주소로 받은 파일이 있으면 본문 요청 전에 확인합니다.
+    기록된 ETag가 있으면 If-None-Match 조건부 요청을 보내 304 응답이면 저장소의 파일을 연결하고,
+    ETag가 없으면 HEAD 요청의 크기(Content-Length)로 확인합니다.
+    저장소는 주소 단위로 확인하므로, 다른 주소의 같은 파일은 다시 내려받습니다. (저장은 해시로 한 번만 됨)
+
+    Args:
+        session (requests.Session): 요청에 사용할 HTTP 세션.
+        url (str): 첨부파일 다운로드 주소.
+        file_path (str): 저장할 파일 경로.
+        store (AttachmentStore): 첨부파일 저장소. 선택 사항.
+        chunk_size (int): 한 번에 읽어 쓸 바이트 수.
+        timeout (float): 요청 제한 시간 (초).
+
+    Returns:
+        str: 저장된 파일 경로.
+    """
+    part_path = file_path + '.part'
+    headers = {}
+    validator = store.validator(url) if store is not None else None
+    if validator is not None:
+        stored_etag, _ = validator
+        if stored_etag:
+            headers['If-None-Match'] = stored_etag
+        else:
+            # ETag가 없으면 본문 없는 HEAD 요청으로 크기를 확인
+            with session.head(url, timeout=timeout, allow_redirects=True) as head:
+                if head.ok:
+                    cached_path = store.lookup(url, head.headers.get('ETag'), head.headers.get('Content-Length'))
+                    if cached_path is not None:
+                        return store.link(cached_path, file_path)
+
+    response = session.get(url, headers=headers, stream=True, timeout=timeout)
+    if response.status_code == 304:
+        # 본문이 없는 응답이므로 연결은 재사용됨
+        response.close()
+        cached_path = store.lookup(url, headers['If-None-Match'])
+        if cached_path is not None:
+            return store.link(cached_path, file_path)
+        # 확인 사이에 저장소에서 삭제된 경우 다시 받음
+        response = session.get(url, stream=True, timeout=timeout)
+    with response:
+        response.raise_for_status()
+        etag = response.headers.get('ETag')
+        with open(part_path, 'wb') as file:
+            for chunk in response.iter_content(chunk_size):
+                file.write(chunk)
+    if store is not None:
+        return store.link(store.put(part_path, url, etag), file_path)
+    os.replace(part_path, file_path)
+    return file_path
+
+# 공고 첨부파일 일괄 다운로드 함수
+def fetch_attachments(session, attachments, download_folder_path, store=None):
+    """
+    공고의 첨부파일을 모두 다운로드 폴더에 저장합니다.
+
+    Args:
+        session (requests.Session): 요청에 사용할 HTTP 세션.
+        attachments (List[dict]): notice_attachments()가 반환한 첨부파일 목록.
+        download_folder_path (str): 저장할 다운로드 폴더 경로.
+        store (AttachmentStore): 첨부파일 저장소. 선택 사항.
+
+    Returns:
+        file_paths(List[str]): 저장된 파일 경로 리스트.
+    """
+    file_paths = []
+    for attachment in attachments:
+        # 경로 구분자를 제거하여 다운로드 폴더 밖으로 저장되지 않도록 함
+        file_name = os.path.basename(attachment['name'].replace('\\', '/'))
+        file_path = os.path.join(download_folder_path, file_name)
+        base, ext = os.path.splitext(file_path)
+        n = 1
+        while file_path in file_paths:  # 같은 이름의 첨부파일 구분
+            file_path = f'{base}({n}){ext}'
+            n += 1
+        file_paths.append(download_attachment(session, attachment['url'], file_path, store))
+    return file_paths
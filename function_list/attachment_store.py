@@ -0,0 +1,204 @@
+import os
+import time
+import shutil
+import sqlite3
+import hashlib
+import threading
+
+
+class AttachmentStore:
+    """
+    첨부파일을 내용 해시(SHA-256)로 저장하는 로컬 저장소 클래스.
+
+    같은 내용의 파일은 한 번만 저장되고, 다운로드 주소별로 ETag와 크기를 기록해 두어
+    같은 주소를 다시 받기 전에 저장소에 있는지 확인할 수 있습니다.
+    다른 주소의 같은 파일은 내려받은 뒤 해시로 합쳐지므로 디스크만 절약되고 다운로드는 줄지 않습니다.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제합니다(LRU).
+    """
+
+    def __init__(self, root: str, max_bytes: int = 2 * 1024 ** 3) -> None:
+        """
+        AttachmentStore 초기화 메서드.
+
+        Args:
+            root (str): 저장소 디렉토리 경로.
+            max_bytes (int): 저장소의 최대 크기 (바이트).
+        """
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.objects_dir = os.path.join(self.root, 'objects')
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+        self._lock = threading.Lock()  # 여러 작업자 스레드가 함께 사용
+        self._db = sqlite3.connect(os.path.join(self.root, 'index.sqlite'), check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS objects ('
+                'sha256 TEXT PRIMARY KEY, size INTEGER, last_access REAL)'
+            )
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS urls ('
+                'url TEXT PRIMARY KEY, sha256 TEXT, etag TEXT, size INTEGER)'
+            )
+
+    def _object_path(self, sha256: str) -> str:
+        """해시에 해당하는 저장 파일 경로를 반환합니다."""
+        return os.path.join(self.objects_dir, sha256[:2], sha256)
+
+    @staticmethod
+    def file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+        """
+        파일의 SHA-256 해시를 계산합니다.
+
+        Args:
+            file_path (str): 파일 경로.
+            chunk_size (int): 한 번에 읽을 바이트 수.
+
+        Returns:
+            str: 16진수 해시 문자열.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def validator(self, url: str):
+        """
+        다운로드 주소로 저장된 파일의 ETag와 크기를 확인합니다. (다시 받기 전 조건부 요청에 사용)
+
+        Args:
+            url (str): 첨부파일 다운로드 주소.
+
+        Returns:
+            tuple 또는 None: (ETag, 크기). 기록이 없거나 저장된 파일이 없으면 None. ETag가 없으면 ETag는 None.
+        """
+        with self._lock:
+            row = self._db.execute('SELECT sha256, etag, size FROM urls WHERE url = ?', (url,)).fetchone()
+        if row is None or not os.path.exists(self._object_path(row[0])):
+            return None
+        return row[1], row[2]
+
+    def lookup(self, url: str, etag: str = None, size: int = None) -> str:
+        """
+        다운로드 주소로 저장된 파일을 찾습니다.
+
+        서버가 ETag나 크기를 알려준 경우, 기록된 값과 다르면 내용이 바뀐 것으로 보고 찾지 않습니다.
+
+        Args:
+            url (str): 첨부파일 다운로드 주소.
+            etag (str): 응답의 ETag 헤더 값. 선택 사항.
+            size (int): 응답의 Content-Length 값. 선택 사항.
+
+        Returns:
+            str 또는 None: 저장된 파일 경로. 없으면 None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT sha256, etag, size FROM urls WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            sha256, stored_etag, stored_size = row
+            if etag is not None and stored_etag is not None and etag != stored_etag:
+                return None
+            if size is not None and stored_size is not None and int(size) != stored_size:
+                return None
+            object_path = self._object_path(sha256)
+            if not os.path.exists(object_path):
+                return None
+            with self._db:
+                self._db.execute(
+                    'UPDATE objects SET last_access = ? WHERE sha256 = ?', (time.time(), sha256)
+                )
+            return object_path
+
+    def put(self, file_path: str, url: str = None, etag: str = None) -> str:
+        """
+        파일을 저장소로 옮기고 다운로드 주소를 기록합니다.
+
+        같은 내용의 파일이 이미 있으면 새 파일은 삭제하고 기존 파일을 사용합니다.
+
+        Args:
+            file_path (str): 저장할 파일 경로. 저장소로 이동됩니다.
+            url (str): 첨부파일 다운로드 주소. 선택 사항.
+            etag (str): 응답의 ETag 헤더 값. 선택 사항.
+
+        Returns:
+            str: 저장소 안의 파일 경로.
+        """
+        sha256 = self.file_hash(file_path)
+        size = os.path.getsize(file_path)
+        object_path = self._object_path(sha256)
+        with self._lock:
+            if os.path.exists(object_path):
+                os.remove(file_path)
+            else:
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                os.replace(file_path, object_path)
+            with self._db:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO objects (sha256, size, last_access) VALUES (?, ?, ?)',
+                    (sha256, size, time.time()),
+                )
+                if url is not None:
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO urls (url, sha256, etag, size) VALUES (?, ?, ?, ?)',
+                        (url, sha256, etag, size),
+                    )
+            self._evict(keep=sha256)
+        return object_path
+
+    def link(self, object_path: str, dest_path: str) -> str:
+        """
+        저장된 파일을 다운로드 폴더에 연결합니다. 하드 링크를 만들 수 없으면 복사합니다.
+
+        Args:
+            object_path (str): 저장소 안의 파일 경로.
+            dest_path (str): 연결할 경로.
+
+        Returns:
+            str: 연결된 파일 경로.
+        """
+        if os.path.exists(dest_path):
+            os.remove(dest_path)
+        try:
+            os.link(object_path, dest_path)
+        except OSError:
+            shutil.copyfile(object_path, dest_path)
+        return dest_path
+
+    def _evict(self, keep: str = None) -> None:
+        """
+        저장소 크기가 max_bytes를 넘으면 오래 사용하지 않은 파일부터 삭제합니다.
+
+        Args:
+            keep (str): 삭제하지 않을 해시 (방금 저장한 파일).
+        """
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM objects').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._db.execute('SELECT sha256, size FROM objects ORDER BY last_access').fetchall()
+        with self._db:
+            for sha256, size in rows:
+                if total <= self.max_bytes:
+                    break
+                if sha256 == keep:
+                    continue
+                try:
+                    os.remove(self._object_path(sha256))
+                except FileNotFoundError:
+                    pass
+                self._db.execute('DELETE FROM objects WHERE sha256 = ?', (sha256,))
+                self._db.execute('DELETE FROM urls WHERE sha256 = ?', (sha256,))
+                total -= size
+
+    def close(self) -> None:
+        """색인 데이터베이스 연결을 닫습니다."""
+        self._db.close()
+
+    def __enter__(self) -> "AttachmentStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
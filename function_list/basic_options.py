@@ -1,18 +1,22 @@
 from selenium.webdriver.firefox.options import Options
 import os
+import time
+import shutil
+import threading
 from pymongo import MongoClient
 from selenium import webdriver
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from webdriver_manager.firefox import GeckoDriverManager  # GeckoDriverManager 사용
 
 # 다운로드 폴더 설정 함수
-def download_path_setting(folder_path, firefox_options):
+def download_path_setting(folder_path, firefox_options, folder_name='notice_list'):
     """
     다운로드 폴더 경로를 설정하고 Firefox 옵션에 적용합니다.
 
     Args:
         folder_path (str): 다운로드 폴더의 기본 디렉토리 경로.
         firefox_options (Options): Firefox 브라우저 옵션 객체. 다운로드 관련 설정이 추가됩니다.
+        folder_name (str): 다운로드 폴더 이름. 브라우저마다 다른 이름을 주면 폴더가 분리됩니다.
 
     Returns:
         tuple:
@@ -20,7 +24,7 @@ def download_path_setting(folder_path, firefox_options):
             - download_folder_path (str): 생성된 다운로드 폴더의 절대 경로.
     """
     # 다운로드 폴더 경로 생성
-    download_folder_path = os.path.abspath(folder_path + '/notice_list')
+    download_folder_path = os.path.abspath(folder_path + '/' + folder_name)
     if not os.path.exists(download_folder_path):
         os.makedirs(download_folder_path)  # 폴더가 없으면 생성
 
@@ -63,6 +67,45 @@ def selenium_setting():
 
     return firefox_options  # 설정된 Firefox 옵션 반환
 
+# GeckoDriver 경로를 고정해 두는 파일
+DRIVER_PIN_PATH = os.path.expanduser("~/.wdm/geckodriver_path")
+_driver_path = None
+_driver_lock = threading.Lock()
+
+# GeckoDriver 경로 확인 함수
+def resolve_driver_path():
+    """
+    GeckoDriver 실행 파일 경로를 찾습니다.
+
+    환경 변수(GECKODRIVER_PATH), 고정 파일, PATH 순서로 찾고, 없을 때만
+    GeckoDriverManager로 한 번 설치한 뒤 경로를 고정 파일에 기록합니다.
+    한 번 찾은 경로는 프로세스 안에서 재사용합니다.
+
+    Returns:
+        driver_path(str): GeckoDriver 실행 파일 경로.
+    """
+    global _driver_path
+    with _driver_lock:
+        if _driver_path and os.path.exists(_driver_path):
+            return _driver_path
+
+        pinned_path = None
+        if os.path.exists(DRIVER_PIN_PATH):
+            with open(DRIVER_PIN_PATH, 'r', encoding='utf-8') as file:
+                pinned_path = file.read().strip()
+
+        for candidate in (os.environ.get("GECKODRIVER_PATH"), pinned_path, shutil.which("geckodriver")):
+            if candidate and os.path.exists(candidate):
+                _driver_path = candidate
+                return _driver_path
+
+        # 로컬에 없을 때만 네트워크로 설치하고 경로 고정
+        _driver_path = GeckoDriverManager().install()
+        os.makedirs(os.path.dirname(DRIVER_PIN_PATH), exist_ok=True)
+        with open(DRIVER_PIN_PATH, 'w', encoding='utf-8') as file:
+            file.write(_driver_path)
+        return _driver_path
+
 # WebDriver 초기화 함수
 def init_browser(firefox_options):
     """
@@ -74,20 +117,125 @@ def init_browser(firefox_options):
     Returns:
         browser(WebDriver): 초기화된 Firefox WebDriver 객체.
     """
-    # GeckoDriverManager를 사용하여 GeckoDriver 설치 및 캐시 정리
-    cache_path = os.path.expanduser("~/.wdm")  # WebDriver Manager 캐시 경로
-    if os.path.exists(cache_path):
-        os.system(f"rm -rf {cache_path}")  # 기존 캐시 삭제
+    start_time = time.time()
 
-    # GeckoDriver 설치 및 WebDriver 서비스 생성
-    webdriver_manager_directory = GeckoDriverManager().install()
-    service = FirefoxService(webdriver_manager_directory)
+    # 고정된 GeckoDriver로 WebDriver 서비스 생성
+    service = FirefoxService(resolve_driver_path())
 
     # Firefox WebDriver 초기화
     browser = webdriver.Firefox(service=service, options=firefox_options)
 
+    print(f"브라우저 시작 시간: {time.time() - start_time:.2f}초")
     return browser  # 초기화된 WebDriver 반환
 
+# 프로세스 메모리 사용량 확인 함수
+def process_tree_memory_mb(pid):
+    """
+    프로세스와 모든 하위 프로세스의 메모리(RSS) 사용량 합계를 계산합니다. (Linux 전용)
+
+    Args:
+        pid (int): 최상위 프로세스 ID.
+
+    Returns:
+        float 또는 None: 메모리 사용량 (MB). 확인할 수 없으면 None.
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as file:
+                # 프로세스 이름에 공백이 있을 수 있으므로 마지막 ')' 이후를 사용
+                ppid = int(file.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    page_size = os.sysconf('SC_PAGE_SIZE')
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        try:
+            with open(f'/proc/{current}/statm', 'r') as file:
+                total += int(file.read().split()[1]) * page_size
+        except (OSError, IndexError, ValueError):
+            continue
+        stack.extend(children.get(current, []))
+    return total / 1024 ** 2
+
+class BrowserSession:
+    """
+    하나의 브라우저를 여러 공고에 재사용하고, 일정 조건에서만 새로 시작하는 클래스.
+
+    처리한 공고 수가 max_notices에 도달하거나 브라우저 프로세스의 메모리 사용량이
+    max_memory_mb를 넘으면 브라우저를 종료하고, 다음 get() 호출 때 다시 시작합니다.
+    """
+
+    def __init__(self, firefox_options, max_notices=200, max_memory_mb=1500):
+        """
+        BrowserSession 초기화 메서드. 브라우저는 처음 get()을 호출할 때 시작합니다.
+
+        Args:
+            firefox_options (Options): 설정된 Firefox 브라우저 옵션 객체.
+            max_notices (int): 브라우저 하나로 처리할 최대 공고 수.
+            max_memory_mb (float): 브라우저 프로세스의 최대 메모리 사용량 (MB).
+        """
+        self.firefox_options = firefox_options
+        self.max_notices = max_notices
+        self.max_memory_mb = max_memory_mb
+        self.browser = None
+        self.notice_count = 0
+
+    def get(self):
+        """
+        사용 중인 브라우저를 반환합니다. 없으면 새로 시작합니다.
+
+        Returns:
+            browser(WebDriver): Firefox WebDriver 객체.
+        """
+        if self.browser is None:
+            self.browser = init_browser(self.firefox_options)
+            self.notice_count = 0
+        return self.browser
+
+    def memory_mb(self):
+        """
+        브라우저 프로세스(하위 프로세스 포함)의 메모리 사용량을 반환합니다.
+
+        Returns:
+            float 또는 None: 메모리 사용량 (MB). 확인할 수 없으면 None.
+        """
+        if self.browser is None:
+            return None
+        pid = self.browser.capabilities.get('moz:processID')
+        if pid is None:
+            return None
+        return process_tree_memory_mb(pid)
+
+    def notice_done(self):
+        """공고 하나를 처리한 뒤 호출합니다. 재시작 조건을 만족하면 브라우저를 종료합니다."""
+        if self.browser is None:
+            return
+        self.notice_count += 1
+        if self.notice_count >= self.max_notices:
+            print(f"공고 {self.notice_count}건 처리 후 브라우저 재시작")
+            self.quit()
+            return
+        memory = self.memory_mb()
+        if memory is not None and memory > self.max_memory_mb:
+            print(f"브라우저 메모리 {memory:.0f}MB 초과로 재시작")
+            self.quit()
+
+    def quit(self):
+        """브라우저를 종료합니다."""
+        if self.browser is not None:
+            try:
+                self.browser.quit()
+            finally:
+                self.browser = None
+
 # MongoDB 설정 함수
 def mongo_setting(database_name, collection_name):
     """
@@ -0,0 +1,194 @@
+import os
+import sys
+import time
+import ctypes
+import ctypes.util
+import select
+import threading
+
+# inotify 이벤트 마스크 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# Firefox가 다운로드 중에 사용하는 임시 파일 확장자
+PARTIAL_SUFFIX = '.part'
+
+
+def _load_inotify():
+    """
+    libc의 inotify 함수를 불러옵니다.
+
+    Returns:
+        ctypes.CDLL 또는 None: inotify를 사용할 수 있으면 libc 객체, 아니면 None.
+    """
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class DownloadWatcher:
+    """
+    다운로드 폴더를 감시하여 파일 다운로드가 끝나는 시점을 알려주는 클래스.
+
+    Linux에서는 inotify 이벤트가 올 때만 폴더를 다시 확인하고,
+    inotify를 쓸 수 없는 환경에서는 일정 간격으로 폴더를 확인합니다.
+    `.part` 임시 파일이 없는 일반 파일을 다운로드가 끝난 파일로 봅니다.
+    """
+
+    def __init__(self, download_dir: str, poll_interval: float = 0.5) -> None:
+        """
+        DownloadWatcher 초기화 메서드. 생성과 동시에 감시를 시작합니다.
+
+        Args:
+            download_dir (str): 감시할 다운로드 폴더 경로.
+            poll_interval (float): inotify를 쓸 수 없을 때의 확인 간격 (초).
+        """
+        self.download_dir = download_dir
+        self.poll_interval = poll_interval
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._version = 0  # 폴더 상태가 바뀔 때마다 증가
+        self._completed, self._pending = self._scan()
+
+        libc = _load_inotify()
+        self._inotify_fd = -1
+        if libc is not None:
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd >= 0 and libc.inotify_add_watch(fd, os.fsencode(download_dir), WATCH_MASK) >= 0:
+                self._inotify_fd = fd
+            elif fd >= 0:
+                os.close(fd)
+
+        if self._inotify_fd >= 0:
+            self._wake_r, self._wake_w = os.pipe()  # close()에서 select를 깨우기 위한 파이프
+            target = self._inotify_loop
+        else:
+            target = self._polling_loop
+        self._thread = threading.Thread(target=target, daemon=True)
+        self._thread.start()
+
+    @property
+    def uses_inotify(self) -> bool:
+        """inotify 이벤트로 감시 중이면 True, 폴링 방식이면 False."""
+        return self._inotify_fd >= 0
+
+    def _scan(self) -> tuple:
+        """
+        다운로드 폴더의 현재 상태를 확인합니다.
+
+        Returns:
+            tuple: (다운로드가 끝난 파일 이름 집합, 다운로드 중인 `.part` 파일 이름 집합).
+        """
+        try:
+            names = set(os.listdir(self.download_dir))
+        except FileNotFoundError:
+            names = set()
+        pending = {name for name in names if name.endswith(PARTIAL_SUFFIX)}
+        completed = {
+            name for name in names
+            if name not in pending and name + PARTIAL_SUFFIX not in pending
+        }
+        return frozenset(completed), frozenset(pending)
+
+    def _refresh(self) -> None:
+        """폴더 상태를 다시 확인하고, 바뀌었으면 대기 중인 호출자를 깨웁니다."""
+        completed, pending = self._scan()
+        with self._condition:
+            if completed != self._completed or pending != self._pending:
+                self._completed, self._pending = completed, pending
+                self._version += 1
+                self._condition.notify_all()
+
+    def _inotify_loop(self) -> None:
+        """inotify 이벤트가 올 때마다 폴더 상태를 갱신합니다."""
+        while not self._stop.is_set():
+            readable, _, _ = select.select([self._inotify_fd, self._wake_r], [], [])
+            if self._inotify_fd in readable:
+                try:
+                    while os.read(self._inotify_fd, 4096):  # 쌓인 이벤트 비우기
+                        pass
+                except BlockingIOError:
+                    pass
+                self._refresh()
+
+    def _polling_loop(self) -> None:
+        """inotify를 쓸 수 없을 때 일정 간격으로 폴더 상태를 갱신합니다."""
+        while not self._stop.wait(self.poll_interval):
+            self._refresh()
+
+    def snapshot(self) -> frozenset:
+        """
+        현재 다운로드가 끝난 파일 목록을 반환합니다. 다운로드 버튼을 누르기 전에 호출합니다.
+
+        Returns:
+            frozenset: 다운로드가 끝난 파일 이름 집합.
+        """
+        with self._condition:
+            return self._completed
+
+    def wait_for_downloads(self, baseline: frozenset, start_timeout: float = 5,
+                           timeout: float = 30, settle: float = 0.3) -> list:
+        """
+        baseline 이후 새로 시작된 다운로드가 모두 끝날 때까지 기다립니다.
+
+        Args:
+            baseline (frozenset): 다운로드를 시작하기 전의 snapshot() 결과.
+            start_timeout (float): 다운로드가 시작되기를 기다릴 최대 시간 (초).
+            timeout (float): 다운로드가 시작된 후 완료를 기다릴 최대 시간 (초).
+            settle (float): 완료 후 이어지는 다운로드가 없는지 확인하는 시간 (초).
+
+        Returns:
+            List[str]: 새로 다운로드된 파일 이름 목록. 다운로드가 시작되지 않았으면 빈 리스트.
+        """
+        with self._condition:
+            # 다운로드 시작(임시 파일 또는 새 파일 생성) 대기
+            deadline = time.monotonic() + start_timeout
+            while not self._pending and not (self._completed - baseline):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._condition.wait(remaining)
+
+            # 임시 파일이 모두 사라질 때까지 대기
+            deadline = time.monotonic() + timeout
+            while True:
+                new_files = self._completed - baseline
+                if not self._pending and new_files:
+                    version = self._version
+                    self._condition.wait(settle)
+                    if self._version == version:  # settle 동안 변화가 없으면 완료
+                        return sorted(new_files)
+                    continue
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return sorted(new_files)
+                self._condition.wait(remaining)
+
+    def close(self) -> None:
+        """감시를 종료하고 사용한 자원을 정리합니다."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        if self._inotify_fd >= 0:
+            os.write(self._wake_w, b'\0')
+            self._thread.join()
+            for fd in (self._inotify_fd, self._wake_r, self._wake_w):
+                os.close(fd)
+        else:
+            self._thread.join()
+
+    def __enter__(self) -> "DownloadWatcher":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
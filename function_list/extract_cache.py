@@ -0,0 +1,157 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from function_list.attachment_store import AttachmentStore
+from function_list.g2b_func import LOADER_VERSIONS
+
+
+class ExtractionCache:
+    """
+    공고 파일의 추출 결과를 SQLite에 저장하는 캐시 클래스.
+
+    (파일 내용 해시, 로더 이름, 로더 버전, 글자 수 제한)을 키로 추출한 텍스트를 저장합니다.
+    로더 버전이 바뀌면 이전 버전으로 추출한 결과는 열 때 삭제되므로 자동으로 다시 추출됩니다.
+    """
+
+    def __init__(self, path: str, loader_versions: dict = None) -> None:
+        """
+        ExtractionCache 초기화 메서드.
+
+        Args:
+            path (str): SQLite 파일 경로.
+            loader_versions (dict): 로더 이름 -> 버전. 기본값은 g2b_func.LOADER_VERSIONS.
+        """
+        self.path = os.path.abspath(path)
+        self.loader_versions = dict(loader_versions or LOADER_VERSIONS)
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()  # 여러 작업자 스레드가 함께 사용
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS extractions ('
+                'sha256 TEXT, loader TEXT, version TEXT, max_chars INTEGER, '
+                'text TEXT, created REAL, PRIMARY KEY (sha256, loader, version, max_chars))'
+            )
+        self.purge()
+
+    @staticmethod
+    def source_hash(source, chunk_size: int = 1024 * 1024) -> str:
+        """
+        파일 내용의 SHA-256 해시를 계산합니다.
+
+        Args:
+            source (str 또는 BinaryIO): 파일 경로 또는 파일 내용을 담은 바이너리 객체.
+            chunk_size (int): 한 번에 읽을 바이트 수.
+
+        Returns:
+            str: 16진수 해시 문자열.
+        """
+        if isinstance(source, str):
+            return AttachmentStore.file_hash(source, chunk_size)
+        if hasattr(source, 'getbuffer'):
+            return hashlib.sha256(source.getbuffer()).hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: source.read(chunk_size), b''):
+            digest.update(chunk)
+        source.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _budget_key(max_chars: int) -> int:
+        """글자 수 제한이 없으면 -1로 저장합니다."""
+        return -1 if max_chars is None else max_chars
+
+    def get(self, sha256: str, loader: str, max_chars: int = None) -> str:
+        """
+        저장된 추출 결과를 찾습니다.
+
+        Args:
+            sha256 (str): 파일 내용 해시.
+            loader (str): 로더 이름 ('hwp', 'hwpx', 'pdf').
+            max_chars (int): 추출할 때 사용한 글자 수 제한.
+
+        Returns:
+            str 또는 None: 추출된 텍스트. 없으면 None.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT text FROM extractions WHERE sha256 = ? AND loader = ? AND version = ? AND max_chars = ?',
+                (sha256, loader, self.loader_versions.get(loader), self._budget_key(max_chars)),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0]
+
+    def put(self, sha256: str, loader: str, max_chars: int, text: str) -> None:
+        """
+        추출 결과를 저장합니다.
+
+        Args:
+            sha256 (str): 파일 내용 해시.
+            loader (str): 로더 이름 ('hwp', 'hwpx', 'pdf').
+            max_chars (int): 추출할 때 사용한 글자 수 제한.
+            text (str): 추출된 텍스트.
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                'INSERT OR REPLACE INTO extractions (sha256, loader, version, max_chars, text, created) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (sha256, loader, self.loader_versions.get(loader), self._budget_key(max_chars), text, time.time()),
+            )
+
+    def purge(self) -> int:
+        """
+        현재 로더 버전과 다른 버전으로 추출한 결과를 삭제합니다.
+
+        Returns:
+            int: 삭제한 결과 수.
+        """
+        with self._lock, self._db:
+            loaders = list(self.loader_versions)
+            cursor = self._db.execute(
+                'DELETE FROM extractions WHERE loader NOT IN (%s)' % ', '.join('?' * len(loaders)),
+                loaders,
+            )
+            deleted = cursor.rowcount
+            for loader, version in self.loader_versions.items():
+                cursor = self._db.execute(
+                    'DELETE FROM extractions WHERE loader = ? AND version != ?', (loader, version)
+                )
+                deleted += cursor.rowcount
+        if deleted:
+            print(f"추출 결과 캐시: 이전 로더 버전 결과 {deleted}개 삭제")
+        return deleted
+
+    @property
+    def hit_rate(self) -> float:
+        """조회한 결과 중 캐시에 있었던 비율."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """
+        캐시 사용 현황을 반환합니다.
+
+        Returns:
+            dict: hits, misses, hit_rate, entries(저장된 결과 수).
+        """
+        with self._lock:
+            entries = self._db.execute('SELECT COUNT(*) FROM extractions').fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': round(self.hit_rate, 3), 'entries': entries}
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        self._db.close()
+
+    def __enter__(self) -> "ExtractionCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
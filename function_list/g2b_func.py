@@ -1,9 +1,43 @@
+import io
 import zipfile
 import shutil
 import os 
-from function_list.hwp_loader import HWPLoader
-from function_list.hwpx_loader import get_hwpx_text
+from importlib import metadata
+from function_list.hwp_loader import HWPLoader,HWP_LOADER_VERSION
+from function_list.hwpx_loader import get_hwpx_text,HWPX_LOADER_VERSION
+from function_list.text_normalize import TEXT_NORMALIZE_VERSION
 from langchain_community.document_loaders import PyPDFLoader
+from langchain_community.document_loaders.blob_loaders import Blob
+from langchain_community.document_loaders.parsers.pdf import PyPDFParser
+from function_list.parse_errors import UnsupportedFileError,ParserFailedError
+
+# 공고 내용으로 사용할 최대 글자 수
+NOTICE_TEXT_LIMIT = 4000
+
+# PDF 추출 방식 버전. 추출 결과가 바뀌는 수정을 하면 올려서 추출 결과 캐시를 무효화합니다.
+PDF_LOADER_VERSION = 1
+
+# 파일 헤더 -> 로더 이름
+FILE_SIGNATURES = [
+    (b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1', 'hwp'),
+    (b'\x50\x4B\x03\x04', 'hwpx'),
+    (b'%PDF', 'pdf'),
+]
+
+# 패키지 버전 확인 함수
+def _package_version(name):
+    """설치된 패키지 버전을 반환합니다. 설치되지 않았으면 'unknown'."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+# 로더별 추출 결과 버전 (정제 규칙과 PDF 라이브러리 버전 포함)
+LOADER_VERSIONS = {
+    'hwp': f'{HWP_LOADER_VERSION}.{TEXT_NORMALIZE_VERSION}',
+    'hwpx': f'{HWPX_LOADER_VERSION}.{TEXT_NORMALIZE_VERSION}',
+    'pdf': f'{PDF_LOADER_VERSION}+pypdf{_package_version("pypdf")}',
+}
 
 # 폴더 내 파일 및 디렉토리 정리 함수
 def folder_clear(download_folder_path):
@@ -24,18 +58,41 @@ def folder_clear(download_folder_path):
         except Exception as e:
             print(f"Failed to delete {file_path}. Reason: {e}")
 
+# ZIP 파일 이름 디코딩 함수
+def decode_zip_name(file_info):
+    """
+    ZIP 항목 이름을 CP949로 디코딩합니다. (한글 Windows에서 압축한 파일 대응)
+
+    Args:
+        file_info (zipfile.ZipInfo): ZIP 항목 정보.
+
+    Returns:
+        str: 디코딩된 항목 이름.
+    """
+    try:
+        return file_info.filename.encode('cp437').decode('cp949')
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        # UTF-8 이름이거나 CP949가 아니면 그대로 사용
+        return file_info.filename
+
 # 공고 파일 확인 및 처리 함수
-def notice_file_check(download_folder_path):
+def notice_file_check(download_folder_path, parse_pool=None, extract_cache=None):
     """
     다운로드 폴더 내 공고 파일을 확인하고, 파일 내용을 반환합니다.
 
+    ZIP 파일은 압축을 풀지 않고 항목 이름만 확인하며,
+    선택된 항목만 메모리로 읽어 파서에 전달합니다.
+
     Args:
         download_folder_path (str): 다운로드 폴더의 경로.
+        parse_pool (ParsePool): 파일 파싱을 맡길 작업 프로세스 풀. 없으면 현재 스레드에서 파싱합니다.
+        extract_cache (ExtractionCache): 추출 결과 캐시. 같은 내용의 파일은 다시 파싱하지 않습니다.
 
     Returns:
         - context(str): 공고 내용.
     """
     context = ''  # 텍스트 컨텍스트 저장
+    candidates = {}  # 파일 이름 -> 파일 경로 또는 (ZIP 경로, 항목 이름)
 
     for file_name in os.listdir(download_folder_path):
         file_path = os.path.join(download_folder_path, file_name)
@@ -44,70 +101,153 @@ def notice_file_check(download_folder_path):
             try:
                 with zipfile.ZipFile(file_path, 'r') as zip_ref:
                     for file_info in zip_ref.infolist():
-                        # 파일 이름을 CP949로 디코딩 후 UTF-8로 재인코딩
-                        try:
-                            decoded_name = file_info.filename.encode('cp437').decode('cp949')
-                        except UnicodeEncodeError:
-                            # cp437 인코딩을 건너뛰고 바로 cp949로 디코딩
-                            decoded_name = file_info.filename                        
-                        file_info.filename = decoded_name  # 파일 이름 수정
-                        # 압축 해제할 경로
-                        extract_path = os.path.join(download_folder_path)
-                        zip_ref.extract(file_info, extract_path)
-                os.remove(file_path)  # ZIP 파일 삭제
+                        if file_info.is_dir():
+                            continue
+                        decoded_name = os.path.basename(decode_zip_name(file_info))
+                        candidates[decoded_name] = (file_path, file_info.filename)
             except:
                 pass
+        else:
+            candidates[file_name] = file_path
 
     # 키워드 파일 선택
-    keyword_file = notice_file_select(download_folder_path)
+    keyword_file = select_keyword_file(candidates)
     if keyword_file != '':
-        file_path = os.path.join(download_folder_path, keyword_file)
-        # 파일 유형 감지 및 텍스트 추출
-        text = detect_file_type(file_path)
-        text = text[:4000]  # 텍스트 길이 제한
+        source = candidates[keyword_file]
+        if isinstance(source, tuple):
+            # 선택된 ZIP 항목만 메모리로 읽음
+            zip_path, member_name = source
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                source = io.BytesIO(zip_ref.read(member_name))
+        # 캐시에 같은 파일의 추출 결과가 있으면 파싱하지 않음
+        loader_name = file_loader_name(source)
+        cache_key = None
+        text = None
+        if extract_cache is not None and loader_name is not None:
+            cache_key = (extract_cache.source_hash(source), loader_name, NOTICE_TEXT_LIMIT)
+            text = extract_cache.get(*cache_key)
+        if text is None:
+            # 파일 유형 감지 및 텍스트 추출
+            try:
+                if parse_pool is not None:
+                    text = parse_pool.parse(source, max_chars=NOTICE_TEXT_LIMIT)
+                else:
+                    text = extract_file_text(source, max_chars=NOTICE_TEXT_LIMIT)
+            except Exception as e:
+                print(f"공고 파일 파싱 실패 ({keyword_file}): {type(e).__name__}: {e}")
+                text = ''
+            else:
+                if cache_key is not None:
+                    extract_cache.put(*cache_key, text)
+        text = text[:NOTICE_TEXT_LIMIT]  # 텍스트 길이 제한
         text_list = text.split('\n')[:-1]
         context = '\n'.join(text_list)
     return context
 
+# 파일 유형 감지 함수
+def file_loader_name(file_path):
+    """
+    파일의 처음 8바이트로 사용할 로더를 결정합니다.
+
+    Args:
+        file_path (str 또는 BinaryIO): 파일 경로 또는 파일 내용을 담은 바이너리 객체.
+
+    Returns:
+        str 또는 None: 'hwp', 'hwpx', 'pdf' 중 하나. 지원하지 않는 파일이면 None.
+    """
+    if isinstance(file_path, str):
+        with open(file_path, 'rb') as f:
+            header = f.read(8)  # 파일의 처음 8바이트 읽기
+    else:
+        header = file_path.read(8)
+        file_path.seek(0)
+    for signature, loader_name in FILE_SIGNATURES:
+        if header.startswith(signature):
+            return loader_name
+    return None
+
+# 파일 텍스트 추출 함수
+def extract_file_text(file_path, max_chars=None, normalizer=None):
+    """
+    파일 헤더로 유형(HWP, HWPX, PDF)을 감지하고 텍스트를 추출합니다.
+
+    max_chars가 주어지면 섹션/페이지 단위로 읽다가 글자 수가 max_chars에 도달하면
+    멈춥니다. 이때 반환값은 전체 추출 결과의 앞부분(max_chars 이상)과 같습니다.
+
+    Args:
+        file_path (str 또는 BinaryIO): 파일 경로 또는 파일 내용을 담은 바이너리 객체.
+        max_chars (int): 추출할 글자 수. None이면 전체를 추출합니다.
+        normalizer (TextNormalizer): 텍스트 정제 객체. HWP/HWPX는 None이면 기본 정제를 사용하고,
+            PDF는 주어진 경우에만 정제합니다.
+
+    Returns:
+        str: 추출된 텍스트.
+
+    Raises:
+        UnsupportedFileError: 지원하지 않는 파일 유형인 경우.
+        ParserFailedError: HWPX 파서가 오류를 반환한 경우.
+        Exception: 그 밖의 파서 예외는 그대로 전달됩니다.
+    """
+    source = file_path if isinstance(file_path, str) else getattr(file_path, 'name', '')
+    loader_name = file_loader_name(file_path)
+
+    # HWP 파일 확인
+    if loader_name == 'hwp':
+        loader = HWPLoader(file_path, max_chars=max_chars, normalizer=normalizer)
+        docs = loader.load()
+        content = docs[0].page_content
+        return content
+
+    # HWPX 파일 확인
+    elif loader_name == 'hwpx':
+        result = get_hwpx_text(file_path, max_chars, normalizer)
+        if isinstance(result, str):  # get_hwpx_text는 오류를 문자열로 반환
+            raise ParserFailedError(result, source, 'HWPXError')
+        content, metadata = result
+        content = '\n\n'.join(content)
+        return content
+
+    # PDF 파일 확인
+    elif loader_name == 'pdf':
+        if isinstance(file_path, str):
+            docs = PyPDFLoader(file_path).lazy_load()
+        else:
+            docs = PyPDFParser().lazy_parse(Blob.from_data(file_path.read()))
+        # 페이지를 하나씩 읽으며 필요한 글자 수가 모이면 중단
+        content_list = []
+        length = -2  # 페이지 구분자(' \n')를 포함한 누적 글자 수
+        for doc in docs:
+            content_list.append(doc.page_content)
+            length += len(doc.page_content) + 2
+            if max_chars is not None and length >= max_chars:
+                break
+        content = ' \n'.join(content_list)
+        if normalizer is not None:
+            content = normalizer.normalize(content)
+        return content
+
+    # 기타 파일
+    raise UnsupportedFileError("지원하지 않는 파일 형식입니다.", source)
+
 # 파일 유형 감지 및 텍스트 추출 함수
-def detect_file_type(file_path):
+def detect_file_type(file_path, max_chars=None, normalizer=None):
     """
     파일 유형을 감지하고, 해당 파일에서 텍스트를 추출합니다.
 
+    extract_file_text()와 같지만 예외 대신 오류 메시지를 문자열로 반환합니다.
+
     Args:
-        file_path (str): 파일 경로.
+        file_path (str 또는 BinaryIO): 파일 경로 또는 파일 내용을 담은 바이너리 객체.
+        max_chars (int): 추출할 글자 수. None이면 전체를 추출합니다.
+        normalizer (TextNormalizer): 텍스트 정제 객체.
 
     Returns:
         str: 추출된 텍스트 또는 오류 메시지.
     """
     try:
-        with open(file_path, 'rb') as f:
-            header = f.read(8)  # 파일의 처음 8바이트 읽기
-
-            # HWP 파일 확인
-            if header.startswith(b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'):
-                loader = HWPLoader(file_path)
-                docs = loader.load()
-                content = docs[0].page_content
-                return content
-            
-            # HWPX 파일 확인
-            elif header.startswith(b'\x50\x4B\x03\x04'):
-                content, metadata = get_hwpx_text(file_path)
-                content = '\n\n'.join(content)
-                return content
-
-            # PDF 파일 확인
-            elif header.startswith(b'%PDF'):
-                loader = PyPDFLoader(file_path)
-                docs = loader.load()
-                content_list = [doc.page_content for doc in docs]
-                content = ' \n'.join(content_list)
-                return content
-
-            # 기타 파일
-            else:
-                return "Unknown"
+        return extract_file_text(file_path, max_chars, normalizer)
+    except UnsupportedFileError:
+        return "Unknown"
     except Exception as e:
         return f"Error detecting file type: {e}"
 
@@ -129,26 +269,68 @@ def search_keywords_in_text(text, keywords):
                 return True
     return False
 
-# 공고 파일 선택 함수
-def notice_file_select(download_folder_path):
+# 키워드 파일 선택 함수
+def select_keyword_file(file_names):
     """
-    다운로드 폴더 내에서 특정 키워드를 포함한 파일을 선택합니다.
+    파일 이름 목록에서 특정 키워드를 포함한 파일을 선택합니다.
+
+    과업지시서/과업내용서를 우선하고, 없으면 처음 발견한 제안요청서를 선택합니다.
 
     Args:
-        download_folder_path (str): 다운로드 폴더 경로.
+        file_names (Iterable[str]): 파일 이름 목록.
 
     Returns:
-        keyword_file(str): 선택된 파일 이름.
+        keyword_file(str): 선택된 파일 이름. 없으면 빈 문자열.
     """
     keyword_file = ''
-    for file_name in os.listdir(download_folder_path):
+    for file_name in file_names:
         # 파일 이름에서 특정 키워드 검색
         if '과업지시서' in file_name.replace(' ','') or '과업내용서' in file_name.replace(' ',''):
             keyword_file = file_name
         elif '제안요청서' in file_name.replace(' ','') and keyword_file == '':
-            keyword_file = file_name 
+            keyword_file = file_name
     return keyword_file
 
+# 다운로드할 첨부파일 선택 함수
+def select_download_files(file_names):
+    """
+    다운로드하기 전에 첨부파일 이름만 보고 내려받을 파일을 고릅니다.
+
+    ZIP 파일을 제외한 이름에 select_keyword_file()을 적용하여 한 파일만 고르고,
+    ZIP 파일은 안의 항목 이름을 미리 알 수 없으므로 다음 경우에만 함께 내려받습니다.
+    - 과업지시서/과업내용서가 없는 경우 (ZIP 안의 과업지시서가 우선되므로)
+    - 키워드 파일이 하나도 없는 경우 (ZIP 파일만 내려받음)
+    notice_file_check()는 내려받은 파일에 같은 기준을 적용하므로 선택 결과는 전체를 내려받을 때와 같습니다.
+
+    Args:
+        file_names (Iterable[str]): 첨부파일 이름 목록.
+
+    Returns:
+        selected(List[str]): 내려받을 첨부파일 이름 리스트. 없으면 빈 리스트.
+    """
+    file_names = list(file_names)
+    zip_files = [file_name for file_name in file_names if file_name.lower().endswith('.zip')]
+    keyword_file = select_keyword_file([file_name for file_name in file_names if file_name not in zip_files])
+    if keyword_file == '':
+        return zip_files
+    compact_name = keyword_file.replace(' ', '')
+    if '과업지시서' in compact_name or '과업내용서' in compact_name:
+        return [keyword_file]
+    return [keyword_file] + zip_files
+
+# 공고 파일 선택 함수
+def notice_file_select(download_folder_path):
+    """
+    다운로드 폴더 내에서 특정 키워드를 포함한 파일을 선택합니다.
+
+    Args:
+        download_folder_path (str): 다운로드 폴더 경로.
+
+    Returns:
+        keyword_file(str): 선택된 파일 이름.
+    """
+    return select_keyword_file(os.listdir(download_folder_path))
+
 # 텍스트에서 공고 키워드 검색 함수
 def notice_keyword_search(text):
     """
@@ -1,27 +1,49 @@
-from typing import Any, Dict, List, Optional, Iterator
+from typing import Any, BinaryIO, Dict, List, Optional, Iterator, Union
+import io
 import olefile
 import zlib
 import struct
-import re
-import unicodedata
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from langchain.schema import Document
 from langchain.document_loaders.base import BaseLoader
+from function_list import text_normalize
+from function_list.text_normalize import DEFAULT_NORMALIZER, TextNormalizer
+
+# 로더 버전. 추출 결과가 바뀌는 수정을 하면 올려서 추출 결과 캐시를 무효화합니다.
+HWP_LOADER_VERSION = 1
 
 
 class HWPLoader(BaseLoader):
     """HWP 파일 읽기 클래스. HWP 파일의 내용을 읽고 문서 객체를 생성합니다."""
 
-    def __init__(self, file_path: str, *args: Any, **kwargs: Any) -> None:
+    def __init__(
+        self,
+        file_path: Union[str, BinaryIO],
+        *args: Any,
+        max_chars: Optional[int] = None,
+        normalizer: Optional[TextNormalizer] = None,
+        section_workers: int = 1,
+        **kwargs: Any,
+    ) -> None:
         """
         HWPLoader 초기화 메서드.
 
         Args:
-            file_path (str): 읽을 HWP 파일 경로.
+            file_path (Union[str, BinaryIO]): 읽을 HWP 파일 경로 또는 파일 내용을 담은 바이너리 객체.
             *args, **kwargs: 추가 인자.
+            max_chars (Optional[int]): 추출할 글자 수. 이만큼 모이면 나머지 섹션은 읽지 않습니다.
+                None이면 전체를 추출합니다.
+            normalizer (Optional[TextNormalizer]): 텍스트 정제 객체. None이면 기본 정제(중국어 문자 및 제어 문자 제거)를 사용합니다.
+            section_workers (int): 본문 섹션을 동시에 디코딩할 스레드 수. 1이면 섹션을 순서대로 디코딩합니다.
         """
         super().__init__(*args, **kwargs)
         self.file_path = file_path  # 파일 경로 저장
-        self.extra_info = {"source": file_path}  # 파일 정보 저장
+        self.max_chars = max_chars  # 추출 글자 수 제한
+        self.normalizer = normalizer or DEFAULT_NORMALIZER  # 텍스트 정제 객체
+        self.section_workers = max(1, section_workers)  # 섹션 디코딩 스레드 수
+        source = file_path if isinstance(file_path, str) else getattr(file_path, "name", "")
+        self.extra_info = {"source": source}  # 파일 정보 저장
         self._initialize_constants()  # 상수 초기화
 
     def _initialize_constants(self) -> None:
@@ -30,7 +52,8 @@ class HWPLoader(BaseLoader):
         self.HWP_SUMMARY_SECTION = "\x05HwpSummaryInformation"  # 요약 정보 섹션 이름
         self.SECTION_NAME_LENGTH = len("Section")  # 섹션 이름 길이
         self.BODYTEXT_SECTION = "BodyText"  # 본문 텍스트 섹션 이름
-        self.HWP_TEXT_TAGS = [67]  # 텍스트 태그 ID
+        self.HWP_TEXT_TAGS = frozenset([67])  # 텍스트 태그 ID (HWPTAG_PARA_TEXT)
+        self.STREAM_CHUNK_SIZE = 64 * 1024  # 섹션 스트림을 한 번에 읽을 바이트 수
 
     def lazy_load(self) -> Iterator[Document]:
         """
@@ -46,8 +69,11 @@ class HWPLoader(BaseLoader):
         if not self._is_valid_hwp(file_dir):
             raise ValueError("유효하지 않은 HWP 파일입니다.")
 
+        # 압축 여부는 파일 헤더에서 한 번만 확인
+        compressed = self._is_compressed(load_file)
+
         # 텍스트 추출 및 문서 객체 생성
-        result_text = self._extract_text(load_file, file_dir)
+        result_text = self._extract_text(load_file, file_dir, compressed)
         yield self._create_document(text=result_text, extra_info=self.extra_info)
 
     def _is_valid_hwp(self, dirs: List[List[str]]) -> bool:
@@ -97,22 +123,98 @@ class HWPLoader(BaseLoader):
         return Document(page_content=text, metadata=extra_info or {})
 
     def _extract_text(
-        self, load_file: olefile.OleFileIO, file_dir: List[List[str]]
+        self, load_file: olefile.OleFileIO, file_dir: List[List[str]], compressed: bool
     ) -> str:
         """
-        모든 섹션에서 텍스트를 추출합니다.
+        섹션 순서대로 텍스트를 추출합니다.
+
+        max_chars가 주어지면 모인 글자 수가 max_chars에 도달하는 즉시 멈추므로,
+        반환값은 전체 추출 결과의 앞부분(max_chars 이상)과 같습니다.
+        section_workers가 2 이상이면 섹션을 스레드에서 동시에 디코딩하되, 결과는 섹션 순서대로 이어 붙입니다.
 
         Args:
             load_file (olefile.OleFileIO): OleFileIO 객체.
             file_dir (List[List[str]]): 파일 디렉토리 목록.
+            compressed (bool): 본문 섹션의 압축 여부.
 
         Returns:
             str: 추출된 텍스트.
         """
         sections = self._get_body_sections(file_dir)  # 본문 섹션 목록 가져오기
-        return "\n".join(
-            self._get_text_from_section(load_file, section) for section in sections
-        )
+        if self.section_workers > 1 and len(sections) > 1:
+            section_lines = self._iter_sections_parallel(load_file, sections, compressed)
+        else:
+            section_lines = (self._iter_section_lines(load_file, section, compressed) for section in sections)
+
+        section_texts = []
+        length = -1  # 섹션 구분자("\n")를 포함한 누적 글자 수
+        try:
+            for section_iter in section_lines:
+                lines = []
+                length += 1
+                for i, line in enumerate(section_iter):
+                    lines.append(line)
+                    length += len(line) + (1 if i else 0)
+                    if self.max_chars is not None and length >= self.max_chars:
+                        section_texts.append("\n".join(lines))
+                        return "\n".join(section_texts)
+                section_texts.append("\n".join(lines))
+            return "\n".join(section_texts)
+        finally:
+            section_lines.close()  # 미리 디코딩 중인 섹션 취소
+
+    def _iter_sections_parallel(
+        self, load_file: olefile.OleFileIO, sections: List[str], compressed: bool
+    ) -> Iterator[List[str]]:
+        """
+        섹션을 스레드 풀에서 동시에 디코딩하고, 섹션 순서대로 문단 목록을 반환합니다.
+
+        olefile은 스레드 안전하지 않으므로 섹션 스트림은 이 스레드에서만 차례로 읽고,
+        압축 해제(GIL을 놓음), 레코드 스캔, 정제만 스레드에서 실행합니다.
+        아직 반환하지 않은 섹션은 최대 section_workers개까지만 미리 읽으므로, 글자 수 제한에
+        도달해 호출하는 쪽이 멈추면 그 뒤의 섹션은 읽지 않고 대기 중인 디코딩은 취소됩니다.
+
+        Args:
+            load_file (olefile.OleFileIO): OleFileIO 객체.
+            sections (List[str]): 섹션 이름 리스트.
+            compressed (bool): 섹션 데이터의 압축 여부.
+
+        Yields:
+            List[str]: 섹션별 정제된 문단 텍스트 리스트.
+        """
+        remaining = iter(sections)
+        futures = collections.deque()
+        with ThreadPoolExecutor(max_workers=self.section_workers) as executor:
+            try:
+                while True:
+                    # 디코딩 중인 섹션이 section_workers개가 되도록 다음 섹션을 읽어 작업 추가
+                    while len(futures) < self.section_workers:
+                        section = next(remaining, None)
+                        if section is None:
+                            break
+                        with load_file.openstream(section) as bodytext:
+                            data = bodytext.read()
+                        futures.append(executor.submit(self._decode_section, data, section, compressed))
+                    if not futures:
+                        return
+                    yield futures.popleft().result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _decode_section(self, data: bytes, section: str, compressed: bool) -> List[str]:
+        """
+        메모리로 읽은 섹션 데이터에서 정제된 문단 텍스트를 모두 추출합니다.
+
+        Args:
+            data (bytes): 섹션 스트림 내용.
+            section (str): 섹션 이름.
+            compressed (bool): 섹션 데이터의 압축 여부.
+
+        Returns:
+            List[str]: 정제된 문단 텍스트 리스트.
+        """
+        return list(self._iter_stream_lines(io.BytesIO(data), section, compressed))
 
     def _is_compressed(self, load_file: olefile.OleFileIO) -> bool:
         """
@@ -128,84 +230,139 @@ class HWPLoader(BaseLoader):
             header_data = header.read()
             return bool(header_data[36] & 1)  # 압축 여부 확인
 
-    def _get_text_from_section(self, load_file: olefile.OleFileIO, section: str) -> str:
+    def _get_text_from_section(
+        self, load_file: olefile.OleFileIO, section: str, compressed: bool
+    ) -> str:
         """
         특정 섹션에서 텍스트를 추출합니다.
 
         Args:
             load_file (olefile.OleFileIO): OleFileIO 객체.
             section (str): 섹션 이름.
+            compressed (bool): 섹션 데이터의 압축 여부.
 
         Returns:
             str: 추출된 텍스트.
         """
+        return "\n".join(self._iter_section_lines(load_file, section, compressed))
+
+    def _iter_section_lines(
+        self, load_file: olefile.OleFileIO, section: str, compressed: bool
+    ) -> Iterator[str]:
+        """
+        섹션 데이터를 조금씩 압축 해제하면서 정제된 문단 텍스트를 차례로 반환합니다.
+
+        섹션 전체를 한 번에 압축 해제하지 않으므로, 호출하는 쪽에서 중간에 멈추면
+        나머지 데이터는 압축 해제하지 않습니다.
+
+        Args:
+            load_file (olefile.OleFileIO): OleFileIO 객체.
+            section (str): 섹션 이름.
+            compressed (bool): 섹션 데이터의 압축 여부.
+
+        Yields:
+            str: 정제된 문단 텍스트.
+        """
         with load_file.openstream(section) as bodytext:
-            data = bodytext.read()
-
-        # 압축 여부에 따라 데이터 처리
-        unpacked_data = (
-            zlib.decompress(data, -15) if self._is_compressed(load_file) else data
-        )
-
-        text = []
-        i = 0
-        while i < len(unpacked_data):
-            # 레코드 헤더 파싱
-            header, rec_type, rec_len = self._parse_record_header(
-                unpacked_data[i : i + 4]
-            )
-            if rec_type in self.HWP_TEXT_TAGS:  # 텍스트 태그인지 확인
-                rec_data = unpacked_data[i + 4 : i + 4 + rec_len]
-                text.append(rec_data.decode("utf-16"))  # UTF-16으로 디코딩
-            i += 4 + rec_len
-
-        # 텍스트 정제 (중국어 문자 및 제어 문자 제거)
-        text = [self.remove_chinese_characters(line) for line in text]
-        text = [self.remove_control_characters(line) for line in text]
-        text = "\n".join(text)
-        return text
+            yield from self._iter_stream_lines(bodytext, section, compressed)
 
-    @staticmethod
-    def remove_chinese_characters(s: str) -> str:
+    def _iter_stream_lines(self, bodytext: BinaryIO, section: str, compressed: bool) -> Iterator[str]:
         """
-        중국어 문자를 제거합니다.
+        섹션 스트림을 STREAM_CHUNK_SIZE씩 읽어 압축 해제하면서 정제된 문단 텍스트를 차례로 반환합니다.
 
         Args:
-            s (str): 입력 문자열.
+            bodytext (BinaryIO): 섹션 스트림.
+            section (str): 섹션 이름 (오류 메시지용).
+            compressed (bool): 섹션 데이터의 압축 여부.
+
+        Yields:
+            str: 정제된 문단 텍스트.
+        """
+        decompressor = zlib.decompressobj(-15) if compressed else None
+        pending = bytearray()  # 청크 경계에 걸려 아직 읽지 못한 레코드 (제자리에서 늘려 재복사 방지)
+        for chunk in iter(lambda: bodytext.read(self.STREAM_CHUNK_SIZE), b""):
+            # 압축 여부에 따라 데이터 처리
+            if decompressor is not None:
+                chunk = decompressor.decompress(chunk)
+            pending += chunk
+            texts, offset = self._scan_para_text(pending)
+            del pending[:offset]
+
+            # 청크에서 읽은 문단을 한 번에 정제
+            if texts:
+                yield from self.normalizer.normalize_lines(texts).split("\n")
+            if decompressor is not None and decompressor.eof:
+                break
+
+        if decompressor is not None and not decompressor.eof:
+            raise zlib.error("압축된 섹션 데이터가 잘렸습니다: " + section)
+
+    def _scan_para_text(self, data: bytes, start: int = 0) -> tuple:
+        """
+        레코드 스트림에서 문단 텍스트(HWPTAG_PARA_TEXT) 레코드만 디코딩합니다.
+
+        레코드 헤더는 슬라이스 없이 버퍼에서 바로 읽고, 텍스트 레코드만
+        memoryview로 디코딩하므로 다른 레코드는 복사하지 않습니다.
+
+        Args:
+            data (bytes 또는 bytearray): 압축이 풀린 섹션 데이터.
+            start (int): 스캔을 시작할 위치.
 
         Returns:
-            str: 중국어 문자가 제거된 문자열.
+            tuple:
+                - texts (List[str]): 디코딩된 문단 텍스트 리스트.
+                - offset (int): 마지막으로 읽은 완전한 레코드의 다음 위치.
         """
-        return re.sub(r"[\u4e00-\u9fff]+", "", s)
+        unpack_from = struct.unpack_from
+        text_tags = self.HWP_TEXT_TAGS
+        end = len(data)
+        texts = []
+        i = start
+        # bytearray를 넘겨도 반환 후 크기를 바꿀 수 있도록 memoryview를 바로 해제
+        with memoryview(data) as view:
+            while i + 4 <= end:
+                header = unpack_from("<I", data, i)[0]
+                rec_type = header & 0x3FF  # 레코드 타입 추출
+                rec_len = (header >> 20) & 0xFFF  # 레코드 길이 추출
+                body = i + 4
+                if rec_len == 0xFFF:  # 길이가 4095 이상이면 다음 4바이트에 실제 길이 저장
+                    if body + 4 > end:
+                        break
+                    rec_len = unpack_from("<I", data, body)[0]
+                    body += 4
+                if body + rec_len > end:  # 잘린 레코드
+                    break
+                if rec_type in text_tags:  # 텍스트 태그인지 확인
+                    text = str(view[body : body + rec_len], "utf-16")  # UTF-16으로 디코딩
+                    texts.append(text)
+                i = body + rec_len
+        return texts, i
 
     @staticmethod
-    def remove_control_characters(s: str) -> str:
+    def remove_chinese_characters(s: str) -> str:
         """
-        제어 문자를 제거합니다.
+        중국어 문자를 제거합니다.
 
         Args:
             s (str): 입력 문자열.
 
         Returns:
-            str: 제어 문자가 제거된 문자열.
+            str: 중국어 문자가 제거된 문자열.
         """
-        return "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
+        return text_normalize.remove_chinese_characters(s)
 
     @staticmethod
-    def _parse_record_header(header_bytes: bytes) -> tuple:
+    def remove_control_characters(s: str) -> str:
         """
-        레코드 헤더를 파싱합니다.
+        제어 문자를 제거합니다.
 
         Args:
-            header_bytes (bytes): 레코드 헤더 바이트.
+            s (str): 입력 문자열.
 
         Returns:
-            tuple: (헤더, 레코드 타입, 레코드 길이).
+            str: 제어 문자가 제거된 문자열.
         """
-        header = struct.unpack_from("<I", header_bytes)[0]
-        rec_type = header & 0x3FF  # 레코드 타입 추출
-        rec_len = (header >> 20) & 0xFFF  # 레코드 길이 추출
-        return header, rec_type, rec_len
+        return text_normalize.remove_control_characters(s)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,16 @@
 import zipfile
-import os  
 import xml.etree.ElementTree as ET  
-import re
-import unicodedata
+from function_list import text_normalize
+from function_list.text_normalize import DEFAULT_NORMALIZER
+
+# 로더 버전. 추출 결과가 바뀌는 수정을 하면 올려서 추출 결과 캐시를 무효화합니다.
+HWPX_LOADER_VERSION = 1
+
+# HWPX 문단 요소 네임스페이스와 태그 이름
+HP_NAMESPACE = "{http://www.hancom.co.kr/hwpml/2011/paragraph}"
+HP_PARAGRAPH = HP_NAMESPACE + "p"
+HP_TABLE = HP_NAMESPACE + "tbl"
+HP_TEXT = HP_NAMESPACE + "t"
 
 def remove_chinese_characters(s: str):
     """
@@ -14,7 +22,7 @@ def remove_chinese_characters(s: str):
     Returns:
         str: 중국어 문자가 제거된 문자열
     """
-    return re.sub(r"[\u4e00-\u9fff]+", "", s)
+    return text_normalize.remove_chinese_characters(s)
 
 def remove_control_characters(s):
     """
@@ -26,64 +34,104 @@ def remove_control_characters(s):
     Returns:
         str: 제어 문자가 제거된 문자열
     """
-    return "".join(ch for ch in s if unicodedata.category(ch)[0] != "C")
+    return text_normalize.remove_control_characters(s)
+
+def section_paragraphs(section_stream):
+    """
+    섹션 XML을 iterparse로 한 번만 읽으면서 문단별 텍스트와 페이지 구분 여부를 추출합니다.
 
-def get_hwpx_text(file_path):
+    트리 전체를 만들지 않고, 최상위 문단이 끝날 때마다 읽은 요소를 비워 메모리를 일정하게 유지합니다.
+    문단 텍스트는 하위 문단을 포함한 모든 hp:t의 텍스트를 공백으로 이은 것이며,
+    테이블(hp:tbl) 안에 있는 텍스트와 같은 텍스트는 제외합니다.
+
+    Args:
+        section_stream (BinaryIO): 섹션 XML 파일 객체
+
+    Returns:
+        paragraphs(List[tuple]): 문서 순서대로 (pageBreak 속성 값, 문단 텍스트) 리스트
+    """
+    paragraphs = []  # [pageBreak 속성 값, hp:t 텍스트 리스트]
+    open_paragraphs = []  # 아직 닫히지 않은 문단 (중첩 문단 포함)
+    table_texts = set()  # 테이블 안의 텍스트
+    table_depth = 0
+    root = None
+
+    for event, elem in ET.iterparse(section_stream, events=("start", "end")):
+        if root is None:
+            root = elem
+        tag = elem.tag
+        if event == "start":
+            if tag == HP_PARAGRAPH:
+                paragraph = [elem.attrib.get("pageBreak", "0"), []]
+                paragraphs.append(paragraph)
+                open_paragraphs.append(paragraph[1])
+            elif tag == HP_TABLE:
+                table_depth += 1
+        elif tag == HP_TEXT:
+            text = elem.text
+            if text:
+                # 열려 있는 모든 상위 문단에 텍스트 추가
+                for texts in open_paragraphs:
+                    texts.append(text)
+                if table_depth:
+                    table_texts.add(text)
+            elem.clear()
+        elif tag == HP_TABLE:
+            table_depth -= 1
+        elif tag == HP_PARAGRAPH:
+            open_paragraphs.pop()
+            if not open_paragraphs:
+                root.clear()  # 최상위 문단이 끝나면 읽은 요소 정리
+
+    # 테이블 텍스트 제외
+    return [
+        (page_break, " ".join([text for text in texts if text not in table_texts]))
+        for page_break, texts in paragraphs
+    ]
+
+def get_hwpx_text(file_path, max_chars=None, normalizer=None):
     """
     HWPX 파일에서 텍스트를 추출합니다.
 
+    max_chars가 주어지면 페이지 텍스트를 '\n\n'으로 이었을 때의 글자 수가
+    max_chars에 도달하는 즉시 멈추고, 나머지 섹션은 읽지 않습니다.
+
     Args:
-        file_path (str): HWPX 파일 경로
+        file_path (str 또는 BinaryIO): HWPX 파일 경로 또는 파일 내용을 담은 바이너리 객체
+        max_chars (int): 추출할 글자 수. None이면 전체를 추출합니다.
+        normalizer (TextNormalizer): 텍스트 정제 객체. None이면 기본 정제(중국어 문자 및 제어 문자 제거)를 사용합니다.
 
     Returns:
         tuple:
             - docs(List[str]): 파일에서 추출된 텍스트
             - metadata(dict): 파일과 관련된 메타데이터
     """
+    normalizer = normalizer or DEFAULT_NORMALIZER
     try:
         # ZIP 파일 열기
         with zipfile.ZipFile(file_path, 'r') as zf:
             # Contents 폴더 내의 섹션 파일(.xml) 목록 찾기
             section_files = [name for name in zf.namelist() if name.startswith('Contents/section') and name.endswith('.xml')]
 
-            # 섹션 데이터를 저장할 디렉토리 생성 (필요시)
-            output_dir = "extracted_sections"
-            os.makedirs(output_dir, exist_ok=True)  # 디렉토리가 없으면 생성
-
             # 메타데이터와 텍스트 데이터를 저장할 변수 초기화
             metadata = {}
             docs = []
+            length = -2  # 페이지 구분자('\n\n')를 포함한 누적 글자 수
 
             # 각 섹션 파일 처리
             for section_file in section_files:
-                with zf.open(section_file) as section_file_content:
-                    # 섹션 파일 내용 읽기
-                    section_content = section_file_content.read().decode('utf-8')
+                if max_chars is not None and length >= max_chars:
+                    break  # 필요한 글자 수를 모두 모음
 
-                # XML 파싱
-                root = ET.fromstring(section_content)
+                # 섹션 XML을 압축 해제하면서 바로 파싱
+                with zf.open(section_file) as section_file_content:
+                    paragraphs = section_paragraphs(section_file_content)
 
                 # 페이지별 텍스트를 저장할 리스트 초기화
                 pages = []
                 current_page = []
 
-                # 테이블 텍스트를 별도로 저장
-                table_texts = []
-                for tbl in root.findall(".//hp:tbl", namespaces={"hp": "http://www.hancom.co.kr/hwpml/2011/paragraph"}):
-                    # 테이블 내 텍스트 추출
-                    table_texts.extend(
-                        [t.text for t in tbl.findall(".//hp:t", namespaces={"hp": "http://www.hancom.co.kr/hwpml/2011/paragraph"}) if t.text]
-                    )
-
-                # 문단(p) 요소에서 텍스트 추출
-                for p in root.findall(".//hp:p", namespaces={"hp": "http://www.hancom.co.kr/hwpml/2011/paragraph"}):
-                    # pageBreak 속성 확인 (페이지 구분)
-                    page_break = p.attrib.get("pageBreak", "0")  # 기본값은 "0"
-                    
-                    # 문단 내 텍스트 추출
-                    text_elements = p.findall(".//hp:t", namespaces={"hp": "http://www.hancom.co.kr/hwpml/2011/paragraph"})
-                    text = " ".join([t.text for t in text_elements if t.text and t.text not in table_texts])  # 테이블 텍스트 제외
-
+                for page_break, text in paragraphs:
                     # 페이지가 구분될 경우 처리
                     if page_break == "1":  # 새로운 페이지 시작
                         if current_page:
@@ -99,14 +147,12 @@ def get_hwpx_text(file_path):
 
                 # 페이지별 텍스트 처리
                 for i, page in enumerate(pages, start=1):
-                    # 중국어 문자 제거
-                    page = [remove_chinese_characters(line) for line in page]
-                    # 제어 문자 제거
-                    page = [remove_control_characters(line) for line in page]
-
-                    # 페이지 텍스트를 하나로 합치기
-                    text = "\n".join(page)
+                    # 중국어 문자 및 제어 문자를 제거하고 페이지 텍스트를 하나로 합치기
+                    text = normalizer.normalize_lines(page)
                     docs.append(text)
+                    length += len(text) + 2
+                    if max_chars is not None and length >= max_chars:
+                        break
 
             # 각 섹션의 텍스트를 메타데이터에 저장
             for idx in range(len(docs)):
@@ -0,0 +1,213 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from functools import lru_cache
+from langchain_core.messages import message_to_dict, messages_from_dict
+
+# 응답 캐시에 저장할 기본 최대 응답 수
+LLM_CACHE_MAX_ENTRIES = 100000
+
+
+class LLMResponseCache:
+    """
+    LLM 응답을 SQLite에 저장하는 캐시 클래스.
+
+    (제공자, 모델, 온도, 프롬프트 템플릿 해시, 입력 텍스트 해시)를 키로 응답 원문과 사용량 메타데이터를 저장합니다.
+    같은 입력에 같은 응답을 기대할 수 있는 temperature=0 모델의 응답만 저장하며,
+    최대 응답 수를 넘으면 가장 오래 사용하지 않은 응답부터 삭제합니다(LRU).
+    """
+
+    def __init__(self, path: str, max_entries: int = LLM_CACHE_MAX_ENTRIES, bypass: bool = False) -> None:
+        """
+        LLMResponseCache 초기화 메서드.
+
+        Args:
+            path (str): SQLite 파일 경로.
+            max_entries (int): 저장할 최대 응답 수.
+            bypass (bool): True이면 저장된 응답을 사용하지 않고 새 응답으로 덮어씁니다.
+        """
+        self.path = os.path.abspath(path)
+        self.max_entries = max_entries
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.Lock()  # 여러 스레드가 함께 사용
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS responses ('
+                'provider TEXT, model TEXT, temperature REAL, prompt_hash TEXT, input_hash TEXT, '
+                'response TEXT, usage TEXT, created REAL, last_used REAL, '
+                'PRIMARY KEY (provider, model, temperature, prompt_hash, input_hash))'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)')
+        self._entries = self._db.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+        self._prompt_hashes = {}  # id(프롬프트) -> (프롬프트, 해시)
+
+    @staticmethod
+    def llm_identity(llm):
+        """
+        LLM 클라이언트의 제공자, 모델 이름, 온도를 확인합니다.
+
+        Args:
+            llm (BaseChatModel): LLM 클라이언트 (ChatOpenAI, ChatOllama 등).
+
+        Returns:
+            tuple: (제공자, 모델 이름, 온도). 온도가 설정되지 않았으면 None.
+        """
+        model = getattr(llm, 'model_name', None) or getattr(llm, 'model', None)
+        return llm._llm_type, model, getattr(llm, 'temperature', None)
+
+    def prompt_hash(self, prompt) -> str:
+        """
+        프롬프트 템플릿과 미리 채운 변수(출력 형식 지침 등)의 SHA-256 해시를 계산합니다.
+
+        Args:
+            prompt (PromptTemplate): 프롬프트 템플릿.
+
+        Returns:
+            str: 16진수 해시 문자열.
+        """
+        cached = self._prompt_hashes.get(id(prompt))
+        if cached is not None and cached[0] is prompt:
+            return cached[1]
+        partials = {key: str(value) for key, value in prompt.partial_variables.items()}
+        source = json.dumps([prompt.template, partials], ensure_ascii=False, sort_keys=True)
+        digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        self._prompt_hashes[id(prompt)] = (prompt, digest)
+        return digest
+
+    def key(self, llm, prompt, text: str):
+        """
+        캐시 키를 만듭니다.
+
+        Args:
+            llm (BaseChatModel): LLM 클라이언트.
+            prompt (PromptTemplate): 프롬프트 템플릿.
+            text (str): 프롬프트에 넣을 입력 텍스트.
+
+        Returns:
+            tuple 또는 None: 캐시 키. temperature=0이 아닌 모델은 저장하지 않으므로 None.
+        """
+        provider, model, temperature = self.llm_identity(llm)
+        if temperature != 0:
+            return None
+        input_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return provider, model, float(temperature), self.prompt_hash(prompt), input_hash
+
+    def get(self, llm, prompt, text: str):
+        """
+        저장된 응답을 찾습니다.
+
+        Args:
+            llm (BaseChatModel): LLM 클라이언트.
+            prompt (PromptTemplate): 프롬프트 템플릿.
+            text (str): 프롬프트에 넣을 입력 텍스트.
+
+        Returns:
+            AIMessage 또는 None: 저장된 응답 (사용량 메타데이터 포함). 없거나 bypass이면 None.
+        """
+        key = self.key(llm, prompt, text)
+        if key is None or self.bypass:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                'SELECT response FROM responses WHERE provider = ? AND model = ? AND temperature = ? '
+                'AND prompt_hash = ? AND input_hash = ?',
+                key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            with self._db:
+                self._db.execute(
+                    'UPDATE responses SET last_used = ? WHERE provider = ? AND model = ? AND temperature = ? '
+                    'AND prompt_hash = ? AND input_hash = ?',
+                    (time.time(), *key),
+                )
+        return messages_from_dict([json.loads(row[0])])[0]
+
+    def put(self, llm, prompt, text: str, response) -> None:
+        """
+        응답을 저장하고, 최대 응답 수를 넘으면 가장 오래 사용하지 않은 응답을 삭제합니다.
+
+        Args:
+            llm (BaseChatModel): LLM 클라이언트.
+            prompt (PromptTemplate): 프롬프트 템플릿.
+            text (str): 프롬프트에 넣을 입력 텍스트.
+            response (AIMessage): LLM 응답.
+        """
+        key = self.key(llm, prompt, text)
+        if key is None:
+            return
+        raw = json.dumps(message_to_dict(response), ensure_ascii=False)
+        usage = json.dumps(getattr(response, 'usage_metadata', None), ensure_ascii=False)
+        now = time.time()
+        with self._lock, self._db:
+            cursor = self._db.execute(
+                'INSERT OR IGNORE INTO responses (provider, model, temperature, prompt_hash, input_hash, '
+                'response, usage, created, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (*key, raw, usage, now, now),
+            )
+            if cursor.rowcount:
+                self._entries += 1
+            else:
+                self._db.execute(
+                    'UPDATE responses SET response = ?, usage = ?, created = ?, last_used = ? '
+                    'WHERE provider = ? AND model = ? AND temperature = ? AND prompt_hash = ? AND input_hash = ?',
+                    (raw, usage, now, now, *key),
+                )
+            excess = self._entries - self.max_entries
+            if excess > 0:
+                cursor = self._db.execute(
+                    'DELETE FROM responses WHERE rowid IN '
+                    '(SELECT rowid FROM responses ORDER BY last_used LIMIT ?)',
+                    (excess,),
+                )
+                self._entries -= cursor.rowcount
+                self.evictions += cursor.rowcount
+
+    @property
+    def hit_rate(self) -> float:
+        """조회한 응답 중 캐시에 있었던 비율."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """
+        캐시 사용 현황을 반환합니다.
+
+        Returns:
+            dict: hits, misses, hit_rate, entries(저장된 응답 수), evictions(LRU로 삭제한 응답 수), bypass.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'hit_rate': round(self.hit_rate, 3),
+                'entries': self._entries, 'evictions': self.evictions, 'bypass': self.bypass}
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        self._db.close()
+
+# 기본 응답 캐시 생성 함수
+@lru_cache(maxsize=None)
+def default_response_cache():
+    """
+    LLM_CACHE_PATH 환경 변수에 지정한 경로의 응답 캐시를 프로세스당 한 번만 엽니다.
+
+    LLM_CACHE_MAX_ENTRIES로 최대 응답 수를, LLM_CACHE_BYPASS=1로 bypass를 지정할 수 있습니다.
+
+    Returns:
+        LLMResponseCache 또는 None: 응답 캐시. LLM_CACHE_PATH가 없으면 None (캐시 사용 안 함).
+    """
+    path = os.environ.get('LLM_CACHE_PATH')
+    if not path:
+        return None
+    max_entries = int(os.environ.get('LLM_CACHE_MAX_ENTRIES', LLM_CACHE_MAX_ENTRIES))
+    bypass = os.environ.get('LLM_CACHE_BYPASS', '') in ('1', 'true', 'True')
+    return LLMResponseCache(path, max_entries, bypass)
@@ -0,0 +1,322 @@
+import time
+import random
+import asyncio
+import collections
+
+# 요청 한도 초과(HTTP 429)를 나타내는 예외 이름
+RATE_LIMIT_ERROR_NAMES = frozenset(['RateLimitError', 'TooManyRequests'])
+
+# 요청 한도 초과 확인 함수
+def is_rate_limit_error(error):
+    """
+    LLM 호출 예외가 요청 한도 초과(HTTP 429)인지 확인합니다.
+
+    openai.RateLimitError, ollama.ResponseError(status_code=429) 등 상태 코드를 가진 예외를 처리합니다.
+
+    Args:
+        error (Exception): LLM 호출 중 발생한 예외.
+
+    Returns:
+        bool: 요청 한도 초과이면 True.
+    """
+    if type(error).__name__ in RATE_LIMIT_ERROR_NAMES:
+        return True
+    return getattr(error, 'status_code', None) == 429
+
+# 재시도 대기 시간 확인 함수
+def retry_after_seconds(error):
+    """
+    429 응답의 Retry-After 헤더 값을 초 단위로 읽습니다.
+
+    Args:
+        error (Exception): LLM 호출 중 발생한 예외.
+
+    Returns:
+        float 또는 None: 대기 시간 (초). 헤더가 없으면 None.
+    """
+    response = getattr(error, 'response', None)
+    headers = getattr(response, 'headers', None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class RateBucket:
+    """
+    분당 한도를 초당 균등하게 채우는 토큰 버킷 클래스 (분당 요청 수, 분당 토큰 수 제한에 사용).
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        """
+        RateBucket 초기화 메서드.
+
+        Args:
+            per_minute (float): 분당 한도.
+        """
+        self.capacity = per_minute
+        self.rate = per_minute / 60  # 초당 채워지는 양
+        self.available = per_minute
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()  # 대기 순서대로 가져가도록 직렬화
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float) -> None:
+        """
+        버킷에서 amount만큼 가져갑니다. 모자라면 채워질 때까지 기다립니다.
+
+        한도보다 큰 요청은 버킷이 가득 찰 때까지 기다린 뒤 가져가며, 부족분은 빚으로 남깁니다.
+
+        Args:
+            amount (float): 가져갈 양.
+        """
+        async with self._lock:
+            while True:
+                self._refill()
+                needed = min(amount, self.capacity)
+                if self.available >= needed:
+                    self.available -= amount
+                    return
+                await asyncio.sleep((needed - self.available) / self.rate)
+
+    def adjust(self, amount: float) -> None:
+        """예상으로 가져간 양과 실제 사용량의 차이를 반영합니다. (양수면 더 가져감)"""
+        self._refill()
+        self.available = min(self.capacity, self.available - amount)
+
+
+class AdaptiveConcurrency:
+    """
+    AIMD(가산 증가, 곱셈 감소) 방식으로 동시 요청 수를 조절하는 클래스.
+
+    응답 지연이 평소보다 latency_factor배 넘게 늘거나 429를 받으면 동시 요청 수를 줄이고,
+    지연이 정상이면 동시 요청 수 만큼 성공할 때마다 1씩 늘립니다.
+    """
+
+    def __init__(self, initial: int, maximum: int, latency_factor: float = 2.0) -> None:
+        """
+        AdaptiveConcurrency 초기화 메서드.
+
+        Args:
+            initial (int): 처음 동시 요청 수.
+            maximum (int): 최대 동시 요청 수.
+            latency_factor (float): 평소 지연 대비 이 배수를 넘으면 동시 요청 수를 줄입니다.
+        """
+        self.maximum = max(1, maximum)
+        self.limit = float(min(max(1, initial), self.maximum))
+        self.latency_factor = latency_factor
+        self.in_flight = 0
+        self.baseline = None  # 지금까지 관측한 가장 낮은 평균 지연
+        self.latency = None  # 응답 지연의 지수 이동 평균
+        self._decreased_at = 0.0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """동시 요청 수가 한도보다 작아질 때까지 기다린 뒤 요청 자리를 차지합니다."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """요청 자리를 반납합니다."""
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> None:
+        """
+        성공한 요청의 지연을 반영합니다.
+
+        Args:
+            latency (float): 요청 지연 (초).
+        """
+        self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+        self.baseline = self.latency if self.baseline is None else min(self.baseline, self.latency)
+        if self.latency > self.baseline * self.latency_factor:
+            self._decrease(0.75)
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def on_throttle(self) -> None:
+        """429 응답을 받으면 동시 요청 수를 절반으로 줄입니다."""
+        self._decrease(0.5)
+
+    def _decrease(self, factor: float) -> None:
+        # 같은 원인으로 연달아 줄지 않도록 최근 평균 지연 동안은 한 번만 감소
+        now = time.monotonic()
+        if now - self._decreased_at < (self.latency or 1.0):
+            return
+        self._decreased_at = now
+        self.limit = max(1.0, self.limit * factor)
+
+
+class LLMExecutor:
+    """
+    asyncio로 LLM 단계(LLMStage)를 여러 요청 동시에 실행하는 클래스.
+
+    동시 요청 수는 AdaptiveConcurrency로 조절하고, 분당 요청 수와 분당 토큰 수는 RateBucket으로 제한합니다.
+    429를 받으면 지수 백오프(또는 Retry-After) 후 다시 시도합니다.
+    클라이언트 자체의 재시도가 429를 감추지 않도록 ChatOpenAI는 max_retries=0으로 만들어야 합니다.
+    (예: it_notice_check_stage(max_retries=0))
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        initial_concurrency: int = 4,
+        requests_per_minute: float = None,
+        tokens_per_minute: float = None,
+        max_retries: int = 5,
+        latency_factor: float = 2.0,
+        chars_per_token: float = 2.0,
+        max_output_tokens: int = 512,
+    ) -> None:
+        """
+        LLMExecutor 초기화 메서드.
+
+        Args:
+            max_concurrency (int): 최대 동시 요청 수.
+            initial_concurrency (int): 처음 동시 요청 수.
+            requests_per_minute (float): 분당 요청 수 제한. None이면 제한하지 않습니다.
+            tokens_per_minute (float): 분당 토큰 수 제한. None이면 제한하지 않습니다.
+            max_retries (int): 429를 받았을 때 최대 재시도 횟수.
+            latency_factor (float): 평소 지연 대비 이 배수를 넘으면 동시 요청 수를 줄입니다.
+            chars_per_token (float): 요청 전 프롬프트 토큰 수를 추정할 때 사용하는 토큰당 글자 수.
+            max_output_tokens (int): 요청 전 추정에 더하는 응답 토큰 수.
+        """
+        self.max_concurrency = max_concurrency
+        self.initial_concurrency = initial_concurrency
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.latency_factor = latency_factor
+        self.chars_per_token = chars_per_token
+        self.max_output_tokens = max_output_tokens
+        self.stats = collections.Counter()  # requests, retries, throttled, errors, cache_hits
+        self._loop = None
+
+    def _setup(self) -> None:
+        """현재 이벤트 루프에서 사용할 제한 객체를 만듭니다. (asyncio 객체는 루프별로 만들어야 함)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self.concurrency = AdaptiveConcurrency(self.initial_concurrency, self.max_concurrency, self.latency_factor)
+        self.request_bucket = RateBucket(self.requests_per_minute) if self.requests_per_minute else None
+        self.token_bucket = RateBucket(self.tokens_per_minute) if self.tokens_per_minute else None
+
+    def estimate_tokens(self, prompt: str) -> int:
+        """요청 전에 프롬프트와 응답을 합친 토큰 수를 추정합니다."""
+        return int(len(prompt) / self.chars_per_token) + self.max_output_tokens
+
+    async def arun(self, stage, text):
+        """
+        LLM 단계로 텍스트 하나를 처리합니다.
+
+        Args:
+            stage (LLMStage): 실행할 LLM 단계.
+            text (str): 공고 텍스트 또는 요약문.
+
+        Returns:
+            tuple 또는 Exception: 단계 결과. on_error()가 예외를 전달하는 단계에서는 예외 객체.
+        """
+        self._setup()
+        # 응답 캐시에 있으면 요청 한도를 쓰지 않고 바로 결과를 만듦
+        cached = stage.cached_response(text)
+        if cached is not None:
+            self.stats['cache_hits'] += 1
+            return stage.finish(text, cached, time.time(), cached=True)
+        prompt = stage.format_prompt(text)
+        estimate = self.estimate_tokens(prompt)
+        for attempt in range(self.max_retries + 1):
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket is not None:
+                await self.token_bucket.acquire(estimate)
+
+            await self.concurrency.acquire()
+            start_time = time.time()
+            started = time.monotonic()
+            try:
+                self.stats['requests'] += 1
+                response = await stage.llm.ainvoke(prompt, config=stage.config)
+            except Exception as e:
+                response = e
+            finally:
+                await self.concurrency.release()
+
+            if isinstance(response, Exception):
+                if is_rate_limit_error(response) and attempt < self.max_retries:
+                    self.stats['throttled'] += 1
+                    self.stats['retries'] += 1
+                    self.concurrency.on_throttle()
+                    delay = retry_after_seconds(response) or min(60, 2 ** attempt) * (0.5 + random.random())
+                    await asyncio.sleep(delay)
+                    continue
+                self.stats['errors'] += 1
+            else:
+                self.concurrency.on_success(time.monotonic() - started)
+                usage = getattr(response, 'usage_metadata', None) or {}
+                if self.token_bucket is not None and usage.get('total_tokens'):
+                    self.token_bucket.adjust(usage['total_tokens'] - estimate)
+            return stage.finish(text, response, start_time)
+
+    async def acall(self, stage, text):
+        """
+        arun()과 같지만 실패한 결과가 예외 객체이면 예외를 일으킵니다. (기존 함수와 같은 방식)
+
+        Args:
+            stage (LLMStage): 실행할 LLM 단계.
+            text (str): 공고 텍스트 또는 요약문.
+
+        Returns:
+            tuple: 단계 결과.
+        """
+        result = await self.arun(stage, text)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def arun_many(self, stage, texts):
+        """
+        여러 텍스트를 동시에 처리합니다.
+
+        Args:
+            stage (LLMStage): 실행할 LLM 단계.
+            texts (Iterable[str]): 공고 텍스트 또는 요약문 목록.
+
+        Returns:
+            List: 입력 순서대로 결과 리스트.
+        """
+        return await asyncio.gather(*(self.arun(stage, text) for text in texts))
+
+    def run_many(self, stage, texts):
+        """
+        arun_many()를 새 이벤트 루프에서 실행합니다. (동기 코드에서 사용)
+
+        Args:
+            stage (LLMStage): 실행할 LLM 단계.
+            texts (Iterable[str]): 공고 텍스트 또는 요약문 목록.
+
+        Returns:
+            List: 입력 순서대로 결과 리스트.
+        """
+        return asyncio.run(self.arun_many(stage, texts))
+
+    def summary(self) -> dict:
+        """
+        실행 통계를 반환합니다.
+
+        Returns:
+            dict: 요청 수, 재시도 수, 429 수, 오류 수, 캐시 적중 수, 현재 동시 요청 한도.
+        """
+        stats = dict(self.stats)
+        if self._loop is not None:
+            stats['concurrency_limit'] = round(self.concurrency.limit, 2)
+        return stats
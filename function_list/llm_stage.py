@@ -0,0 +1,271 @@
+import os
+import time
+import collections
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from dotenv import load_dotenv
+from langchain_core.runnables import RunnableConfig
+
+# 환경 변수 로드 함수
+@lru_cache(maxsize=None)
+def load_environment():
+    """
+    .env 파일의 환경 변수(예: API 키)를 프로세스당 한 번만 불러옵니다.
+
+    Returns:
+        bool: .env 파일을 불러왔으면 True.
+    """
+    return load_dotenv()
+
+# 프롬프트 배치 방식 (legacy: 기존 순서, prefix: 고정 지침을 앞에 두고 입력 텍스트를 마지막에 둠)
+PROMPT_LAYOUTS = ('legacy', 'prefix')
+
+# 프롬프트 배치 방식 확인 함수
+def prompt_layout():
+    """
+    LLM_PROMPT_LAYOUT 환경 변수로 지정한 프롬프트 배치 방식을 확인합니다.
+
+    prefix 방식은 모든 요청에서 같은 지침이 프롬프트 앞부분에 오므로,
+    OpenAI의 프롬프트 캐싱과 Ollama의 KV 캐시 재사용에 유리합니다.
+
+    Returns:
+        str: 'legacy' 또는 'prefix'. 지정하지 않으면 'legacy'.
+
+    Raises:
+        ValueError: 지원하지 않는 배치 방식인 경우.
+    """
+    layout = os.environ.get('LLM_PROMPT_LAYOUT', 'legacy')
+    if layout not in PROMPT_LAYOUTS:
+        raise ValueError(f"지원하지 않는 LLM_PROMPT_LAYOUT입니다: {layout} (가능한 값: {', '.join(PROMPT_LAYOUTS)})")
+    return layout
+
+# 응답 토큰 수 확인 함수
+def usage_total_tokens(response):
+    """
+    LLM 응답 메타데이터에서 사용한 총 토큰 수를 꺼냅니다.
+
+    Args:
+        response (AIMessage): LLM 응답.
+
+    Returns:
+        int 또는 None: 총 토큰 수. 메타데이터가 없으면 None.
+    """
+    try:
+        return response.usage_metadata['total_tokens']
+    except:
+        return None
+
+# 캐시된 프롬프트 토큰 수 확인 함수
+def usage_cached_tokens(response):
+    """
+    LLM 응답 메타데이터에서 제공자 쪽 프롬프트 캐시로 처리된 입력 토큰 수를 꺼냅니다.
+
+    Args:
+        response (AIMessage): LLM 응답.
+
+    Returns:
+        int: 캐시된 입력 토큰 수. 메타데이터에 없으면 0.
+    """
+    try:
+        return response.usage_metadata['input_token_details'].get('cache_read') or 0
+    except:
+        return 0
+
+
+class LLMStage(ABC):
+    """
+    프롬프트, LLM 클라이언트, 출력 파서를 한 번 만들어 두고 재사용하는 LLM 처리 단계 클래스.
+
+    클라이언트를 매번 새로 만들지 않으므로 HTTP 연결 풀이 유지됩니다.
+    하위 클래스는 make_result()로 응답을 결과로 바꾸고, 필요하면 on_error()로 오류 시 기본값을 정합니다.
+    응답 캐시(LLMResponseCache)를 주면 파싱에 성공한 응답을 저장해 두고, 같은 입력은 LLM을 호출하지 않고 재사용합니다.
+    """
+
+    def __init__(self, prompt, llm, parser, tags=None, cache=None) -> None:
+        """
+        LLMStage 초기화 메서드.
+
+        Args:
+            prompt (PromptTemplate): {context} 변수를 가진 프롬프트 템플릿.
+            llm (BaseChatModel): LLM 클라이언트 (ChatOpenAI, ChatOllama 등).
+            parser (BaseOutputParser): 응답 파서.
+            tags (List[str]): LLM 실행 태그. 선택 사항.
+            cache (LLMResponseCache): 응답 캐시. 선택 사항.
+        """
+        self.prompt = prompt
+        self.llm = llm
+        self.parser = parser
+        self.config = RunnableConfig(tags=tags) if tags else None
+        self.cache = cache
+        self.usage = collections.Counter()  # calls, input_tokens, cached_tokens
+
+    def format_prompt(self, text: str) -> str:
+        """
+        공고 텍스트를 넣어 LLM에 보낼 프롬프트를 만듭니다.
+
+        Args:
+            text (str): 공고 텍스트 또는 요약문.
+
+        Returns:
+            str: 완성된 프롬프트.
+        """
+        return self.prompt.format(context=text)
+
+    def cached_response(self, text):
+        """
+        응답 캐시에서 같은 입력의 응답을 찾습니다.
+
+        Args:
+            text (str): 공고 텍스트 또는 요약문.
+
+        Returns:
+            AIMessage 또는 None: 저장된 응답. 캐시가 없거나 저장된 응답이 없으면 None.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(self.llm, self.prompt, text)
+
+    def store_response(self, text, response) -> None:
+        """
+        파싱에 성공한 응답을 응답 캐시에 저장합니다.
+
+        Args:
+            text (str): 공고 텍스트 또는 요약문.
+            response (AIMessage): LLM 응답.
+        """
+        if self.cache is not None:
+            self.cache.put(self.llm, self.prompt, text, response)
+
+    def record_usage(self, response) -> None:
+        """
+        LLM 호출 한 번의 입력 토큰 수와 캐시된 입력 토큰 수를 누적합니다. (응답 캐시에서 꺼낸 응답은 제외)
+
+        Args:
+            response (AIMessage): LLM 응답.
+        """
+        usage = getattr(response, 'usage_metadata', None) or {}
+        self.usage['calls'] += 1
+        self.usage['input_tokens'] += usage.get('input_tokens') or 0
+        self.usage['cached_tokens'] += usage_cached_tokens(response)
+
+    def usage_stats(self) -> dict:
+        """
+        누적한 토큰 사용량을 반환합니다.
+
+        Returns:
+            dict: calls(LLM 호출 수), input_tokens, cached_tokens, cached_ratio(입력 토큰 중 캐시된 비율).
+        """
+        stats = {key: self.usage[key] for key in ('calls', 'input_tokens', 'cached_tokens')}
+        stats['cached_ratio'] = round(stats['cached_tokens'] / stats['input_tokens'], 3) if stats['input_tokens'] else 0.0
+        return stats
+
+    @abstractmethod
+    def make_result(self, text, response, start_time):
+        """
+        LLM 응답을 파싱하여 단계 결과를 만듭니다.
+
+        Args:
+            text (str): 입력 텍스트.
+            response (AIMessage): LLM 응답.
+            start_time (float): LLM 호출 시작 시각 (time.time()).
+
+        Returns:
+            tuple: 단계별 결과.
+        """
+
+    def on_error(self, text, error):
+        """
+        LLM 호출이나 응답 파싱에 실패했을 때의 결과를 정합니다. 기본 동작은 예외를 그대로 전달합니다.
+
+        Args:
+            text (str): 입력 텍스트.
+            error (Exception): 발생한 예외.
+
+        Returns:
+            tuple: 오류 시 반환할 결과.
+        """
+        raise error
+
+    def run(self, text):
+        """
+        텍스트 하나를 처리합니다.
+
+        Args:
+            text (str): 공고 텍스트 또는 요약문.
+
+        Returns:
+            tuple: make_result() 또는 on_error()의 결과.
+        """
+        try:
+            start_time = time.time()
+            cached = self.cached_response(text)
+            if cached is None:
+                response = self.llm.invoke(self.format_prompt(text), config=self.config)
+                self.record_usage(response)
+            else:
+                response = cached
+            result = self.make_result(text, response, start_time)
+            if cached is None:
+                self.store_response(text, response)
+            return result
+        except Exception as e:
+            return self.on_error(text, e)
+
+    def run_many(self, texts, max_concurrency=None):
+        """
+        여러 텍스트를 llm.batch()로 한 번에 처리합니다.
+
+        실행 시간은 배치 시작부터 각 결과를 파싱한 시점까지의 시간입니다.
+        응답 캐시에 있는 텍스트는 배치에 넣지 않습니다.
+        on_error()가 예외를 전달하는 단계에서는 실패한 항목 자리에 예외 객체가 들어갑니다.
+
+        Args:
+            texts (Iterable[str]): 공고 텍스트 또는 요약문 목록.
+            max_concurrency (int): 동시에 보낼 최대 요청 수. None이면 제한하지 않습니다.
+
+        Returns:
+            List: 입력 순서대로 결과 리스트.
+        """
+        texts = list(texts)
+        config = dict(self.config or {})
+        if max_concurrency is not None:
+            config['max_concurrency'] = max_concurrency
+        start_time = time.time()
+        cached = [self.cached_response(text) for text in texts]
+        missing = [text for text, response in zip(texts, cached) if response is None]
+        responses = iter(self.llm.batch(
+            [self.format_prompt(text) for text in missing], config=config or None, return_exceptions=True
+        ) if missing else [])
+        return [
+            self.finish(text, next(responses), start_time) if response is None
+            else self.finish(text, response, start_time, cached=True)
+            for text, response in zip(texts, cached)
+        ]
+
+    def finish(self, text, response, start_time, cached=False):
+        """
+        LLM 응답 또는 호출 중 발생한 예외를 단계 결과로 바꿉니다. (run_many()와 비동기 실행기에서 사용)
+
+        Args:
+            text (str): 입력 텍스트.
+            response (AIMessage 또는 Exception): LLM 응답 또는 호출 중 발생한 예외.
+            start_time (float): LLM 호출 시작 시각 (time.time()).
+            cached (bool): 응답 캐시에서 꺼낸 응답이면 True. (다시 저장하지 않음)
+
+        Returns:
+            tuple 또는 Exception: 단계 결과. on_error()가 예외를 전달하면 그 예외 객체.
+        """
+        try:
+            if isinstance(response, Exception):
+                raise response
+            if not cached:
+                self.record_usage(response)
+            result = self.make_result(text, response, start_time)
+            if not cached:
+                self.store_response(text, response)
+            return result
+        except Exception as e:
+            try:
+                return self.on_error(text, e)
+            except Exception as error:
+                return error
@@ -0,0 +1,220 @@
+import os
+import json
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode
+
+# 나라장터 입찰공고 용역 조회 API 주소 및 서비스 키
+BID_NOTICE_API_URL = 'http://apis.data.go.kr/1230000/ad/BidPublicInfoService/getBidPblancListInfoServcPPSSrch'
+SERVICE_KEY = 'Qa6CXT4r6qEr%2BkQt%2FJx6wJr5MPx45hKNJwNTScoYryT2uGz7GozIqpjBw%2FRMk1uE8l92NU7h89m20sa%2FXHKuaQ%3D%3D'
+# 워터마크 저장에 사용하는 조회 유형 이름
+BID_NOTICE_QUERY_TYPE = 'getBidPblancListInfoServcPPSSrch'
+
+# HTTP 세션 설정 함수
+def session_setting(pool_size=8, max_retries=3):
+    """
+    Keep-alive 연결을 재사용하는 HTTP 세션을 생성합니다.
+
+    Args:
+        pool_size (int): 호스트별로 유지할 최대 연결 수.
+        max_retries (int): 연결 실패 시 재시도 횟수.
+
+    Returns:
+        session(requests.Session): 연결 풀이 설정된 세션 객체.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# 공고 목록 페이지 조회 함수
+def fetch_notice_page(session, page_no, bgn_dt, end_dt, num_of_rows=500,
+                      api_url=BID_NOTICE_API_URL, service_key=SERVICE_KEY, timeout=30):
+    """
+    입찰공고 API의 한 페이지를 조회합니다.
+
+    Args:
+        session (requests.Session): 요청에 사용할 HTTP 세션.
+        page_no (int): 조회할 페이지 번호 (1부터 시작).
+        bgn_dt (str): 조회 시작 일시 (YYYYMMDDHHMM).
+        end_dt (str): 조회 종료 일시 (YYYYMMDDHHMM).
+        num_of_rows (int): 페이지당 공고 수.
+        api_url (str): API 주소. 로컬 테스트 서버 주소로 바꿀 수 있습니다.
+        service_key (str): URL 인코딩된 서비스 키.
+        timeout (float): 요청 제한 시간 (초).
+
+    Returns:
+        body(dict): 응답의 'body' 항목 (items, totalCount, numOfRows 등).
+    """
+    params = {
+        'pageNo': page_no,
+        'numOfRows': num_of_rows,
+        'inqryDiv': 1,
+        'inqryBgnDt': bgn_dt,
+        'inqryEndDt': end_dt,
+        'type': 'json',
+    }
+    # 서비스 키는 이미 인코딩되어 있으므로 그대로 붙임
+    url = '{}?serviceKey={}&{}'.format(api_url, service_key, urlencode(params))
+    response = session.get(url, timeout=timeout)
+    response.raise_for_status()
+    contents = json.loads(response.content)
+    return contents['response']['body']
+
+class NoticePageCache:
+    """
+    조회한 공고 목록을 페이지 단위로 JSON Lines 파일에 이어 쓰는 캐시 클래스.
+
+    완료된 페이지 번호와 파일 크기를 작은 manifest 파일에 기록하므로, 조회가 중간에
+    중단되어도 다음 실행에서 남은 페이지만 이어서 조회할 수 있습니다.
+    공고는 iter_items()로 한 줄씩 읽어 전체 목록을 메모리에 올리지 않습니다.
+    """
+
+    def __init__(self, cache_dir: str, name: str = 'item_list') -> None:
+        """
+        NoticePageCache 초기화 메서드.
+
+        Args:
+            cache_dir (str): 캐시 파일을 저장할 디렉토리 경로.
+            name (str): 캐시 파일 이름 (확장자 제외).
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.items_path = os.path.join(cache_dir, name + '.jsonl')
+        self.manifest_path = os.path.join(cache_dir, name + '.manifest.json')
+        self.manifest = None
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r', encoding='utf-8') as file:
+                self.manifest = json.load(file)
+
+    def unfinished_window(self) -> tuple:
+        """
+        처리가 끝나지 않은 이전 조회 기간을 반환합니다.
+
+        Returns:
+            tuple 또는 None: (조회 시작 일시, 조회 종료 일시). 없으면 None.
+        """
+        if self.manifest is None or self.manifest['done']:
+            return None
+        return self.manifest['bgn_dt'], self.manifest['end_dt']
+
+    def open_window(self, bgn_dt: str, end_dt: str) -> None:
+        """
+        조회 기간의 캐시를 엽니다. 같은 기간의 캐시가 있으면 완료된 페이지까지 이어서 사용합니다.
+
+        Args:
+            bgn_dt (str): 조회 시작 일시 (YYYYMMDDHHMM).
+            end_dt (str): 조회 종료 일시 (YYYYMMDDHHMM).
+        """
+        manifest = self.manifest
+        if manifest is None or (manifest['bgn_dt'], manifest['end_dt']) != (bgn_dt, end_dt):
+            manifest = {'bgn_dt': bgn_dt, 'end_dt': end_dt, 'total_count': None, 'pages': None,
+                        'completed': [], 'size': 0, 'done': False}
+        # 마지막으로 완료된 페이지 이후에 쓰다 만 내용 제거
+        with open(self.items_path, 'a+b') as file:
+            file.truncate(manifest['size'])
+        self.manifest = manifest
+        self._save_manifest()
+
+    def _save_manifest(self) -> None:
+        """manifest를 임시 파일에 쓴 뒤 교체하여 저장합니다."""
+        temp_path = self.manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.manifest, file, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+
+    @property
+    def total_count(self) -> int:
+        """조회 기간의 전체 공고 수. 첫 페이지를 조회하기 전에는 None."""
+        return self.manifest['total_count']
+
+    def pending_pages(self) -> list:
+        """아직 저장되지 않은 페이지 번호 목록을 반환합니다."""
+        completed = set(self.manifest['completed'])
+        return [page_no for page_no in range(1, self.manifest['pages'] + 1) if page_no not in completed]
+
+    def set_page_count(self, total_count: int, num_of_rows: int) -> None:
+        """
+        첫 페이지 응답으로 전체 페이지 수를 기록합니다.
+
+        Args:
+            total_count (int): 전체 공고 수 (totalCount).
+            num_of_rows (int): 페이지당 공고 수 (numOfRows).
+        """
+        self.manifest['total_count'] = total_count
+        self.manifest['pages'] = total_count // num_of_rows + 1
+        self._save_manifest()
+
+    def append_page(self, page_no: int, items: list) -> None:
+        """
+        한 페이지의 공고를 JSON Lines로 이어 쓰고 완료된 페이지로 기록합니다.
+
+        Args:
+            page_no (int): 페이지 번호.
+            items (List[dict]): 페이지의 공고 목록.
+        """
+        with open(self.items_path, 'a', encoding='utf-8') as file:
+            for item in items:
+                file.write(json.dumps(item, ensure_ascii=False) + '\n')
+            file.flush()
+            os.fsync(file.fileno())
+            self.manifest['size'] = file.tell()
+        self.manifest['completed'].append(page_no)
+        self._save_manifest()
+
+    def is_complete(self) -> bool:
+        """조회 기간의 모든 페이지가 저장되었으면 True."""
+        return self.manifest['pages'] is not None and not self.pending_pages()
+
+    def mark_done(self) -> None:
+        """조회 기간의 공고 처리가 모두 끝났음을 기록합니다."""
+        self.manifest['done'] = True
+        self._save_manifest()
+
+    def iter_items(self):
+        """
+        저장된 공고를 한 줄씩 읽어 반환합니다.
+
+        Yields:
+            dict: 공고 항목.
+        """
+        if not os.path.exists(self.items_path):
+            return
+        with open(self.items_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                yield json.loads(line)
+
+# 전체 공고 목록 조회 함수
+def fetch_notice_pages(cache, num_of_rows=500, max_workers=8,
+                       api_url=BID_NOTICE_API_URL, service_key=SERVICE_KEY):
+    """
+    캐시에 열린 조회 기간의 남은 페이지를 병렬로 조회하여 페이지 순서대로 캐시에 이어 씁니다.
+
+    첫 페이지의 totalCount/numOfRows로 전체 페이지 수를 구한 뒤,
+    나머지 페이지는 하나의 세션을 공유하는 스레드 풀에서 동시에 조회합니다.
+    이미 캐시에 저장된 페이지는 다시 조회하지 않습니다.
+
+    Args:
+        cache (NoticePageCache): open_window()로 조회 기간을 연 캐시.
+        num_of_rows (int): 페이지당 공고 수.
+        max_workers (int): 동시에 조회할 최대 페이지 수.
+        api_url (str): API 주소.
+        service_key (str): URL 인코딩된 서비스 키.
+    """
+    bgn_dt, end_dt = cache.manifest['bgn_dt'], cache.manifest['end_dt']
+    with session_setting(pool_size=max_workers) as session:
+        def fetch(page_no):
+            return fetch_notice_page(session, page_no, bgn_dt, end_dt, num_of_rows, api_url, service_key)
+
+        # 첫 페이지로 전체 페이지 수 계산
+        if cache.manifest['pages'] is None:
+            body = fetch(1)
+            cache.set_page_count(body['totalCount'], body['numOfRows'])
+            cache.append_page(1, body['items'])
+
+        pending = cache.pending_pages()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # map은 제출 순서대로 결과를 반환하므로 페이지 순서가 유지됨
+            for page_no, body in zip(pending, executor.map(fetch, pending)):
+                cache.append_page(page_no, body['items'])
@@ -0,0 +1,338 @@
+import re
+import time
+import queue
+import threading
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from function_list.basic_options import selenium_setting,download_path_setting,BrowserSession
+from function_list.g2b_func import notice_file_check,folder_clear,select_download_files
+from function_list.download_watcher import DownloadWatcher
+from function_list.attachment_fetch import fetch_attachments
+from function_list.notice_api import session_setting
+
+# 작업자 종료 신호
+_WORKER_DONE = object()
+
+# 첨부파일 목록의 전체선택 체크박스
+ENTIRE_SELECT_SELECTOR = 'table > thead > tr:nth-child(1) >th:nth-child(1)> div >input[title="전체선택"]'
+# 전체선택 체크박스가 있는 첨부파일 목록의 행
+ATTACHMENT_ROW_XPATH = '//table[.//input[@title="전체선택"]]/tbody/tr'
+# 확장자로 끝나는 셀 텍스트 (첨부파일 이름 셀 찾기)
+FILE_NAME_PATTERN = re.compile(r'\.\w{2,5}$')
+
+# 첨부파일 목록 행 추출 함수
+def attachment_grid_rows(browser):
+    """
+    첨부파일 목록에서 행별 파일 이름과 선택 체크박스를 찾습니다.
+
+    Args:
+        browser (WebDriver): 공고 상세 페이지를 연 WebDriver 객체.
+
+    Returns:
+        rows(List[tuple]): (파일 이름, 체크박스 요소) 리스트. 목록을 읽지 못하면 빈 리스트.
+    """
+    rows = []
+    try:
+        for row in browser.find_elements(By.XPATH, ATTACHMENT_ROW_XPATH):
+            checkboxes = row.find_elements(By.CSS_SELECTOR, 'input[type="checkbox"]')
+            cell_texts = [cell.text.strip() for cell in row.find_elements(By.TAG_NAME, 'td')]
+            file_names = [text for text in cell_texts if FILE_NAME_PATTERN.search(text)]
+            if checkboxes and file_names:
+                rows.append((file_names[0], checkboxes[0]))
+    except Exception:
+        return []
+    return rows
+
+# 다운로드 링크 클릭 여부 확인 함수
+def wanted_download(name, selected):
+    """
+    링크 텍스트가 파일 이름이면 선택된 파일인지 확인합니다. 파일 이름이 아니면 기존처럼 내려받습니다.
+
+    Args:
+        name (str): 링크 텍스트.
+        selected (Set[str]): select_download_files()가 고른 파일 이름 집합.
+
+    Returns:
+        bool: 내려받아야 하면 True.
+    """
+    return not FILE_NAME_PATTERN.search(name) or name in selected
+
+# HTTP 첨부파일 수집 함수
+def notice_fetch(session, download_folder_path, attachments, store=None, parse_pool=None, extract_cache=None):
+    """
+    브라우저 없이 첨부파일 주소로 직접 내려받아 공고 내용을 추출합니다.
+
+    첨부파일 이름으로 select_download_files()가 고른 파일만 내려받습니다.
+
+    Args:
+        session (requests.Session): 요청에 사용할 HTTP 세션.
+        download_folder_path (str): 다운로드 폴더 경로.
+        attachments (List[dict]): notice_attachments()가 반환한 첨부파일 목록.
+        store (AttachmentStore): 첨부파일 저장소. 다운로드 폴더에는 저장소 파일이 연결됩니다.
+        parse_pool (ParsePool): 파일 파싱을 맡길 작업 프로세스 풀. 선택 사항.
+        extract_cache (ExtractionCache): 추출 결과 캐시. 선택 사항.
+
+    Returns:
+        str 또는 None: 공고 내용. 내려받을 첨부파일이 없거나, 다운로드에 실패하거나,
+            공고 파일을 찾지 못해 내용이 비어 있으면 None (브라우저로 다시 시도).
+    """
+    # 파일 이름으로 고른 첨부파일만 내려받음
+    selected = select_download_files(attachment['name'] for attachment in attachments)
+    attachments = [attachment for attachment in attachments if attachment['name'] in selected]
+    # 고른 파일이 없으면 상세 페이지의 제안요청정보에 공고 파일이 있을 수 있으므로 브라우저로 다시 시도
+    if not attachments:
+        return None
+    try:
+        folder_clear(download_folder_path)
+        fetch_attachments(session, attachments, download_folder_path, store)
+        text = notice_file_check(download_folder_path, parse_pool, extract_cache)
+    except Exception as e:
+        print(f"첨부파일 다운로드 실패: {e}")
+        text = None
+    folder_clear(download_folder_path)
+    # 공고 파일이 상세 페이지의 제안요청정보에만 있을 수 있으므로 빈 내용은 브라우저로 다시 시도
+    if text is None or not text.strip():
+        return None
+    return text
+
+# 공고 첨부파일 수집 함수
+def notice_scrape(browser, download_folder_path, notice_link, watcher, retry=10, parse_pool=None, extract_cache=None):
+    """
+    공고 상세 페이지에서 첨부파일을 내려받아 공고 내용을 추출합니다.
+
+    전체선택 대신 첨부파일 목록의 파일 이름으로 select_download_files()가 고른 파일만 선택해 내려받습니다.
+    목록에서 파일 이름을 읽지 못하면 기존처럼 전체선택으로 모두 내려받습니다.
+
+    Args:
+        browser (WebDriver): 사용할 Firefox WebDriver 객체.
+        download_folder_path (str): 브라우저의 다운로드 폴더 경로.
+        notice_link (str): 공고 상세 페이지 주소.
+        watcher (DownloadWatcher): 다운로드 폴더를 감시하는 객체.
+        retry (int): 최대 시도 횟수.
+        parse_pool (ParsePool): 파일 파싱을 맡길 작업 프로세스 풀. 선택 사항.
+        extract_cache (ExtractionCache): 추출 결과 캐시. 선택 사항.
+
+    Returns:
+        str 또는 None: 공고 내용. 모든 시도가 실패하면 None.
+    """
+    for k in range(retry):
+        try:
+            folder_clear(download_folder_path)
+            browser.get(notice_link)
+            WebDriverWait(browser, 10).until(
+                EC.invisibility_of_element_located((By.ID, "___processbar2"))  # 로딩 창의 ID를 사용
+            )
+            # 고정 대기 대신 첨부파일 목록이 그려질 때까지 대기
+            WebDriverWait(browser, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ENTIRE_SELECT_SELECTOR))
+            )
+        except:
+            pass
+        try:
+            alarm_btn = browser.find_element(by=By.CSS_SELECTOR,value="input[value='확인']")
+            alarm_btn.click()
+        except:
+            pass
+        # 다운로드 전에 파일 이름으로 공고 파일(없으면 ZIP 파일)만 고름
+        try:
+            download_elements = browser.find_elements(By.CSS_SELECTOR,value='td>nobr>a')
+        except:
+            download_elements = []
+        grid_rows = attachment_grid_rows(browser)
+        link_names = []
+        for element in download_elements:
+            try:
+                link_names.append(element.text.strip())
+            except:
+                link_names.append('')
+        file_names = [name for name in link_names if FILE_NAME_PATTERN.search(name)]
+        selected = set(select_download_files(file_names + [name for name, _ in grid_rows]))
+        try:
+            for element, name in zip(download_elements, link_names):
+                if not wanted_download(name, selected):
+                    continue
+                baseline = watcher.snapshot()
+                element.click()
+                watcher.wait_for_downloads(baseline)
+        except:
+            pass
+        try:
+            entire_files = WebDriverWait(browser, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ENTIRE_SELECT_SELECTOR))
+                )
+            if grid_rows:
+                checkboxes = [checkbox for name, checkbox in grid_rows if name in selected]
+            else:
+                # 첨부파일 목록을 읽지 못한 경우 기존처럼 전체 선택
+                checkboxes = [entire_files]
+            if checkboxes:
+                for checkbox in checkboxes:
+                    checkbox.click()
+                download_btn = browser.find_elements(By.CSS_SELECTOR, "input[value='다운로드']")[0]
+                baseline = watcher.snapshot()
+                download_btn.click()
+                watcher.wait_for_downloads(baseline)
+                try:
+                    alarm_btn = browser.find_element(by=By.CSS_SELECTOR,value="input[value='확인']")
+                    alarm_btn.click()
+                except Exception as e:
+                    pass
+            try:
+                rfp_btn = browser.find_element(by=By.CSS_SELECTOR,value='#mf_wfm_container_mainWframe_grdPrpsDmndInfoView_cell_0_2 > nobr:nth-child(1) > a:nth-child(1)')
+                if wanted_download(rfp_btn.text.strip(), selected):
+                    baseline = watcher.snapshot()
+                    rfp_btn.click()
+                    watcher.wait_for_downloads(baseline)
+            except:
+                pass
+            text = notice_file_check(download_folder_path, parse_pool, extract_cache)
+            folder_clear(download_folder_path)
+            return text
+        except Exception as e:
+            # print("download_error")
+            time.sleep(2)
+    return None
+
+# 브라우저 작업자 함수
+def _scrape_worker(worker_id, folder_path, task_queue, result_queue, direct_fetch=True, store=None, parse_pool=None,
+                   extract_cache=None, stop_event=None):
+    """
+    자신만의 브라우저와 다운로드 폴더로 작업 큐의 공고를 처리합니다.
+
+    direct_fetch가 True이면 첨부파일 주소로 먼저 직접 내려받고,
+    실패한 공고만 브라우저로 처리합니다. 브라우저는 처음 필요할 때 실행하고,
+    BrowserSession의 조건에 따라 재시작할 때까지 계속 재사용합니다.
+
+    Args:
+        worker_id (int): 작업자 번호. 다운로드 폴더 이름에 사용됩니다.
+        folder_path (str): 다운로드 폴더의 기본 디렉토리 경로.
+        task_queue (queue.Queue): 처리할 공고(dict)를 담은 큐. None을 받으면 종료합니다.
+        result_queue (queue.Queue): (공고, 공고 내용) 결과를 보낼 큐.
+        direct_fetch (bool): HTTP 직접 다운로드 사용 여부.
+        store (AttachmentStore): HTTP로 받은 첨부파일을 보관할 저장소. 선택 사항.
+        parse_pool (ParsePool): 파일 파싱을 맡길 작업 프로세스 풀. 선택 사항.
+        extract_cache (ExtractionCache): 추출 결과 캐시. 선택 사항.
+        stop_event (threading.Event): 설정되면 남은 공고를 처리하지 않고 종료합니다. 선택 사항.
+    """
+    browser_session = None
+    watcher = None
+    session = None
+    try:
+        firefox_options = selenium_setting()
+        firefox_options, download_folder_path = download_path_setting(
+            folder_path, firefox_options, f'notice_list_{worker_id}'
+        )
+        watcher = DownloadWatcher(download_folder_path)
+        browser_session = BrowserSession(firefox_options)
+        session = session_setting(pool_size=2)
+        while True:
+            notice = task_queue.get()
+            if notice is None or (stop_event is not None and stop_event.is_set()):
+                break
+            text = None
+            if direct_fetch:
+                text = notice_fetch(session, download_folder_path, notice.get('attachments', []), store, parse_pool,
+                                    extract_cache)
+            if text is None:
+                text = notice_scrape(browser_session.get(), download_folder_path, notice['link'], watcher,
+                                     parse_pool=parse_pool, extract_cache=extract_cache)
+                browser_session.notice_done()
+            result_queue.put((notice, text))
+    except Exception as e:
+        print(f"작업자 {worker_id} 오류: {e}")
+    finally:
+        if browser_session is not None:
+            browser_session.quit()
+        if watcher is not None:
+            watcher.close()
+        if session is not None:
+            session.close()
+        result_queue.put(_WORKER_DONE)
+
+# 병렬 공고 수집 함수
+def scrape_notices(notices, folder_path, worker_count=4, direct_fetch=True, store=None, parse_pool=None,
+                   extract_cache=None):
+    """
+    여러 브라우저 작업자가 공유 큐에서 공고를 가져가 병렬로 첨부파일을 수집합니다.
+
+    Args:
+        notices (Iterable[dict]): 'link'와 'attachments' 항목을 가진 공고 목록. 순서대로 큐에 넣습니다.
+        folder_path (str): 다운로드 폴더의 기본 디렉토리 경로.
+        worker_count (int): 동시에 실행할 작업자 수.
+        direct_fetch (bool): 브라우저 대신 첨부파일 주소로 먼저 내려받을지 여부.
+        store (AttachmentStore): 작업자들이 함께 사용할 첨부파일 저장소. 선택 사항.
+        parse_pool (ParsePool): 작업자들이 함께 사용할 파싱 작업 프로세스 풀. 없으면 각 작업자 스레드에서 파싱합니다.
+        extract_cache (ExtractionCache): 작업자들이 함께 사용할 추출 결과 캐시. 선택 사항.
+
+    Yields:
+        tuple: 처리가 끝난 순서대로 (공고, 공고 내용). 수집에 실패하면 공고 내용은 None.
+
+    사용하는 쪽이 중간에 멈추면(예외 또는 close()) 남은 공고를 버리고, 작업자가 브라우저를 닫고 끝날 때까지 기다립니다.
+    """
+    task_queue = queue.Queue(maxsize=worker_count * 2)
+    result_queue = queue.Queue()
+    stop_event = threading.Event()
+    fed_count = 0
+
+    def put(item):
+        # 멈춤 신호를 확인하면서 큐에 넣음 (멈추면 False)
+        while not stop_event.is_set():
+            try:
+                task_queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def feed():
+        nonlocal fed_count
+        for notice in notices:
+            if not put(notice):
+                return
+            fed_count += 1
+        for _ in range(worker_count):
+            put(None)  # 작업자별 종료 신호
+
+    feeder = threading.Thread(target=feed, daemon=True)
+    feeder.start()
+    workers = []
+    for worker_id in range(worker_count):
+        worker = threading.Thread(
+            target=_scrape_worker,
+            args=(worker_id, folder_path, task_queue, result_queue, direct_fetch, store, parse_pool, extract_cache,
+                  stop_event),
+            daemon=True,
+        )
+        worker.start()
+        workers.append(worker)
+
+    try:
+        done_count = 0
+        yielded_count = 0
+        while done_count < worker_count:
+            result = result_queue.get()
+            if result is _WORKER_DONE:
+                done_count += 1
+                continue
+            yielded_count += 1
+            yield result
+
+        # 모든 작업자가 비정상 종료되어 공고가 남은 경우
+        # (큐에 모두 넣은 뒤 작업자가 종료되어도 큐에 남은 공고가 있으면 오류)
+        if feeder.is_alive() or yielded_count < fed_count:
+            raise RuntimeError("모든 브라우저 작업자가 종료되어 남은 공고를 처리하지 못했습니다.")
+    finally:
+        # 공유 자원(파싱 풀, 저장소, 캐시)을 닫기 전에 작업자를 멈추고 브라우저 종료까지 기다림
+        stop_event.set()
+        feeder.join()
+        while True:
+            try:
+                task_queue.get_nowait()
+            except queue.Empty:
+                break
+        for worker in workers:
+            if worker.is_alive():
+                task_queue.put(None)
+        for worker in workers:
+            worker.join()
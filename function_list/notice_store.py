@@ -0,0 +1,128 @@
+import time
+import atexit
+import signal
+import threading
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+
+# 수집된 공고 ID 인덱스 함수
+def notice_id_index(collection):
+    """
+    notice_id 고유 인덱스를 만들고, 이미 수집된 공고 ID 집합을 반환합니다.
+
+    공고 본문(notice_text)은 읽지 않고 notice_id 필드만 조회합니다.
+
+    Args:
+        collection (Collection): 공고가 저장된 MongoDB 컬렉션.
+
+    Returns:
+        notice_ids(set): 이미 수집된 공고 ID 집합.
+    """
+    try:
+        collection.create_index('notice_id', unique=True)
+    except OperationFailure as e:
+        # 기존 데이터에 중복 ID가 있으면 고유 인덱스를 만들 수 없으므로 일반 인덱스 사용
+        print(f"notice_id 고유 인덱스 생성 실패: {e}")
+        collection.create_index('notice_id')
+
+    results = collection.find({}, {'_id': 0, 'notice_id': 1})
+    return {result['notice_id'] for result in results if 'notice_id' in result}
+
+# SIGTERM 종료 처리 함수
+def _exit_on_sigterm(signum, frame):
+    """SIGTERM을 SystemExit로 바꿔 with 문 정리와 atexit 저장이 실행되도록 합니다."""
+    raise SystemExit(128 + signum)
+
+
+class NoticeWriteBuffer:
+    """
+    수집한 공고를 모아 두었다가 bulk_write로 한 번에 저장하는 클래스.
+
+    notice_id를 기준으로 upsert하므로 재시도 등으로 같은 공고가 다시 들어와도
+    문서가 중복되지 않고 기존 문서가 갱신됩니다. with 문을 벗어날 때(오류 포함)
+    남은 공고를 모두 저장합니다.
+
+    수집이 느려져 add()가 호출되지 않아도 백그라운드 스레드가 flush_interval마다 저장하며,
+    SIGTERM을 받으면 정상 종료로 바꿔 남은 공고를 저장합니다.
+    """
+
+    def __init__(self, collection, batch_size: int = 100, flush_interval: float = 30) -> None:
+        """
+        NoticeWriteBuffer 초기화 메서드.
+
+        Args:
+            collection (Collection): 공고를 저장할 MongoDB 컬렉션.
+            batch_size (int): 모인 공고 수가 이 값에 도달하면 저장합니다.
+            flush_interval (float): 마지막 저장 후 이 시간(초)이 지나면 백그라운드 스레드가 저장합니다.
+        """
+        self.collection = collection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = {}  # notice_id -> 공고 (같은 공고는 마지막 값만 유지)
+        self._last_flush = time.monotonic()
+        self._lock = threading.RLock()  # add()와 백그라운드 저장이 버퍼를 함께 사용
+        self._stopped = threading.Event()
+        atexit.register(self.flush)  # 비정상 종료 시에도 남은 공고 저장
+        # SIGTERM은 atexit를 실행하지 않으므로 SystemExit로 바꿈 (다른 처리기가 없을 때만, 메인 스레드에서만 가능)
+        if (threading.current_thread() is threading.main_thread()
+                and signal.getsignal(signal.SIGTERM) is signal.SIG_DFL):
+            signal.signal(signal.SIGTERM, _exit_on_sigterm)
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """close()까지 flush_interval마다 마지막 저장 후 시간이 지났으면 저장합니다."""
+        while not self._stopped.wait(self.flush_interval):
+            if time.monotonic() - self._last_flush < self.flush_interval:
+                continue
+            try:
+                self.flush()
+            except Exception as e:
+                # 저장에 실패하면 버퍼를 유지하고 다음 주기에 다시 시도
+                print(f"공고 저장 실패: {e}")
+
+    def add(self, document: dict) -> None:
+        """
+        공고를 버퍼에 추가하고, 크기나 시간 조건을 만족하면 저장합니다.
+
+        Args:
+            document (dict): notice_id 항목을 가진 공고 문서.
+        """
+        with self._lock:
+            self._buffer[document['notice_id']] = document
+            if (len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self.flush()
+
+    def flush(self) -> int:
+        """
+        버퍼의 공고를 bulk_write upsert로 저장합니다. 실패하면 버퍼를 유지합니다.
+
+        Returns:
+            int: 저장한 공고 수.
+        """
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return 0
+            requests = [
+                UpdateOne({'notice_id': notice_id}, {'$set': document}, upsert=True)
+                for notice_id, document in self._buffer.items()
+            ]
+            self.collection.bulk_write(requests, ordered=False)
+            count = len(self._buffer)
+            self._buffer.clear()
+            return count
+
+    def close(self) -> None:
+        """백그라운드 저장을 멈추고, 남은 공고를 저장하고, 종료 시 저장 등록을 해제합니다."""
+        self._stopped.set()
+        self._flusher.join()
+        self.flush()
+        atexit.unregister(self.flush)
+
+    def __enter__(self) -> "NoticeWriteBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,55 @@
+class DocumentParseError(Exception):
+    """
+    공고 파일에서 텍스트를 추출하지 못했을 때 발생하는 오류의 기본 클래스.
+
+    Attributes:
+        source (str): 파일 경로 또는 파일 이름. 알 수 없으면 빈 문자열.
+    """
+
+    def __init__(self, message: str, source: str = "") -> None:
+        """
+        DocumentParseError 초기화 메서드.
+
+        Args:
+            message (str): 오류 메시지.
+            source (str): 파일 경로 또는 파일 이름.
+        """
+        super().__init__(message)
+        self.source = source
+
+
+class UnsupportedFileError(DocumentParseError):
+    """HWP, HWPX, PDF가 아닌 파일일 때 발생하는 오류."""
+
+
+class ParserFailedError(DocumentParseError):
+    """
+    파서가 예외를 일으켰을 때 발생하는 오류.
+
+    Attributes:
+        error_type (str): 파서에서 발생한 예외의 클래스 이름.
+    """
+
+    def __init__(self, message: str, source: str = "", error_type: str = "") -> None:
+        """
+        ParserFailedError 초기화 메서드.
+
+        Args:
+            message (str): 오류 메시지.
+            source (str): 파일 경로 또는 파일 이름.
+            error_type (str): 파서에서 발생한 예외의 클래스 이름.
+        """
+        super().__init__(message, source)
+        self.error_type = error_type
+
+
+class ParseTimeoutError(DocumentParseError):
+    """파일 하나의 처리 시간이 제한 시간을 넘었을 때 발생하는 오류."""
+
+
+class ParseMemoryError(DocumentParseError):
+    """파일을 처리하다가 작업 프로세스의 메모리 제한을 넘었을 때 발생하는 오류."""
+
+
+class WorkerCrashedError(DocumentParseError):
+    """파일을 처리하던 작업 프로세스가 결과 없이 종료되었을 때 발생하는 오류."""
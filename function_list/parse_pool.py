@@ -0,0 +1,314 @@
+import io
+import os
+import time
+import itertools
+import threading
+import collections
+import multiprocessing
+from concurrent.futures import Future
+from multiprocessing.connection import wait
+from function_list.parse_errors import (
+    DocumentParseError,
+    ParseMemoryError,
+    ParserFailedError,
+    ParseTimeoutError,
+    UnsupportedFileError,
+    WorkerCrashedError,
+)
+
+try:
+    import resource  # 유닉스 계열에서만 사용 가능
+except ImportError:
+    resource = None
+
+# 작업 프로세스가 준비되었음을 알리는 메시지
+_WORKER_READY = 'ready'
+
+# 파싱 작업 프로세스 함수
+def _parse_worker(conn, memory_limit_mb):
+    """
+    부모 프로세스에서 받은 파일을 파싱하여 결과를 돌려주는 작업 프로세스 함수.
+
+    파서 모듈을 불러온 뒤 주소 공간 크기(RLIMIT_AS)를 제한하고 준비 메시지를 보냅니다.
+    결과는 (작업 번호, 상태, 텍스트 또는 오류 메시지, 예외 이름) 형태로 보냅니다.
+
+    Args:
+        conn (Connection): 부모 프로세스와 연결된 파이프.
+        memory_limit_mb (int): 작업 프로세스의 메모리 제한 (MB). 0이면 제한하지 않습니다.
+    """
+    from function_list.g2b_func import extract_file_text
+
+    if resource is not None and memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError) as e:
+            print(f"파싱 작업 프로세스 메모리 제한 설정 실패: {e}")
+    conn.send(_WORKER_READY)
+
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:  # 종료 신호
+            break
+        task_id, source, max_chars, normalizer = task
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        try:
+            reply = (task_id, 'ok', extract_file_text(source, max_chars, normalizer), '')
+        except MemoryError:
+            reply = (task_id, 'memory', f"메모리 제한({memory_limit_mb}MB)을 넘었습니다.", 'MemoryError')
+        except UnsupportedFileError as e:
+            reply = (task_id, 'unsupported', str(e), type(e).__name__)
+        except ParserFailedError as e:
+            reply = (task_id, 'error', str(e), e.error_type)
+        except Exception as e:
+            reply = (task_id, 'error', str(e), type(e).__name__)
+        conn.send(reply)
+
+
+class _Worker:
+    """파싱 작업 프로세스 하나와 현재 맡은 작업을 관리하는 클래스."""
+
+    def __init__(self, context, memory_limit_mb: int) -> None:
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_parse_worker, args=(child_conn, memory_limit_mb), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False  # 파서 모듈을 모두 불러왔는지 여부
+        self.task = None  # (작업 번호, Future, 파일 이름, 마감 시각)
+
+    def stop(self, kill: bool = False) -> None:
+        """작업 프로세스를 종료합니다. kill이 True이면 즉시 강제 종료합니다."""
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+            self.process.join(5)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ParsePool:
+    """
+    공고 파일 파싱을 별도 작업 프로세스에서 실행하는 풀 클래스.
+
+    파일마다 제한 시간을 두어 넘으면 작업 프로세스를 강제 종료하고 새로 실행하며,
+    작업 프로세스의 메모리 사용량은 RLIMIT_AS로 제한합니다. 작업은 submit()으로 넣고
+    결과는 Future로 받으므로, 다운로드 스레드는 파싱을 기다리는 동안에도
+    다른 스레드의 다운로드가 계속 진행됩니다. 실패는 DocumentParseError 하위 예외로 전달됩니다.
+    """
+
+    def __init__(self, workers: int = 2, timeout: float = 60, memory_limit_mb: int = 2048) -> None:
+        """
+        ParsePool 초기화 메서드.
+
+        Args:
+            workers (int): 작업 프로세스 수.
+            timeout (float): 파일 하나의 최대 처리 시간 (초).
+            memory_limit_mb (int): 작업 프로세스별 메모리 제한 (MB). 0이면 제한하지 않습니다.
+        """
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.stats = collections.Counter()  # 처리 결과별 파일 수
+        # 스크래퍼 스레드가 실행 중인 프로세스에서 fork하지 않도록 spawn 사용
+        self._context = multiprocessing.get_context('spawn')
+        self._workers = [_Worker(self._context, memory_limit_mb) for _ in range(workers)]
+        self._pending = collections.deque()
+        self._task_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._broken = None  # 작업 프로세스를 시작할 수 없는 경우의 오류 메시지
+        self._wake_recv, self._wake_send = self._context.Pipe(duplex=False)
+        self._manager = threading.Thread(target=self._run, daemon=True)
+        self._manager.start()
+
+    def submit(self, source, max_chars: int = None, normalizer=None) -> Future:
+        """
+        파일 파싱 작업을 추가합니다.
+
+        Args:
+            source (str 또는 BinaryIO): 파일 경로 또는 파일 내용을 담은 바이너리 객체.
+            max_chars (int): 추출할 글자 수. None이면 전체를 추출합니다.
+            normalizer (TextNormalizer): 텍스트 정제 객체. 선택 사항.
+
+        Returns:
+            Future: 추출된 텍스트 또는 DocumentParseError를 담을 Future.
+        """
+        if isinstance(source, str):
+            name = payload = os.path.abspath(source)
+        else:
+            name = getattr(source, 'name', '')
+            payload = source.getvalue() if hasattr(source, 'getvalue') else source.read()
+        future = Future()
+        with self._lock:
+            if self._broken is not None:
+                raise WorkerCrashedError(self._broken, name)
+            if self._closed:
+                raise RuntimeError("종료된 ParsePool에는 작업을 추가할 수 없습니다.")
+            self._pending.append((next(self._task_ids), future, name, (payload, max_chars, normalizer)))
+            self._wake_send.send_bytes(b'')
+        return future
+
+    def parse(self, source, max_chars: int = None, normalizer=None) -> str:
+        """
+        파일을 파싱하고 결과를 기다립니다.
+
+        Args:
+            source (str 또는 BinaryIO): 파일 경로 또는 파일 내용을 담은 바이너리 객체.
+            max_chars (int): 추출할 글자 수. None이면 전체를 추출합니다.
+            normalizer (TextNormalizer): 텍스트 정제 객체. 선택 사항.
+
+        Returns:
+            str: 추출된 텍스트.
+
+        Raises:
+            DocumentParseError: 파싱에 실패한 경우 (유형별 하위 예외).
+        """
+        return self.submit(source, max_chars, normalizer).result()
+
+    def close(self, wait: bool = True) -> None:
+        """
+        남은 작업을 모두 처리한 뒤 작업 프로세스를 종료합니다.
+
+        Args:
+            wait (bool): 종료가 끝날 때까지 기다릴지 여부.
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._wake_send.send_bytes(b'')
+        if wait:
+            self._manager.join()
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        """작업 배정, 결과 수신, 제한 시간 확인, 작업 프로세스 재시작을 담당하는 관리 스레드."""
+        while True:
+            self._dispatch()
+            with self._lock:
+                idle = all(worker.task is None for worker in self._workers)
+                if self._closed and idle and (not self._pending or self._broken is not None):
+                    break
+
+            deadlines = [worker.task[3] for worker in self._workers if worker.task is not None]
+            timeout = max(0, min(deadlines) - time.monotonic()) if deadlines else None
+            waitables = [self._wake_recv]
+            for worker in self._workers:
+                waitables.extend([worker.conn, worker.process.sentinel])
+            ready = wait(waitables, timeout)
+
+            if self._wake_recv in ready:
+                while self._wake_recv.poll():
+                    self._wake_recv.recv_bytes()
+            for index, worker in enumerate(self._workers):
+                if worker.conn in ready:
+                    self._receive(worker)
+                if worker.task is not None and time.monotonic() >= worker.task[3]:
+                    self._fail(worker, ParseTimeoutError(
+                        f"{self.timeout}초 안에 처리하지 못했습니다.", worker.task[2]
+                    ), 'timeout')
+                    worker.stop(kill=True)
+                    self._workers[index] = _Worker(self._context, self.memory_limit_mb)
+                elif not worker.process.is_alive():
+                    self._replace(index)
+            if self._broken is not None:
+                # 처리 중이던 작업도 오류로 끝내고 종료
+                for worker in self._workers:
+                    if worker.task is not None:
+                        self._fail(worker, WorkerCrashedError(self._broken, worker.task[2]), 'crashed')
+                break
+
+        for worker in self._workers:
+            worker.stop()
+        self._wake_recv.close()
+        self._wake_send.close()
+
+    def _dispatch(self) -> None:
+        """준비된 작업 프로세스에 대기 중인 작업을 배정합니다."""
+        for worker in self._workers:
+            if not worker.ready or worker.task is not None:
+                continue
+            with self._lock:
+                if not self._pending:
+                    return
+                task_id, future, name, task = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue  # 취소된 작업
+            try:
+                worker.conn.send((task_id,) + task)
+            except (OSError, ValueError) as e:
+                # 작업 프로세스가 종료된 경우 (작업 프로세스는 _replace()에서 재시작)
+                future.set_exception(WorkerCrashedError(f"작업 전달 실패: {e}", name))
+                self.stats['crashed'] += 1
+                continue
+            worker.task = (task_id, future, name, time.monotonic() + self.timeout)
+
+    def _receive(self, worker: _Worker) -> None:
+        """작업 프로세스가 보낸 메시지를 받아 Future에 결과를 설정합니다."""
+        try:
+            message = worker.conn.recv()
+        except (EOFError, OSError):
+            return  # 종료된 작업 프로세스는 _replace()에서 처리
+        if message == _WORKER_READY:
+            worker.ready = True
+            return
+        task_id, status, payload, error_type = message
+        if worker.task is None or worker.task[0] != task_id:
+            return
+        name = worker.task[2]
+        if status == 'ok':
+            worker.task[1].set_result(payload)
+            worker.task = None
+            self.stats['ok'] += 1
+        elif status == 'memory':
+            self._fail(worker, ParseMemoryError(payload, name), 'memory')
+        elif status == 'unsupported':
+            self._fail(worker, UnsupportedFileError(payload, name), 'unsupported')
+        else:
+            self._fail(worker, ParserFailedError(payload, name, error_type), 'error')
+
+    def _fail(self, worker: _Worker, error: DocumentParseError, status: str) -> None:
+        """작업 프로세스가 맡은 작업을 오류로 끝냅니다."""
+        worker.task[1].set_exception(error)
+        worker.task = None
+        self.stats[status] += 1
+
+    def _replace(self, index: int) -> None:
+        """종료된 작업 프로세스를 새로 실행하고, 맡고 있던 작업은 오류로 끝냅니다."""
+        worker = self._workers[index]
+        exitcode = worker.process.exitcode
+        if worker.task is not None:
+            self._fail(worker, WorkerCrashedError(
+                f"작업 프로세스가 비정상 종료되었습니다 (exit code {exitcode}).", worker.task[2]
+            ), 'crashed')
+        worker.stop(kill=True)
+        if not worker.ready:
+            # 파서 모듈을 불러오기 전에 종료되면 재시작해도 같은 오류가 반복되므로 중단
+            self._break(f"파싱 작업 프로세스를 시작할 수 없습니다 (exit code {exitcode}).")
+            return
+        self._workers[index] = _Worker(self._context, self.memory_limit_mb)
+
+    def _break(self, message: str) -> None:
+        """풀을 사용할 수 없는 상태로 만들고 대기 중인 작업을 모두 오류로 끝냅니다."""
+        with self._lock:
+            self._broken = message
+            self._closed = True
+            pending, self._pending = self._pending, collections.deque()
+        for _, future, name, _ in pending:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(WorkerCrashedError(message, name))
@@ -0,0 +1,203 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Iterable
+
+# 정제 규칙 버전. 기본 정제 결과가 바뀌면 올려서 추출 결과 캐시를 무효화합니다.
+TEXT_NORMALIZE_VERSION = 1
+
+# 줄 앞의 글머리 기호 (하이픈은 뒤에 공백이 있을 때만 글머리 기호로 봄)
+BULLET_PATTERN = re.compile(
+    r"^[ \t]*(?:(?:[•●○◦▪▫■□◆◇▶▷►▸·∙‣⁃❍❏❑✓✔➢➤]|-(?=\s))[ \t]*)+", re.MULTILINE
+)
+
+# 줄 안의 연속된 공백
+WHITESPACE_PATTERN = re.compile(r"[^\S\n]+")
+# 줄 앞뒤 공백
+LINE_EDGE_SPACE_PATTERN = re.compile(r"^ | $", re.MULTILINE)
+
+# 기본 다국어 평면(BMP) 밖의 문자 (이모지, 확장 한자 등)
+ASTRAL_PATTERN = re.compile("[\U00010000-\U0010ffff]+")
+
+# BMP 제어 문자 범위 계산 함수
+@lru_cache(maxsize=None)
+def control_character_ranges() -> tuple:
+    """
+    기본 다국어 평면(BMP)에서 유니코드 범주가 C(Cc, Cf, Cs, Co, Cn)인 문자의 코드 범위를 계산합니다.
+
+    실행 중인 파이썬의 unicodedata 기준으로 한 번만 계산하므로,
+    문자마다 unicodedata.category를 호출하던 기존 방식과 같은 문자를 제거합니다.
+
+    Returns:
+        tuple: (시작 코드, 끝 코드) 범위의 튜플.
+    """
+    ranges = []
+    start = None
+    category = unicodedata.category
+    for code in range(0x10000):
+        if category(chr(code))[0] == "C":
+            if start is None:
+                start = code
+        elif start is not None:
+            ranges.append((start, code - 1))
+            start = None
+    if start is not None:
+        ranges.append((start, 0xFFFF))
+    return tuple(ranges)
+
+# 제거할 문자 정규식 생성 함수
+@lru_cache(maxsize=None)
+def removal_pattern(strip_cjk: bool, strip_control: bool, keep_newline: bool):
+    """
+    제거할 BMP 문자를 하나의 문자 클래스로 묶은 정규식을 만듭니다.
+
+    BMP 문자 클래스는 정규식 엔진이 비트맵으로 검사하므로 문자 수와 관계없이 빠릅니다.
+    U+FFFF를 넘는 범위를 섞으면 범위를 하나씩 비교하게 되므로 BMP 밖 문자는 따로 처리합니다.
+
+    Args:
+        strip_cjk (bool): 중국어 문자 제거 여부.
+        strip_control (bool): 제어 문자 제거 여부.
+        keep_newline (bool): 제어 문자 중 줄바꿈('\\n')은 남길지 여부.
+
+    Returns:
+        re.Pattern 또는 None: 제거할 문자가 없으면 None.
+    """
+    ranges = []
+    if strip_cjk:
+        ranges.append((0x4E00, 0x9FFF))  # CJK 통합 한자
+    if strip_control:
+        for low, high in control_character_ranges():
+            if keep_newline and low <= 0x0A <= high:
+                ranges.extend(r for r in ((low, 0x09), (0x0B, high)) if r[0] <= r[1])
+            else:
+                ranges.append((low, high))
+    if not ranges:
+        return None
+    character_class = "".join(
+        "\\u%04x" % low if low == high else "\\u%04x-\\u%04x" % (low, high)
+        for low, high in ranges
+    )
+    return re.compile("[%s]+" % character_class)
+
+# BMP 밖 제어 문자 제거 함수
+def _strip_astral_control(match) -> str:
+    """ASTRAL_PATTERN에 일치한 문자열에서 범주가 C인 문자를 제거합니다."""
+    return "".join(ch for ch in match.group() if unicodedata.category(ch)[0] != "C")
+
+# 문자 제거 함수
+def remove_characters(text: str, strip_cjk: bool, strip_control: bool, keep_newline: bool) -> str:
+    """
+    중국어 문자와 제어 문자를 제거합니다.
+
+    Args:
+        text (str): 입력 문자열.
+        strip_cjk (bool): 중국어 문자 제거 여부.
+        strip_control (bool): 제어 문자 제거 여부.
+        keep_newline (bool): 제어 문자 중 줄바꿈('\\n')은 남길지 여부.
+
+    Returns:
+        str: 문자가 제거된 문자열.
+    """
+    pattern = removal_pattern(strip_cjk, strip_control, keep_newline)
+    if pattern is not None:
+        text = pattern.sub("", text)
+    if strip_control:
+        # BMP 밖 문자는 드물기 때문에 일치한 부분만 문자별로 확인
+        text = ASTRAL_PATTERN.sub(_strip_astral_control, text)
+    return text
+
+
+class TextNormalizer:
+    """
+    추출한 문서 텍스트를 정제하는 클래스.
+
+    미리 컴파일한 정규식으로 문서 전체를 한 번에 처리합니다. 기본 설정은
+    기존 로더와 같이 중국어 문자와 제어 문자만 제거합니다.
+    """
+
+    def __init__(
+        self,
+        strip_cjk: bool = True,
+        strip_control: bool = True,
+        collapse_whitespace: bool = False,
+        clean_bullets: bool = False,
+    ) -> None:
+        """
+        TextNormalizer 초기화 메서드.
+
+        Args:
+            strip_cjk (bool): 중국어 문자 제거 여부.
+            strip_control (bool): 제어 문자 제거 여부. 줄 구분용 '\\n'은 남깁니다.
+            collapse_whitespace (bool): 연속된 공백을 하나로 줄이고 줄 앞뒤 공백을 제거할지 여부.
+            clean_bullets (bool): 줄 앞의 글머리 기호(•, ■, ▶, '- ' 등)를 제거할지 여부.
+        """
+        self.strip_cjk = strip_cjk
+        self.strip_control = strip_control
+        self.collapse_whitespace = collapse_whitespace
+        self.clean_bullets = clean_bullets
+
+    def normalize(self, text: str) -> str:
+        """
+        줄이 '\\n'으로 구분된 텍스트를 정제합니다.
+
+        Args:
+            text (str): 입력 텍스트.
+
+        Returns:
+            str: 정제된 텍스트.
+        """
+        # 정규식은 처음 사용할 때 한 번만 만들어짐
+        text = remove_characters(text, self.strip_cjk, self.strip_control, True)
+        if self.collapse_whitespace:
+            text = WHITESPACE_PATTERN.sub(" ", text)
+            text = LINE_EDGE_SPACE_PATTERN.sub("", text)
+        if self.clean_bullets:
+            text = BULLET_PATTERN.sub("", text)
+        return text
+
+    def normalize_lines(self, lines: Iterable[str]) -> str:
+        """
+        문단 텍스트 목록을 정제하여 '\\n'으로 이어 붙입니다.
+
+        제어 문자를 제거하는 경우 각 문단 안의 '\\n'은 먼저 제거하므로,
+        문단마다 정제한 뒤 이어 붙이는 것과 결과가 같습니다.
+
+        Args:
+            lines (Iterable[str]): 문단 텍스트 목록.
+
+        Returns:
+            str: 정제된 텍스트.
+        """
+        if self.strip_control:
+            lines = [line.replace("\n", "") for line in lines]
+        return self.normalize("\n".join(lines))
+
+
+# 로더에서 기본으로 사용하는 정제 객체 (기존 동작과 동일)
+DEFAULT_NORMALIZER = TextNormalizer()
+
+# 중국어 문자 제거 함수
+def remove_chinese_characters(s: str) -> str:
+    """
+    중국어 문자를 제거합니다.
+
+    Args:
+        s (str): 입력 문자열.
+
+    Returns:
+        str: 중국어 문자가 제거된 문자열.
+    """
+    return remove_characters(s, True, False, False)
+
+# 제어 문자 제거 함수
+def remove_control_characters(s: str) -> str:
+    """
+    제어 문자를 제거합니다. ('\\n'도 제어 문자로 제거됩니다.)
+
+    Args:
+        s (str): 입력 문자열.
+
+    Returns:
+        str: 제어 문자가 제거된 문자열.
+    """
+    return remove_characters(s, False, True, False)
@@ -0,0 +1,95 @@
+import re
+from datetime import datetime, timedelta
+
+# 조회 일시 형식 (API의 inqryBgnDt/inqryEndDt 형식)
+DATETIME_FORMAT = '%Y%m%d%H%M'
+
+# 공고 등록 일시 추출 함수
+def registered_at(item):
+    """
+    API 공고 항목에서 등록(게시) 일시를 YYYYMMDDHHMM 형식으로 추출합니다.
+
+    Args:
+        item (dict): 입찰공고 API의 공고 항목.
+
+    Returns:
+        str: 등록 일시 (YYYYMMDDHHMM). 값이 없으면 빈 문자열.
+    """
+    value = item.get('bidNtceDt') or item.get('rgstDt') or ''
+    return re.sub(r'\D', '', value)[:12]
+
+# 실패한 공고 직전 워터마크 계산 함수
+def watermark_before(registered):
+    """
+    실패한 공고가 다음 조회 기간에 다시 포함되도록, 그 등록 일시보다 1분 이전 시각을 계산합니다.
+
+    Args:
+        registered (str): 실패한 공고의 등록 일시 (YYYYMMDDHHMM).
+
+    Returns:
+        str: 1분 이전 일시 (YYYYMMDDHHMM).
+    """
+    return (datetime.strptime(registered, DATETIME_FORMAT) - timedelta(minutes=1)).strftime(DATETIME_FORMAT)
+
+# 워터마크 조회 함수
+def load_watermark(collection, query_type):
+    """
+    마지막으로 처리한 공고의 등록 일시(워터마크)를 조회합니다.
+
+    Args:
+        collection (Collection): 워터마크를 저장하는 MongoDB 컬렉션.
+        query_type (str): 조회 유형 이름.
+
+    Returns:
+        str 또는 None: 저장된 워터마크 (YYYYMMDDHHMM). 없으면 None.
+    """
+    document = collection.find_one({'query_type': query_type}, {'_id': 0, 'watermark': 1})
+    if document is None:
+        return None
+    return document.get('watermark')
+
+# 워터마크 저장 함수
+def save_watermark(collection, query_type, watermark):
+    """
+    워터마크를 저장합니다. 기존 값보다 이전 시각으로는 되돌리지 않습니다.
+
+    Args:
+        collection (Collection): 워터마크를 저장하는 MongoDB 컬렉션.
+        query_type (str): 조회 유형 이름.
+        watermark (str): 저장할 등록 일시 (YYYYMMDDHHMM).
+    """
+    # YYYYMMDDHHMM 문자열은 사전순과 시간순이 같으므로 $max로 역행을 막음
+    collection.update_one(
+        {'query_type': query_type},
+        {'$max': {'watermark': watermark}, '$set': {'updated_at': datetime.now()}},
+        upsert=True,
+    )
+
+# 조회 기간 계산 함수
+def collection_window(collection, query_type, bgn_dt=None, end_dt=None, default_days=7):
+    """
+    이번 수집에서 API에 요청할 조회 기간을 계산합니다.
+
+    bgn_dt가 주어지면 해당 기간을 그대로 재수집(backfill)하고,
+    없으면 저장된 워터마크부터 현재까지의 증분만 조회합니다.
+
+    Args:
+        collection (Collection): 워터마크를 저장하는 MongoDB 컬렉션.
+        query_type (str): 조회 유형 이름.
+        bgn_dt (str): 재수집 시작 일시 (YYYYMMDDHHMM). 선택 사항.
+        end_dt (str): 조회 종료 일시 (YYYYMMDDHHMM). 없으면 현재 시각.
+        default_days (int): 워터마크가 없을 때 조회할 기간 (일).
+
+    Returns:
+        tuple:
+            - bgn_dt (str): 조회 시작 일시.
+            - end_dt (str): 조회 종료 일시.
+    """
+    now = datetime.now()
+    if end_dt is None:
+        end_dt = now.strftime(DATETIME_FORMAT)
+    if bgn_dt is None:
+        bgn_dt = load_watermark(collection, query_type)
+    if bgn_dt is None:
+        bgn_dt = (now - timedelta(days=default_days)).strftime(DATETIME_FORMAT)
+    return bgn_dt, end_dt
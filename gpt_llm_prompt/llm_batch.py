@@ -0,0 +1,446 @@
+import os
+import json
+import time
+from abc import ABC, abstractmethod
+from langchain_core.messages import AIMessage
+from function_list.llm_stage import usage_cached_tokens
+from gpt_llm_prompt.llm_summary import summary_stage
+from gpt_llm_prompt.llm_cate_classification import category_classification_stage
+from gpt_llm_prompt.llm_it_notice_check import it_notice_check_stage
+
+# 배치 작업이 끝난 상태
+BATCH_DONE_STATUSES = frozenset(['completed', 'failed', 'expired', 'cancelled'])
+# 배치 요청 파일 하나에 넣을 최대 요청 수 (OpenAI Batch API 제한)
+BATCH_MAX_REQUESTS = 50000
+# 배치 요청 파일 하나의 최대 크기 (OpenAI Batch API는 200MB를 넘는 입력 파일을 거부하므로 여유를 둠)
+BATCH_MAX_BYTES = 190 * 1024 ** 2
+
+
+class BatchProvider(ABC):
+    """
+    JSONL 배치 요청 파일을 제출하고 결과를 받아오는 배치 작업 제공자 인터페이스.
+
+    결과 줄은 OpenAI Batch API의 출력 형식({"custom_id", "response": {"status_code", "body"}, "error"})을 따릅니다.
+    """
+
+    @abstractmethod
+    def submit(self, requests_path: str) -> str:
+        """
+        배치 요청 파일을 제출합니다.
+
+        Args:
+            requests_path (str): JSONL 배치 요청 파일 경로.
+
+        Returns:
+            str: 배치 작업 ID.
+        """
+
+    @abstractmethod
+    def status(self, batch_id: str) -> str:
+        """
+        배치 작업 상태를 확인합니다.
+
+        Args:
+            batch_id (str): 배치 작업 ID.
+
+        Returns:
+            str: 'validating', 'in_progress', 'completed', 'failed' 등 상태.
+        """
+
+    @abstractmethod
+    def results(self, batch_id: str):
+        """
+        끝난 배치 작업의 결과 줄을 차례로 반환합니다. 만료되거나 취소된 배치는 그 전에 끝난 요청의 결과만 반환합니다.
+
+        Args:
+            batch_id (str): 배치 작업 ID.
+
+        Yields:
+            dict: 결과 줄.
+        """
+
+
+class OpenAIBatchProvider(BatchProvider):
+    """OpenAI Batch API(/v1/chat/completions, 24시간 완료 창)를 사용하는 배치 작업 제공자."""
+
+    def __init__(self, client=None) -> None:
+        """
+        OpenAIBatchProvider 초기화 메서드.
+
+        Args:
+            client (openai.OpenAI): OpenAI 클라이언트. None이면 환경 변수의 API 키로 만듭니다.
+        """
+        if client is None:
+            from openai import OpenAI
+            client = OpenAI()
+        self.client = client
+
+    def submit(self, requests_path: str) -> str:
+        with open(requests_path, 'rb') as f:
+            input_file = self.client.files.create(file=f, purpose='batch')
+        batch = self.client.batches.create(
+            input_file_id=input_file.id, endpoint='/v1/chat/completions', completion_window='24h'
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> str:
+        return self.client.batches.retrieve(batch_id).status
+
+    def results(self, batch_id: str):
+        batch = self.client.batches.retrieve(batch_id)
+        # 성공한 요청은 output_file, 실패한 요청은 error_file에 기록됨
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in self.client.files.content(file_id).text.splitlines():
+                if line.strip():
+                    yield json.loads(line)
+
+
+class LocalBatchProvider(BatchProvider):
+    """
+    제출한 요청을 LangChain 채팅 모델로 바로 처리하는 배치 작업 제공자. (테스트와 로컬 모델용)
+
+    요청 본문의 메시지를 그대로 모델에 보내고, 결과는 OpenAI Batch API의 출력 형식으로 만듭니다.
+    """
+
+    def __init__(self, llm) -> None:
+        """
+        LocalBatchProvider 초기화 메서드.
+
+        Args:
+            llm (BaseChatModel): 요청을 처리할 채팅 모델 (ChatOllama, 가짜 모델 등).
+        """
+        self.llm = llm
+        self._batches = {}
+
+    def submit(self, requests_path: str) -> str:
+        with open(requests_path, encoding='utf-8') as f:
+            requests = [json.loads(line) for line in f if line.strip()]
+        messages = [[(m['role'], m['content']) for m in request['body']['messages']] for request in requests]
+        responses = self.llm.batch(messages, return_exceptions=True)
+
+        results = []
+        for request, response in zip(requests, responses):
+            if isinstance(response, Exception):
+                results.append({'custom_id': request['custom_id'], 'response': None,
+                                'error': {'code': type(response).__name__, 'message': str(response)}})
+                continue
+            usage = response.usage_metadata or {}
+            results.append({'custom_id': request['custom_id'], 'error': None, 'response': {
+                'status_code': 200,
+                'body': {
+                    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': response.content}}],
+                    'usage': {
+                        'prompt_tokens': usage.get('input_tokens', 0),
+                        'completion_tokens': usage.get('output_tokens', 0),
+                        'total_tokens': usage.get('total_tokens', 0),
+                        'prompt_tokens_details': {'cached_tokens': usage_cached_tokens(response)},
+                    },
+                },
+            }})
+        batch_id = f'local-batch-{len(self._batches)}'
+        self._batches[batch_id] = results
+        return batch_id
+
+    def status(self, batch_id: str) -> str:
+        return 'completed'
+
+    def results(self, batch_id: str):
+        yield from self._batches[batch_id]
+
+# 배치 결과를 LLM 응답으로 변환하는 함수
+def result_message(result):
+    """
+    배치 결과 줄을 대화형 호출과 같은 AIMessage로 바꿉니다.
+
+    Args:
+        result (dict): 배치 결과 줄.
+
+    Returns:
+        AIMessage 또는 None: LLM 응답. 요청이 실패했으면 None.
+    """
+    response = result.get('response')
+    if result.get('error') or not response or response.get('status_code') != 200:
+        return None
+    body = response['body']
+    usage = body.get('usage') or {}
+    usage_metadata = {
+        'input_tokens': usage.get('prompt_tokens', 0),
+        'output_tokens': usage.get('completion_tokens', 0),
+        'total_tokens': usage.get('total_tokens', 0),
+    }
+    cached_tokens = (usage.get('prompt_tokens_details') or {}).get('cached_tokens')
+    if cached_tokens is not None:
+        usage_metadata['input_token_details'] = {'cache_read': cached_tokens}
+    return AIMessage(content=body['choices'][0]['message']['content'], usage_metadata=usage_metadata)
+
+
+class BatchPipeline:
+    """
+    IT 공고 판단 → 요약 → 기술 분류를 단계별 배치 작업으로 실행하고 결과를 MongoDB에 저장하는 클래스.
+
+    요약은 IT 공고로 판단된 공고만, 기술 분류는 요약 결과가 있어야 만들 수 있으므로 단계마다 배치를 제출합니다.
+    각 단계의 대상은 결과 컬렉션에서 다시 조회하므로, 중간에 멈추더라도 다시 실행하면 남은 단계부터 진행합니다.
+    제출한 배치는 batch_dir의 작업 목록 파일에 기록하므로, 결과를 기다리던 중 멈추면 다시 제출하지 않고 그 배치를 이어서 기다립니다.
+    프롬프트와 파서는 대화형 실행과 같은 LLM 단계(LLMStage)를 사용합니다.
+    """
+
+    def __init__(self, provider, dataset, collection, batch_dir='batch_jobs', poll_interval=30, timeout=None) -> None:
+        """
+        BatchPipeline 초기화 메서드.
+
+        Args:
+            provider (BatchProvider): 배치 작업 제공자.
+            dataset (Collection): notice_id와 notice_text를 가진 테스트 공고 컬렉션.
+            collection (Collection): 결과를 저장할 컬렉션.
+            batch_dir (str): 배치 요청 파일을 저장할 디렉토리.
+            poll_interval (float): 배치 상태 확인 간격 (초).
+            timeout (float): 배치 하나를 기다릴 최대 시간 (초). None이면 끝날 때까지 기다립니다.
+        """
+        self.provider = provider
+        self.dataset = dataset
+        self.collection = collection
+        self.batch_dir = batch_dir
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        os.makedirs(batch_dir, exist_ok=True)
+
+    def pending(self, phase):
+        """
+        단계별로 아직 결과가 없는 대상을 찾습니다.
+
+        Args:
+            phase (str): 'check', 'summary', 'category' 중 하나.
+
+        Returns:
+            List[tuple]: (notice_id, 입력 텍스트) 리스트.
+        """
+        if phase == 'check':
+            done = {i["notice_id"] for i in self.collection.find({}, {"_id": 0, "notice_id": 1})}
+            return [
+                (i["notice_id"], i["notice_text"])
+                for i in self.dataset.find({}, {"_id": 0, "notice_id": 1, "notice_text": 1})
+                if i["notice_id"] not in done and i.get('notice_text', '').replace('\n', '').replace(' ', '') != ''
+            ]
+        if phase == 'summary':
+            query = {"notice_check": {"$regex": "^true$", "$options": "i"}, "summary": {"$exists": False}}
+            return [(i["notice_id"], i["notice_text"])
+                    for i in self.collection.find(query, {"_id": 0, "notice_id": 1, "notice_text": 1})]
+        query = {"summary": {"$exists": True}, "category": {"$exists": False}}
+        return [(i["notice_id"], i["summary"]) for i in self.collection.find(query, {"_id": 0, "notice_id": 1, "summary": 1})]
+
+    def write_requests(self, phase, stage, items):
+        """
+        대상 목록을 JSONL 배치 요청 파일로 저장합니다.
+
+        Args:
+            phase (str): 단계 이름.
+            stage (LLMStage): 프롬프트와 모델 설정을 가진 LLM 단계.
+            items (List[tuple]): (notice_id, 입력 텍스트) 리스트.
+
+        Returns:
+            List[str]: 요청 파일 경로 리스트 (BATCH_MAX_REQUESTS개 또는 BATCH_MAX_BYTES를 넘지 않게 나눔).
+        """
+        model = getattr(stage.llm, 'model_name', None) or getattr(stage.llm, 'model', None)
+        temperature = getattr(stage.llm, 'temperature', None)
+        prefix = f'{phase}_{int(time.time())}'
+        paths = []
+        f = None
+        try:
+            for notice_id, text in items:
+                body = {'model': model, 'messages': [{'role': 'user', 'content': stage.format_prompt(text)}]}
+                if temperature is not None:
+                    body['temperature'] = temperature
+                request = {'custom_id': f'{phase}-{notice_id}', 'method': 'POST', 'url': '/v1/chat/completions',
+                           'body': body}
+                line = (json.dumps(request, ensure_ascii=False) + '\n').encode('utf-8')
+                # 요청 수나 파일 크기 제한에 닿으면 새 파일을 시작
+                if f is None or count >= BATCH_MAX_REQUESTS or size + len(line) > BATCH_MAX_BYTES:
+                    if f is not None:
+                        f.close()
+                    paths.append(os.path.join(self.batch_dir, f'{prefix}_{len(paths)}.jsonl'))
+                    f = open(paths[-1], 'wb')
+                    count = size = 0
+                f.write(line)
+                count += 1
+                size += len(line)
+        finally:
+            if f is not None:
+                f.close()
+        return paths
+
+    def wait(self, batch_id):
+        """
+        배치 작업이 끝날 때까지 상태를 확인합니다.
+
+        Args:
+            batch_id (str): 배치 작업 ID.
+
+        Returns:
+            str: 마지막 상태.
+        """
+        start = time.monotonic()
+        while True:
+            status = self.provider.status(batch_id)
+            if status in BATCH_DONE_STATUSES:
+                return status
+            if self.timeout is not None and time.monotonic() - start > self.timeout:
+                raise TimeoutError(f"배치 작업 {batch_id}이(가) {self.timeout}초 안에 끝나지 않았습니다.")
+            time.sleep(self.poll_interval)
+
+    def jobs_path(self, phase):
+        """단계별로 제출했지만 결과를 아직 반영하지 않은 배치 작업 목록 파일 경로."""
+        return os.path.join(self.batch_dir, f'{phase}_jobs.json')
+
+    def load_jobs(self, phase):
+        """
+        이전 실행에서 제출했지만 결과를 반영하지 못한 배치 작업을 읽습니다.
+
+        Args:
+            phase (str): 단계 이름.
+
+        Returns:
+            List[dict]: batch_id와 요청 파일 경로(path)를 가진 작업 목록.
+        """
+        path = self.jobs_path(phase)
+        if not os.path.exists(path):
+            return []
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_jobs(self, phase, jobs):
+        """
+        배치 작업 목록을 저장합니다. (임시 파일에 쓴 뒤 교체하여 중간에 멈춰도 목록이 깨지지 않음)
+
+        Args:
+            phase (str): 단계 이름.
+            jobs (List[dict]): batch_id와 요청 파일 경로(path)를 가진 작업 목록.
+        """
+        path = self.jobs_path(phase)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(jobs, f, ensure_ascii=False)
+        os.replace(path + '.tmp', path)
+
+    def finish_job(self, phase, stage, ingest, job, texts, stats):
+        """
+        배치 작업이 끝날 때까지 기다린 뒤 결과를 파싱하여 저장하고, 작업 목록에서 지웁니다.
+
+        Args:
+            phase (str): 단계 이름.
+            stage (LLMStage): 프롬프트와 파서를 가진 LLM 단계.
+            ingest (Callable): (notice_id, 입력 텍스트, 단계 결과)를 받아 저장하는 함수.
+            job (dict): batch_id와 요청 파일 경로(path)를 가진 작업.
+            texts (dict): notice_id -> 입력 텍스트. 없는 공고는 이미 저장된 것으로 보고 건너뜁니다.
+            stats (dict): 갱신할 단계 실행 통계.
+        """
+        batch_id = job['batch_id']
+        status = self.wait(batch_id)
+        print(f"{phase} 배치 {batch_id}: {status}")
+        request_count = 0
+        if os.path.exists(job['path']):
+            with open(job['path'], encoding='utf-8') as f:
+                request_count = sum(1 for line in f if line.strip())
+        # 만료(expired)·취소(cancelled)된 배치도 그 전에 끝난 요청의 결과는 있으므로 상태와 관계없이 결과를 읽음
+        # 결과가 없는 요청은 실패로 셈
+        for result in self.provider.results(batch_id):
+            request_count -= 1
+            notice_id = result['custom_id'].split('-', 1)[1]
+            if notice_id not in texts:
+                continue
+            text = texts[notice_id]
+            message = result_message(result)
+            try:
+                if message is None:
+                    raise ValueError(f"배치 요청 실패: {result.get('error')}")
+                stage.record_usage(message)
+                ingest(notice_id, text, stage.make_result(text, message, time.time()))
+                stage.store_response(text, message)
+                stats['saved'] += 1
+            except Exception as e:
+                print(f"{phase} 결과 처리 실패 ({notice_id}): {e}")
+                stats['failed'] += 1
+        stats['failed'] += max(0, request_count)
+        self.save_jobs(phase, [i for i in self.load_jobs(phase) if i['batch_id'] != batch_id])
+
+    def run_phase(self, phase, stage, ingest):
+        """
+        한 단계의 대상을 배치로 제출하고, 결과를 파싱하여 저장합니다.
+
+        이전 실행에서 제출한 배치가 작업 목록에 남아 있으면 먼저 그 배치를 이어서 기다려 반영합니다.
+        요청 파일이 여러 개이면 모두 제출한 뒤에 차례로 기다려 반영합니다.
+        응답이 없거나 파싱에 실패한 대상은 저장하지 않으므로 다음 실행의 대상으로 남습니다.
+        단계에 응답 캐시가 있으면 캐시에 있는 대상은 제출하지 않고, 파싱에 성공한 배치 응답은 캐시에 저장합니다.
+
+        Args:
+            phase (str): 단계 이름.
+            stage (LLMStage): 프롬프트와 파서를 가진 LLM 단계.
+            ingest (Callable): (notice_id, 입력 텍스트, 단계 결과)를 받아 저장하는 함수.
+
+        Returns:
+            dict: 단계 이름, 대상 수, 저장 수, 실패 수, 캐시 적중 수, 이어서 처리한 배치 수.
+        """
+        stats = {'phase': phase, 'requests': 0, 'saved': 0, 'failed': 0, 'cached': 0, 'resumed': 0}
+        for job in self.load_jobs(phase):
+            stats['resumed'] += 1
+            self.finish_job(phase, stage, ingest, job, dict(self.pending(phase)), stats)
+
+        items = []
+        for notice_id, text in self.pending(phase):
+            message = stage.cached_response(text)
+            if message is None:
+                items.append((notice_id, text))
+                continue
+            try:
+                ingest(notice_id, text, stage.make_result(text, message, time.time()))
+                stats['cached'] += 1
+                stats['saved'] += 1
+            except Exception as e:
+                print(f"{phase} 캐시 결과 처리 실패 ({notice_id}): {e}")
+                items.append((notice_id, text))
+        stats['requests'] = len(items)
+        texts = dict(items)
+        # 배치가 함께 처리되도록 요청 파일을 모두 제출한 뒤에 기다림
+        jobs = []
+        for path in self.write_requests(phase, stage, items):
+            jobs.append({'batch_id': self.provider.submit(path), 'path': path})
+            # 제출 중이나 기다리는 중에 멈춰도 다음 실행에서 다시 제출하지 않도록 바로 기록
+            self.save_jobs(phase, self.load_jobs(phase) + jobs[-1:])
+        for job in jobs:
+            self.finish_job(phase, stage, ingest, job, texts, stats)
+        return stats
+
+    def run(self):
+        """
+        IT 공고 판단, 요약, 기술 분류 단계를 차례로 실행합니다.
+
+        배치 결과에는 요청별 실행 시간이 없으므로 *_time 필드는 저장하지 않습니다.
+
+        Returns:
+            List[dict]: 단계별 실행 통계.
+        """
+        def ingest_check(notice_id, text, result):
+            it_notice_check, _, check_token = result
+            document = {"notice_id": notice_id, "notice_text": text,
+                        "notice_check": it_notice_check, "check_token": check_token}
+            if it_notice_check.lower() != 'true':
+                document["category"] = []
+            self.collection.update_one({"notice_id": notice_id}, {"$set": document}, upsert=True)
+
+        def ingest_summary(notice_id, text, result):
+            summary, _, summary_token = result
+            self.collection.update_one(
+                {"notice_id": notice_id}, {"$set": {"summary": summary, "summary_token": summary_token}}
+            )
+
+        def ingest_category(notice_id, text, result):
+            category_dict, _, _, category_token = result
+            self.collection.update_one(
+                {"notice_id": notice_id}, {"$set": {"category": category_dict, "category_token": category_token}}
+            )
+
+        return [
+            self.run_phase('check', it_notice_check_stage(), ingest_check),
+            self.run_phase('summary', summary_stage(), ingest_summary),
+            self.run_phase('category', category_classification_stage(), ingest_category),
+        ]
@@ -1,31 +1,14 @@
-from dotenv import load_dotenv  
 from langchain_openai import ChatOpenAI  
 from langchain_core.output_parsers import JsonOutputParser  
 from typing import List  
 from langchain_core.prompts import PromptTemplate  
+from functools import lru_cache
+from function_list.llm_stage import LLMStage, load_environment, prompt_layout
+from function_list.llm_cache import default_response_cache
 import time  
 
-def llm_category_classification(text) -> List[str]:
-    """
-    주어진 텍스트에서 IT 관련 기술을 분류하는 함수.
-
-    Args:
-        text (str): 공고 요약문 텍스트
-
-    Returns:
-        tuple:
-            - category_dict(List[dict]): 추출된 IT 기술 정보
-            - category_list(List[str]): 기술 카테고리 리스트
-            - execution_time(float): 분석 실행 시간
-            - token_usage(dict): LLM 응답 메타데이터
-    """
-    # 환경 변수 로드 (예: API 키)
-    load_dotenv()
-
-    # LLM에 전달할 프롬프트 생성
-    # IT 관련 기술 분류 조건과 출력 형식(JSON)을 명시
-    prompt = PromptTemplate.from_template(
-        """
+# 프롬프트 앞부분: 분류 조건과 IT 관련 기술 목록
+PROMPT_HEAD = """
         다음은 공고의 요약문입니다.  
         이 요약문에서 요구하는 **IT 관련 기술**(예시: 인공지능, 클라우드, 데이터베이스)을 분류해주세요.  
         단, 아래 조건을 반드시 준수하여 IT 관련 기술을 정확히 분류하세요:  
@@ -77,10 +60,16 @@ def llm_category_classification(text) -> List[str]:
                 미래 기술(양자 컴퓨팅, 5G 등)과 특수 목적의 새로운 IT 기술.
 
         
-        ### 제공된 공고 요약문 내용:
+        """
+
+# 공고 내용 블록
+PROMPT_CONTEXT = """### 제공된 공고 요약문 내용:
         {context}
 
-        ### 출력 형식(JSON):
+        """
+
+# 프롬프트 뒷부분: 출력 형식(JSON)과 주의사항
+PROMPT_TAIL = """### 출력 형식(JSON):
 
         ```
         “IT 관련 기술": [
@@ -95,29 +84,32 @@ def llm_category_classification(text) -> List[str]:
         - 기술의 이름이 명확히 언급되지 않았더라도, 기술적 활용이 구체적으로 암시된 경우에만 포함하세요.  
 
             """
-    )
 
-    # LLM 초기화
-    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0)
+# LLM에 전달할 프롬프트
+# IT 관련 기술 분류 조건과 출력 형식(JSON)을 명시
+PROMPT_TEMPLATE = PROMPT_HEAD + PROMPT_CONTEXT + PROMPT_TAIL
 
-    # IT 관련 기술 카테고리 리스트 정의
-    it_tech_list = [
-        '인공지능', '데이터베이스', '클라우드 컴퓨팅', '소프트웨어 개발 및 관리',
-        '네트워크 및 보안', 'IoT', '블록체인', 'AR/VR 및 메타버스'
-    ]
+# 프롬프트 배치 방식별 템플릿 (prefix는 고정 지침을 앞에 두고 공고 내용을 마지막에 둠)
+PROMPT_TEMPLATES = {'legacy': PROMPT_TEMPLATE, 'prefix': PROMPT_HEAD + PROMPT_TAIL + PROMPT_CONTEXT}
 
-    try:
-        # 출력 파서를 JSON 형식으로 설정
-        parser = JsonOutputParser()
+# IT 관련 기술 카테고리 리스트 정의
+it_tech_list = [
+    '인공지능', '데이터베이스', '클라우드 컴퓨팅', '소프트웨어 개발 및 관리',
+    '네트워크 및 보안', 'IoT', '블록체인', 'AR/VR 및 메타버스'
+]
 
-        # LLM 실행 전 시간 기록
-        start_time = time.time()
 
-        # LLM에 프롬프트 전달 및 응답 수신
-        response = llm.invoke(prompt.format(context=text))
+class CategoryClassificationStage(LLMStage):
+    """공고 요약문에서 IT 관련 기술을 분류하는 LLM 단계."""
+
+    def make_result(self, text, response, start_time):
+        """
+        응답을 JSON 형식으로 파싱하고 사전 정의된 IT 관련 기술만 남깁니다.
 
-        # 응답을 JSON 형식으로 파싱
-        parsed_output = parser.parse(response.content)
+        Returns:
+            tuple: (IT 기술 딕셔너리, 기술 리스트, 실행 시간, 응답 메타데이터)
+        """
+        parsed_output = self.parser.parse(response.content)
 
         # 결과 저장을 위한 변수 초기화
         category_dict = []  # IT 관련 기술과 참조 텍스트를 저장
@@ -132,14 +124,45 @@ def llm_category_classification(text) -> List[str]:
                     category_list.append(i['name'])
 
         # LLM 실행 후 시간 기록
-        end_time = time.time()
-        execution_time = end_time - start_time  # 실행 시간 계산
-        token_usage = response.usage_metadata
+        execution_time = time.time() - start_time
+        return category_dict, category_list, execution_time, response.usage_metadata
+
+    def on_error(self, text, error):
+        """오류 발생 시 메시지를 출력하고 기본값을 반환합니다."""
+        print(f"Error processing response: {error}")
+        return [], [], None, None
+
+@lru_cache(maxsize=None)
+def category_classification_stage(max_retries=2):
+    """
+    IT 기술 분류 단계를 프로세스당 한 번만 생성합니다.
+
+    Args:
+        max_retries (int): OpenAI 클라이언트 자체의 재시도 횟수. LLMExecutor로 실행할 때는 0으로 두어
+            429를 실행기가 직접 처리하게 합니다.
 
-        # 결과 반환 (IT 기술 딕셔너리, 기술 리스트, 실행 시간, 응답 메타데이터)
-        return category_dict, category_list, execution_time, token_usage
+    Returns:
+        CategoryClassificationStage: gpt-4o-mini를 사용하는 IT 기술 분류 단계
+    """
+    # 환경 변수 로드 (예: API 키)
+    load_environment()
+    prompt = PromptTemplate.from_template(PROMPT_TEMPLATES[prompt_layout()])
+    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0, max_retries=max_retries)
+    # 출력 파서를 JSON 형식으로 설정
+    return CategoryClassificationStage(prompt, llm, JsonOutputParser(), cache=default_response_cache())
 
-    except Exception as e:
-        # 오류 발생 시 메시지 출력 및 기본값 반환
-        print(f"Error processing response: {e}")
-        return [], [], None, None
\ No newline at end of file
+def llm_category_classification(text) -> List[str]:
+    """
+    주어진 텍스트에서 IT 관련 기술을 분류하는 함수.
+
+    Args:
+        text (str): 공고 요약문 텍스트
+
+    Returns:
+        tuple:
+            - category_dict(List[dict]): 추출된 IT 기술 정보
+            - category_list(List[str]): 기술 카테고리 리스트
+            - execution_time(float): 분석 실행 시간
+            - token_usage(dict): LLM 응답 메타데이터
+    """
+    return category_classification_stage().run(text)
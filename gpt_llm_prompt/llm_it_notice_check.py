@@ -1,8 +1,10 @@
 from langchain_core.prompts import PromptTemplate  
 from langchain_openai import ChatOpenAI  
-from dotenv import load_dotenv  
 from langchain.output_parsers.enum import EnumOutputParser  
 from enum import Enum  
+from functools import lru_cache
+from function_list.llm_stage import LLMStage, load_environment, prompt_layout
+from function_list.llm_cache import default_response_cache
 import time  
 
 # IT 공고 참여 가능 여부를 나타내는 Enum 클래스 정의
@@ -13,54 +15,80 @@ class it_notice(Enum):
 # EnumOutputParser 객체 생성 (it_notice Enum 기반)
 parser = EnumOutputParser(enum=it_notice)
 
-def llm_it_notice_check(text):
-    """
-    공고 텍스트를 분석하여 소프트웨어 회사가 참여 가능한지 판단합니다.
-
-    Args:
-        text (str): 공고 텍스트
-
-    Returns:
-        tuple:
-            - it_notice_check(str): "True" 또는 "False"
-            - execution_time(float): 분석 실행 시간
-            - token_usage(dict): LLM 응답 메타데이터 
-    """
-    # 환경 변수 로드 (예: OpenAI API 키)
-    load_dotenv()
-
-    # LLM에 전달할 프롬프트 생성
-    prompt = PromptTemplate.from_template(
-        """
+# 프롬프트 앞부분: 판단 기준
+PROMPT_HEAD = """
         이 공고가 소프트웨어 회사가 참여할 수 있는 프로젝트인지 분류해 주세요.  
         IT와 관련된 경우라도, 영상 콘텐츠 개발, 행사 주최, 행사 운영, 교육 프로그램 개발과 같은 작업이 포함되어 있다면 참여할 수 없습니다.  
         참여할 수 있는 경우 **반드시** "True"만 응답하고, 참여할 수 없는 경우 **반드시** "False"만 응답하세요.  
         추가적인 설명은 포함하지 마세요.
 
-        ### 제공된 공고 내용:
+        """
+
+# 공고 내용 블록
+PROMPT_CONTEXT = """### 제공된 공고 내용:
         {context}
         
-        ### 지시 사항: 
+        """
+
+# 프롬프트 뒷부분: 출력 형식 지침
+PROMPT_TAIL = """### 지시 사항: 
         {instructions}
         """
-    ).partial(instructions=parser.get_format_instructions())  # 출력 형식 지침 포함
 
-    # ChatOpenAI 객체 생성 (LLM 초기화)
-    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0)
+# LLM에 전달할 프롬프트 ({instructions}에는 출력 형식 지침이 들어감)
+PROMPT_TEMPLATE = PROMPT_HEAD + PROMPT_CONTEXT + PROMPT_TAIL
+
+# 프롬프트 배치 방식별 템플릿 (prefix는 고정 지침을 앞에 두고 공고 내용을 마지막에 둠)
+PROMPT_TEMPLATES = {'legacy': PROMPT_TEMPLATE, 'prefix': PROMPT_HEAD + PROMPT_TAIL + PROMPT_CONTEXT}
+
+
+class ITNoticeCheckStage(LLMStage):
+    """공고 텍스트를 분석하여 소프트웨어 회사가 참여 가능한지 판단하는 LLM 단계."""
+
+    def make_result(self, text, response, start_time):
+        """
+        응답을 Enum 형식으로 파싱합니다.
+
+        Returns:
+            tuple: (판단 결과("True" 또는 "False"), 실행 시간, 응답 메타데이터)
+        """
+        parsed_output = self.parser.parse(response.content)
+
+        # 종료 시간 기록 및 실행 시간 계산
+        execution_time = time.time() - start_time
+        return parsed_output.value, execution_time, response.usage_metadata
 
-    # 시작 시간 기록
-    start_time = time.time()
+@lru_cache(maxsize=None)
+def it_notice_check_stage(max_retries=2):
+    """
+    IT 공고 판단 단계를 프로세스당 한 번만 생성합니다.
 
-    # LLM 호출 및 응답 수신
-    response = llm.invoke(prompt.format(context=text))
+    Args:
+        max_retries (int): OpenAI 클라이언트 자체의 재시도 횟수. LLMExecutor로 실행할 때는 0으로 두어
+            429를 실행기가 직접 처리하게 합니다.
 
-    # 응답을 Enum 형식으로 파싱
-    parsed_output = parser.parse(response.content)
+    Returns:
+        ITNoticeCheckStage: gpt-4o-mini를 사용하는 IT 공고 판단 단계
+    """
+    # 환경 변수 로드 (예: OpenAI API 키)
+    load_environment()
+    prompt = PromptTemplate.from_template(PROMPT_TEMPLATES[prompt_layout()]).partial(
+        instructions=parser.get_format_instructions()  # 출력 형식 지침 포함
+    )
+    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0, max_retries=max_retries)
+    return ITNoticeCheckStage(prompt, llm, parser, cache=default_response_cache())
 
-    # 종료 시간 기록 및 실행 시간 계산
-    end_time = time.time()
-    execution_time = end_time - start_time
-    it_notice_check = parsed_output.value
-    token_usage = response.usage_metadata
-    # 판단 결과(Enum 값), 실행 시간, 응답 메타데이터 반환
-    return it_notice_check, execution_time, token_usage
+def llm_it_notice_check(text):
+    """
+    공고 텍스트를 분석하여 소프트웨어 회사가 참여 가능한지 판단합니다.
+
+    Args:
+        text (str): 공고 텍스트
+
+    Returns:
+        tuple:
+            - it_notice_check(str): "True" 또는 "False"
+            - execution_time(float): 분석 실행 시간
+            - token_usage(dict): LLM 응답 메타데이터 
+    """
+    return it_notice_check_stage().run(text)
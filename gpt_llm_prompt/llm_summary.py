@@ -1,29 +1,13 @@
 from langchain_core.output_parsers import JsonOutputParser  
 from langchain_core.prompts import PromptTemplate  
 from langchain_openai import ChatOpenAI  
-from langchain_core.runnables import RunnableConfig  
-from dotenv import load_dotenv 
+from functools import lru_cache
+from function_list.llm_stage import LLMStage, load_environment
+from function_list.llm_cache import default_response_cache
 import time  
 
-def llm_summary(text):
-    """
-    공고 텍스트를 요약하여 JSON 형식으로 반환합니다.
-
-    Args:
-        text (str): 공고 텍스트
-
-    Returns:
-        tuple: 
-            - summary(str)요약 결과 
-            - execution_time(float): 실행 시간 
-            - token_usage(dict): LLM 응답 메타데이터 
-    """
-    # 환경 변수 로드 (예: OpenAI API 키)
-    load_dotenv()
-
-    # LLM에 전달할 프롬프트 생성
-    prompt = PromptTemplate.from_template(
-        """
+# LLM에 전달할 프롬프트
+PROMPT_TEMPLATE = """
             이 공고의 사업(과업) 추진 내용을 요약해주세요.
 
             ### 제공된 공고 내용:
@@ -42,30 +26,55 @@ def llm_summary(text):
             2. 요약 내용은 반드시 **"~입니다."** 형식으로 끝납니다.
             - 예시: "이 사업은 AI 기술을 활용하여 데이터를 분석하는 과업을 포함하고 있습니다."
         """
-    )
 
-    # ChatOpenAI 객체 생성 (LLM 초기화)
-    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0)
 
-    # JSON 형식 출력을 위한 파서 생성
-    parser = JsonOutputParser()
+class SummaryStage(LLMStage):
+    """공고 텍스트를 요약하는 LLM 단계."""
+
+    def make_result(self, text, response, start_time):
+        """
+        응답을 JSON 형식으로 파싱하여 요약 내용을 꺼냅니다.
+
+        Returns:
+            tuple: (요약 결과, 실행 시간, 응답 메타데이터)
+        """
+        parsed_output = self.parser.parse(response.content)
+        summary = parsed_output["summary"]  # 요약 내용 추출
+
+        # 종료 시간 기록 및 실행 시간 계산
+        execution_time = time.time() - start_time
+        return summary, execution_time, response.usage_metadata
 
-    # LLM 실행 태그 설정
-    llm_tag = RunnableConfig(tags=["summarization", "gpt-4o-mini"])
+@lru_cache(maxsize=None)
+def summary_stage(max_retries=2):
+    """
+    요약 단계를 프로세스당 한 번만 생성합니다.
 
-    # 시작 시간 기록
-    start_time = time.time()
+    Args:
+        max_retries (int): OpenAI 클라이언트 자체의 재시도 횟수. LLMExecutor로 실행할 때는 0으로 두어
+            429를 실행기가 직접 처리하게 합니다.
 
-    # LLM 호출 및 응답 수신
-    response = llm.invoke(prompt.format(context=text), config=llm_tag)
+    Returns:
+        SummaryStage: gpt-4o-mini를 사용하는 요약 단계
+    """
+    # 환경 변수 로드 (예: OpenAI API 키)
+    load_environment()
+    prompt = PromptTemplate.from_template(PROMPT_TEMPLATE)
+    llm = ChatOpenAI(model_name="gpt-4o-mini", temperature=0, max_retries=max_retries)
+    # JSON 형식 출력을 위한 파서와 LLM 실행 태그 설정
+    return SummaryStage(prompt, llm, JsonOutputParser(), tags=["summarization", "gpt-4o-mini"], cache=default_response_cache())
 
-    # 응답을 JSON 형식으로 파싱
-    parsed_output = parser.parse(response.content)
-    summary = parsed_output["summary"]  # 요약 내용 추출
+def llm_summary(text):
+    """
+    공고 텍스트를 요약하여 JSON 형식으로 반환합니다.
 
-    # 종료 시간 기록 및 실행 시간 계산
-    end_time = time.time()
-    execution_time = end_time - start_time
-    token_usage = response.usage_metadata
-    # 요약 결과, 실행 시간, 응답 메타데이터 반환
-    return summary, execution_time, token_usage
\ No newline at end of file
+    Args:
+        text (str): 공고 텍스트
+
+    Returns:
+        tuple: 
+            - summary(str)요약 결과 
+            - execution_time(float): 실행 시간 
+            - token_usage(dict): LLM 응답 메타데이터 
+    """
+    return summary_stage().run(text)
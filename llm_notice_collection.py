@@ -1,177 +1,115 @@
-import requests 
-import json
-from selenium.webdriver.common.by import By
 import os 
-import time
+import argparse
+from contextlib import closing,nullcontext
 from function_list.basic_options import mongo_setting
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-import pandas as pd
-from function_list.basic_options import selenium_setting,download_path_setting,init_browser
-from function_list.g2b_func import notice_file_check,folder_clear
+from function_list.notice_scraper import scrape_notices
+from function_list.notice_api import NoticePageCache,fetch_notice_pages,BID_NOTICE_QUERY_TYPE
+from function_list.attachment_fetch import notice_attachments
+from function_list.attachment_store import AttachmentStore
+from function_list.notice_store import notice_id_index,NoticeWriteBuffer
+from function_list.parse_pool import ParsePool
+from function_list.extract_cache import ExtractionCache
+from function_list.watermark import collection_window,registered_at,save_watermark,watermark_before
 
 
-# url 주소 변수 지정
-def wait_for_downloads(download_dir, timeout=30):
-    """
-    다운로드가 완료될 때까지 기다리는 함수.
-
-    :param download_dir: 다운로드 디렉토리 (예: '/path/to/downloads')
-    :param timeout: 최대 대기 시간 (초)
-    :return: 다운로드 완료 여부 (True/False)
-    """
-    end_time = time.time() + timeout
-    while True:
-        # 다운로드 디렉토리의 파일 목록 가져오기
-        files = os.listdir(download_dir)
-        
-        # 임시 파일(`.part`)이 없는지 확인
-        if not any(file.endswith('.part') for file in files):
-            return True  # 다운로드 완료
-        
-        # 타임아웃 확인
-        if time.time() > end_time:
-            return False
-        
-        # 0.5초 대기 후 다시 확인
-        time.sleep(0.5)
-
-
-def notice_search(notice_ids, notice_list,folder_path):
+def notice_search(notice_ids, notice_list,folder_path,bgn_dt=None,end_dt=None,worker_count=4,direct_fetch=True,parse_workers=2):
     collection = mongo_setting('llm_notice_test','test_notice_dataset')
+    watermark_collection = mongo_setting('llm_notice_test','collection_watermark')
+    cache = NoticePageCache(folder_path)
+    # 중단된 조회가 있으면 같은 기간을 이어서 조회, 없으면 지난 수집 이후의 증분만 조회
+    # (bgn_dt가 주어지면 해당 기간 재수집)
+    if bgn_dt is None and cache.unfinished_window() is not None:
+        bgn_dt, end_dt = cache.unfinished_window()
+    else:
+        bgn_dt, end_dt = collection_window(watermark_collection, BID_NOTICE_QUERY_TYPE, bgn_dt, end_dt)
+    print("조회 기간 : ", bgn_dt, "~", end_dt)
+    cache.open_window(bgn_dt, end_dt)
     try:
-        url = 'http://apis.data.go.kr/1230000/ad/BidPublicInfoService/getBidPblancListInfoServcPPSSrch?serviceKey=Qa6CXT4r6qEr%2BkQt%2FJx6wJr5MPx45hKNJwNTScoYryT2uGz7GozIqpjBw%2FRMk1uE8l92NU7h89m20sa%2FXHKuaQ%3D%3D&pageNo=1&numOfRows=500&inqryDiv=1&inqryBgnDt={}&inqryEndDt={}&type=json'.format('202503170000', '202503240000')
-        # url과 parameters를 response라는 변수로 받음 
-        response = requests.get(url) 
-        # json 파일을 dictionary 형태로 변환
-        contents = json.loads(response.content)
+        fetch_notice_pages(cache)
+    except Exception as e:
+        # 조회에 실패해도 이미 받은 페이지의 공고는 처리
+        print(f"공고 목록 조회 중 오류 발생: {e}")
 
-        items = contents['response']['body']['items']
+    notice_id_list  = set()
+    item_num = 0
+    print("총 공고 수 : ", cache.total_count)
+    db_insert_count = 0
+    last_registered = ''
+    # 작업 큐로 전달했지만 아직 공고 내용을 받지 못한 공고 (notice_id -> 등록 일시)
+    unfinished = {}
 
-        totalCount = contents['response']['body']['totalCount']
-        numOfRows = contents['response']['body']['numOfRows']
-        pages = totalCount//numOfRows + 1
-        item_list = []
-        for i in range(pages):
-            pagenum = i + 1
-            url = 'http://apis.data.go.kr/1230000/ad/BidPublicInfoService/getBidPblancListInfoServcPPSSrch?serviceKey=Qa6CXT4r6qEr%2BkQt%2FJx6wJr5MPx45hKNJwNTScoYryT2uGz7GozIqpjBw%2FRMk1uE8l92NU7h89m20sa%2FXHKuaQ%3D%3D&pageNo={}&numOfRows=500&inqryDiv=1&inqryBgnDt={}&inqryEndDt={}&type=json'.format(pagenum,'202503170000', '202503240000')
-            response = requests.get(url) 
-            contents = json.loads(response.content)
-            items = contents['response']['body']['items']
-            item_list.extend(items)
-        output_file = "item_list.json"  # 저장할 파일 이름
+    # 아직 수집하지 않은 공고만 작업 큐로 전달
+    def pending_notices():
+        nonlocal item_num, last_registered
+        for item in cache.iter_items():
+            last_registered = max(last_registered, registered_at(item))
+            bidNtceNo = item['bidNtceNo']
+            bidNtceOrd = item['bidNtceOrd']
+            notice_id = bidNtceNo + '-' + bidNtceOrd
+            item_num += 1
+            if item_num % 100 == 0:
+                print(item_num)
+            if notice_id not in notice_id_list and notice_id not in notice_ids:
+                notice_id_list.add(notice_id)
+                unfinished[notice_id] = registered_at(item)
+                yield {'notice_id':notice_id,'link':item['bidNtceDtlUrl'],'title':item['bidNtceNm'],
+                       'attachments':notice_attachments(item)}
 
-        try:
-            with open(output_file, "w", encoding="utf-8") as file:
-                json.dump(item_list, file, ensure_ascii=False, indent=4)  # JSON 저장
-            print(f"item_list가 '{output_file}'로 저장되었습니다.")
-        except Exception as e:
-            print(f"JSON 저장 중 오류 발생: {e}")
-    except:
-        file_path = folder_path + 'item_list.json'
-        print(file_path)
-        # JSON 파일 읽기
-        with open(file_path, 'r', encoding='utf-8') as file:
-            item_list = json.load(file)
+    # 재공고 등으로 같은 첨부파일을 다시 받지 않도록 저장소를 함께 사용
+    # 파일 파싱은 별도 프로세스에서 실행하여 문제 있는 파일이 수집을 멈추지 않도록 함
+    # 재수집 시 같은 첨부파일은 다시 파싱하지 않도록 추출 결과를 보관
+    # 공고를 모아서 저장하고, 오류로 중단되어도 모인 공고는 저장 (오류가 나도 작업 프로세스와 DB 연결은 정리)
+    with AttachmentStore(os.path.join(folder_path, 'attachment_store')) as store, \
+            (ParsePool(parse_workers) if parse_workers > 0 else nullcontext()) as parse_pool, \
+            ExtractionCache(os.path.join(folder_path, 'extract_cache.sqlite')) as extract_cache, \
+            NoticeWriteBuffer(collection) as writer, \
+            closing(scrape_notices(pending_notices(), folder_path, worker_count, direct_fetch, store, parse_pool,
+                                   extract_cache)) as results:
+        # 저장 중 오류가 나면 closing()이 작업자를 먼저 멈춘 뒤 공유 자원을 닫음
+        for notice, text in results:
+            if text is None:
+                continue
+            unfinished.pop(notice['notice_id'], None)
+            dict_notice = {'notice_id':notice['notice_id'],'link':notice['link'],'title':notice['title'],'notice_text':text}
+            notice_list.append(dict_notice)
+            writer.add(dict_notice)
+            db_insert_count += 1
+        if parse_pool is not None:
+            print("파일 파싱 결과:", dict(parse_pool.stats))
+        print("추출 결과 캐시:", extract_cache.stats())
 
-    chrome_options = selenium_setting()
-    chrome_options,download_folder_path = download_path_setting(folder_path,chrome_options)
-    browser = init_browser(chrome_options)
-    notice_id_list  = []
-    item_num = 0
-    print("총 공고 수 : ", len(item_list))
-    db_insert_count = 0
-    for item in item_list:
-        bidNtceNo = item['bidNtceNo']
-        bidNtceOrd = item['bidNtceOrd']
-        notice_id = bidNtceNo + '-' + bidNtceOrd
-        item_num += 1
-        if item_num % 100 == 0:
-            print(item_num)
-        if notice_id not in notice_id_list and notice_id not in notice_ids:
-            notice_id_list.append(notice_id)
-            notice_title = item['bidNtceNm']
-            notice_link = item['bidNtceDtlUrl']
-            for k in range(10):
-                try:
-                    folder_clear(download_folder_path)
-                    browser.get(notice_link)    
-                    time.sleep(3)
-                    WebDriverWait(browser, 10).until(
-                        EC.invisibility_of_element_located((By.ID, "___processbar2"))  # 로딩 창의 ID를 사용
-                    )
-                except:
-                    pass
-                try:
-                    alarm_btn = browser.find_element(by=By.CSS_SELECTOR,value="input[value='확인']")
-                    alarm_btn.click()
-                except:
-                    pass
-                try:
-                    download_elements = browser.find_elements(By.CSS_SELECTOR,value='td>nobr>a')
-                    # 찾은 요소 출력
-                    for element in download_elements:
-                        element.click()
-                        wait_for_downloads(download_folder_path)
-                        time.sleep(2)
-                except:
-                    pass
-                try:
-                    entire_files = WebDriverWait(browser, 10).until(
-                            EC.presence_of_element_located((By.CSS_SELECTOR, 'table > thead > tr:nth-child(1) >th:nth-child(1)> div >input[title="전체선택"]'))
-                        )
-                    entire_files.click()
-                    download_btn = browser.find_elements(By.CSS_SELECTOR, "input[value='다운로드']")[0]
-                    download_btn.click()
-                    wait_for_downloads(download_folder_path)
-                    time.sleep(2)
-                    try:
-                        alarm_btn = browser.find_element(by=By.CSS_SELECTOR,value="input[value='확인']")
-                        alarm_btn.click()
-                    except Exception as e:
-                        pass
-                    try:
-                        rfp_btn = browser.find_element(by=By.CSS_SELECTOR,value='#mf_wfm_container_mainWframe_grdPrpsDmndInfoView_cell_0_2 > nobr:nth-child(1) > a:nth-child(1)')
-                        rfp_btn.click()
-                        time.sleep(2)
-                    except:
-                        pass
-                    text = notice_file_check(download_folder_path)
-                    folder_clear(download_folder_path)
-                    time.sleep(1)
-                    dict_notice = {'notice_id':notice_id,'link':notice_link,'title':notice_title,'notice_text':text}
-                    notice_list.append(dict_notice)
-                    collection.insert_one(dict_notice)
-                    db_insert_count += 1
-                    # print(dict_notice)
-                    break
-                except Exception as e:
-                    # print("download_error")
-                    time.sleep(2)
-            pass
-    browser.quit()
+    # 모든 페이지를 받아 모든 공고를 처리한 뒤에만 워터마크를 갱신
+    if cache.is_complete():
+        # 수집에 실패한 공고가 있으면 가장 이른 실패 공고가 다음 조회 기간에 다시 포함되도록 워터마크를 제한
+        # (등록 일시를 모르는 실패 공고가 있으면 워터마크를 갱신하지 않음)
+        if unfinished:
+            print("수집 실패 공고 수:", len(unfinished))
+            if last_registered and all(unfinished.values()):
+                last_registered = min(last_registered, watermark_before(min(unfinished.values())))
+            else:
+                last_registered = ''
+        if last_registered:
+            save_watermark(watermark_collection, BID_NOTICE_QUERY_TYPE, last_registered)
+        cache.mark_done()
     print("저장한 공고 수:", db_insert_count)
     pass
     return notice_list
 
-def notice_collection():
+def notice_collection(bgn_dt=None, end_dt=None, worker_count=4, direct_fetch=True, parse_workers=2):
     collection = mongo_setting('llm_notice_test','test_notice_dataset')
-    results = collection.find({},{'_id':0})
-    existing_df = [i for i in results]
-    existing_df = pd.DataFrame(existing_df)
-    existing_df.rename(columns={
-        'notice_id': '공고번호',
-        'title': '공고명',
-        'link': '링크',
-        }, inplace=True)
-    # notice_ids = existing_df['공고번호'].to_list()
-    notice_ids = []
+    notice_ids = notice_id_index(collection)
     notice_list = []
     folder_path = os.environ.get("folder_path")
-    notice_list = notice_search(notice_ids,notice_list,folder_path)
+    notice_list = notice_search(notice_ids,notice_list,folder_path,bgn_dt,end_dt,worker_count,direct_fetch,parse_workers)
 
     return notice_list
 
 if __name__ == "__main__":
-    notice_collection()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--begin', help='재수집 시작 일시 (YYYYMMDDHHMM)')
+    parser.add_argument('--end', help='조회 종료 일시 (YYYYMMDDHHMM)')
+    parser.add_argument('--workers', type=int, default=4, help='동시에 실행할 작업자 수')
+    parser.add_argument('--browser-only', action='store_true', help='첨부파일을 항상 브라우저로 내려받음')
+    parser.add_argument('--parse-workers', type=int, default=2, help='파일 파싱 프로세스 수 (0이면 작업자 스레드에서 파싱)')
+    args = parser.parse_args()
+    notice_collection(args.begin, args.end, args.workers, not args.browser_only, args.parse_workers)
\ No newline at end of file
@@ -1,62 +1,136 @@
-from dotenv import load_dotenv
-from gpt_llm_prompt.llm_summary import llm_summary
-from gpt_llm_prompt.llm_cate_classification import llm_category_classification
+import asyncio
+import argparse
+from gpt_llm_prompt.llm_summary import summary_stage
+from gpt_llm_prompt.llm_cate_classification import category_classification_stage
 from function_list.basic_options import mongo_setting
-from gpt_llm_prompt.llm_it_notice_check import llm_it_notice_check
-import json
+from function_list.llm_executor import LLMExecutor
+from function_list.llm_stage import load_environment, prompt_layout
+from function_list.llm_cache import default_response_cache
+from gpt_llm_prompt.llm_it_notice_check import it_notice_check_stage
 
-# MongoDB 연결 설정
-load_dotenv()
+# LLMExecutor가 429를 직접 처리하도록 OpenAI 클라이언트 자체 재시도를 끔
+EXECUTOR_STAGE_OPTIONS = {'max_retries': 0}
 
-import json
+# 공고 하나의 LLM 분석 함수
+async def notice_process(executor, notice):
+    """
+    IT 공고 판단, 요약, 기술 분류를 차례로 실행하여 저장할 문서를 만듭니다.
 
-collection = mongo_setting("llm_notice_test","test_notice_dataset")
-results = collection.find({}, {"_id": 0, "notice_id": 1})
-new_dict = []
+    Args:
+        executor (LLMExecutor): LLM 요청을 실행할 비동기 실행기.
+        notice (dict): notice_id와 notice_text를 가진 공고.
 
-collection = mongo_setting("llm_notice_test", "gpt-4o-mini-test")
-results = collection.find({}, {"_id": 0, "notice_id": 1})
-id_list = [i["notice_id"] for i in results]
-
-for i in results:
+    Returns:
+        dict 또는 None: 저장할 문서. 처리 중 오류가 발생하면 None.
+    """
     try:
-        if i["notice_id"] not in id_list and i['notice_text'].replace('\n','').replace(' ','') != '':
-            context = i["notice_text"]
-            # LLM 모델 초기화
-            # notice_type = notice_keyword_search(context)
-            it_notice_check,check_time,check_token = llm_it_notice_check(context)
-            if it_notice_check.lower() == 'true':
-                summary,summary_time,summary_token = llm_summary(context)
-                category_dict, category_list,category_time,category_token = llm_category_classification(summary)
-                collection.insert_one(
-                    {
-                        "notice_id": i["notice_id"],
-                        "notice_text": i["notice_text"],
-                        "notice_check": it_notice_check,
-                        "check_time":round(check_time,2),
-                        "check_token":check_token,
-                        "summary": summary,
-                        "summary_time":round(summary_time,2),
-                        "summary_token":summary_token,
-                        "category": category_dict,
-                        "category_time":round(category_time,2),
-                        "category_token":category_token
-                    }
-                )
-            else:
-                collection.insert_one(
-                    {
-                        "notice_id": i["notice_id"],
-                        "notice_text": i["notice_text"],
-                        "notice_check": it_notice_check,
-                        "check_time":round(check_time,2),
-                        "check_token":check_token,
-                        "category": [],
-
-                        }
-                )                
-        else:
-            pass
+        context = notice["notice_text"]
+        it_notice_check,check_time,check_token = await executor.acall(it_notice_check_stage(**EXECUTOR_STAGE_OPTIONS), context)
+        if it_notice_check.lower() == 'true':
+            summary,summary_time,summary_token = await executor.acall(summary_stage(**EXECUTOR_STAGE_OPTIONS), context)
+            category_dict, category_list,category_time,category_token = await executor.acall(
+                category_classification_stage(**EXECUTOR_STAGE_OPTIONS), summary
+            )
+            return {
+                "notice_id": notice["notice_id"],
+                "notice_text": notice["notice_text"],
+                "notice_check": it_notice_check,
+                "check_time":round(check_time,2),
+                "check_token":check_token,
+                "summary": summary,
+                "summary_time":round(summary_time,2),
+                "summary_token":summary_token,
+                "category": category_dict,
+                "category_time":round(category_time,2),
+                "category_token":category_token
+            }
+        return {
+            "notice_id": notice["notice_id"],
+            "notice_text": notice["notice_text"],
+            "notice_check": it_notice_check,
+            "check_time":round(check_time,2),
+            "check_token":check_token,
+            "category": [],
+        }
     except:
-        pass
+        return None
+
+# 공고 목록 LLM 분석 함수
+async def notice_test(collection, notices, executor):
+    """
+    공고를 동시에 분석하고, 끝난 순서대로 결과 컬렉션에 저장합니다.
+    배치 모드에서 일부 단계만 끝난 문서가 있으면 새 결과로 교체합니다.
+
+    Args:
+        collection (Collection): 결과를 저장할 MongoDB 컬렉션.
+        notices (List[dict]): 분석할 공고 목록.
+        executor (LLMExecutor): LLM 요청을 실행할 비동기 실행기.
+    """
+    tasks = [asyncio.create_task(notice_process(executor, notice)) for notice in notices]
+    for task in asyncio.as_completed(tasks):
+        document = await task
+        if document is not None:
+            collection.replace_one({"notice_id": document["notice_id"]}, document, upsert=True)
+
+# 분석 대상 공고 조회 함수
+def pending_notices(dataset, collection):
+    """
+    테스트 데이터셋에서 아직 분석이 끝나지 않았고 내용이 있는 공고를 가져옵니다.
+
+    배치 모드(BatchPipeline)는 단계별로 결과를 저장하므로, category 필드가 있는 문서만 끝난 것으로 봅니다.
+    (IT 공고가 아닌 경우에도 category는 빈 리스트로 저장됨)
+
+    Args:
+        dataset (Collection): 테스트 공고 컬렉션.
+        collection (Collection): 결과 컬렉션.
+
+    Returns:
+        List[dict]: notice_id와 notice_text를 가진 공고 목록.
+    """
+    id_list = {i["notice_id"] for i in collection.find({"category": {"$exists": True}}, {"_id": 0, "notice_id": 1})}
+    return [
+        i for i in dataset.find({}, {"_id": 0, "notice_id": 1, "notice_text": 1})
+        if i["notice_id"] not in id_list and i.get('notice_text', '').replace('\n','').replace(' ','') != ''
+    ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="gpt-4o-mini로 테스트 공고를 분석합니다.")
+    parser.add_argument('--mode', choices=['interactive', 'batch'], default='interactive',
+                        help="interactive: 동시 요청으로 바로 분석, batch: OpenAI Batch API로 분석")
+    parser.add_argument('--concurrency', type=int, default=16, help="최대 동시 요청 수")
+    parser.add_argument('--rpm', type=float, default=None, help="분당 요청 수 제한")
+    parser.add_argument('--tpm', type=float, default=None, help="분당 토큰 수 제한")
+    parser.add_argument('--batch-dir', default='batch_jobs', help="배치 요청 파일을 저장할 디렉토리")
+    parser.add_argument('--poll-interval', type=float, default=60, help="배치 상태 확인 간격 (초)")
+    parser.add_argument('--cache-bypass', action='store_true',
+                        help="LLM_CACHE_PATH 응답 캐시의 저장된 응답을 사용하지 않고 새 응답으로 덮어씀")
+    args = parser.parse_args()
+
+    # 환경 변수 로드 (MongoDB, OpenAI API 키)
+    load_environment()
+
+    dataset = mongo_setting("llm_notice_test","test_notice_dataset")
+    collection = mongo_setting("llm_notice_test", "gpt-4o-mini-test")
+    cache = default_response_cache()
+    if cache is not None and args.cache_bypass:
+        cache.bypass = True
 
+    if args.mode == 'batch':
+        from gpt_llm_prompt.llm_batch import BatchPipeline, OpenAIBatchProvider
+        pipeline = BatchPipeline(OpenAIBatchProvider(), dataset, collection, args.batch_dir, args.poll_interval)
+        for stats in pipeline.run():
+            print(stats)
+    else:
+        notices = pending_notices(dataset, collection)
+        executor = LLMExecutor(max_concurrency=args.concurrency, requests_per_minute=args.rpm, tokens_per_minute=args.tpm)
+        asyncio.run(notice_test(collection, notices, executor))
+        print(f"공고 {len(notices)}개 처리: {executor.summary()}")
+    # 프롬프트 배치 방식별 캐시된 입력 토큰 비교용
+    print(f"프롬프트 배치 방식: {prompt_layout()}")
+    stage_options = {} if args.mode == 'batch' else EXECUTOR_STAGE_OPTIONS
+    for name, stage in (('check', it_notice_check_stage(**stage_options)), ('summary', summary_stage(**stage_options)),
+                        ('category', category_classification_stage(**stage_options))):
+        print(f"{name} 토큰 사용량: {stage.usage_stats()}")
+    if cache is not None:
+        print(f"응답 캐시: {cache.stats()}")
@@ -1,31 +1,14 @@
-from dotenv import load_dotenv
 from langchain_ollama import ChatOllama
 from langchain_core.output_parsers import JsonOutputParser
 from typing import List
 from langchain_core.prompts import PromptTemplate
-from langchain_core.runnables import RunnableConfig
+from functools import lru_cache
+from function_list.llm_stage import LLMStage, load_environment, usage_total_tokens, prompt_layout
+from function_list.llm_cache import default_response_cache
 import time
 
-def llm_category_classification(text, llm_name) -> List[str]:
-    """
-    공고 요약문에서 IT 관련 기술을 분류하는 함수.
-
-    Args:
-        text(str): 공고 요약문         
-        llm_name(str): 사용할 LLM 모델 이름
-
-    Returns:
-        tuple: 
-            - category_dict(List[dict]): 분류된 IT 관련 기술과 참조 텍스트의 리스트 
-            - category_list(List[str]): 분류된 IT 관련 기술 이름 리스트 
-            - execution_time(float): 실행 시간 
-            - total_tokens(int 또는 None): LLM이 사용한 총 토큰 수 
-    """
-    load_dotenv()  # 환경 변수 로드
-
-    # 분류 작업에 사용할 프롬프트 템플릿 정의
-    prompt = PromptTemplate.from_template(
-        """
+# 프롬프트 앞부분: 주의사항과 IT 관련 기술 목록
+PROMPT_HEAD = """
         다음은 공고의 요약문입니다.  
         이 요약문에서 요구하는 **IT 관련 기술**(예시: 인공지능, 클라우드, 데이터베이스)을 분류해주세요.  
         단, 아래 조건을 반드시 준수하여 IT 관련 기술을 정확히 분류하세요:  
@@ -46,10 +29,16 @@ def llm_category_classification(text, llm_name) -> List[str]:
             8. **AR/VR 및 메타버스**  
             9. **기타 기술**  
 
-        ## 제공된 공고 요약문 내용:
+        """
+
+# 공고 내용 블록
+PROMPT_CONTEXT = """## 제공된 공고 요약문 내용:
         {context}
 
-        ## 출력 형식(JSON):
+        """
+
+# 프롬프트 뒷부분: 출력 형식(JSON)
+PROMPT_TAIL = """## 출력 형식(JSON):
         ```
         {{“IT 관련 기술": [
             {{“name": “[한국어로 된 카테고리 이름]”,
@@ -58,48 +47,76 @@ def llm_category_classification(text, llm_name) -> List[str]:
         }}
         ```
         """
-    )
 
-    # LLM 모델 초기화
-    llm = ChatOllama(
-        model=llm_name,
-        format="json",  # JSON 형식으로 입출력 설정
-        temperature=0   # 출력의 일관성을 위해 온도값 설정
-    )
+# 분류 작업에 사용할 프롬프트 템플릿
+PROMPT_TEMPLATE = PROMPT_HEAD + PROMPT_CONTEXT + PROMPT_TAIL
+
+# 프롬프트 배치 방식별 템플릿 (prefix는 고정 지침을 앞에 두고 공고 내용을 마지막에 둠)
+PROMPT_TEMPLATES = {'legacy': PROMPT_TEMPLATE, 'prefix': PROMPT_HEAD + PROMPT_TAIL + PROMPT_CONTEXT}
+
+
+class CategoryClassificationStage(LLMStage):
+    """공고 요약문에서 IT 관련 기술을 분류하는 LLM 단계."""
+
+    def make_result(self, text, response, start_time):
+        """
+        JSON 응답을 파싱하고 참조 텍스트가 있는 IT 관련 기술만 남깁니다.
+
+        Returns:
+            tuple: (IT 관련 기술과 참조 텍스트 리스트, IT 관련 기술 이름 리스트, 실행 시간, 총 토큰 수)
+        """
+        parsed_output = self.parser.parse(response.content)
 
-    try:
-        parser = JsonOutputParser()  # JSON 파싱을 위한 파서 초기화
-        llm_tag = RunnableConfig(tags=["classification", llm_name])  # 태그 설정
-        
-        # 실행 시작 시간 기록
-        start_time = time.time()
-        
-        # 프롬프트를 기반으로 LLM 호출
-        response = llm.invoke(prompt.format(context=text), config=llm_tag)
-        
-        # 응답 파싱
-        parsed_output = parser.parse(response.content)
-        
         # IT 관련 기술 필터링
         category_dict = []
         for i in parsed_output['IT 관련 기술']:
             if i['참조_텍스트'] != '' and i['참조_텍스트'] is not None:
                 category_dict.append(i)
         category_list = [category["name"] for category in category_dict]
-        
+
         # 실행 종료 시간 및 소요 시간 계산
-        end_time = time.time()
-        execution_time = end_time - start_time
+        execution_time = time.time() - start_time
+        return category_dict, category_list, execution_time, usage_total_tokens(response)
 
-        # 사용된 총 토큰 수 확인
-        try:
-            total_tokens = response.usage_metadata['total_tokens']
-        except:
-            total_tokens = None
+    def on_error(self, text, error):
+        """에러 발생 시 빈 결과를 반환합니다."""
+        print(f"Error processing response: {error}")
+        return [], [], None, None
 
-        return category_dict, category_list, execution_time, total_tokens
+@lru_cache(maxsize=None)
+def category_classification_stage(llm_name):
+    """
+    모델별 IT 기술 분류 단계를 프로세스당 한 번만 생성합니다.
 
-    except Exception as e:
-        # 에러 발생 시 빈 결과 반환
-        print(f"Error processing response: {e}")
-        return [], [], None, None
+    Args:
+        llm_name(str): 사용할 LLM 모델 이름
+
+    Returns:
+        CategoryClassificationStage: IT 기술 분류 단계
+    """
+    load_environment()  # 환경 변수 로드
+    prompt = PromptTemplate.from_template(PROMPT_TEMPLATES[prompt_layout()])
+    llm = ChatOllama(
+        model=llm_name,
+        format="json",  # JSON 형식으로 입출력 설정
+        temperature=0   # 출력의 일관성을 위해 온도값 설정
+    )
+    # JSON 파싱을 위한 파서와 태그 설정
+    return CategoryClassificationStage(prompt, llm, JsonOutputParser(), tags=["classification", llm_name], cache=default_response_cache())
+
+def llm_category_classification(text, llm_name) -> List[str]:
+    """
+    공고 요약문에서 IT 관련 기술을 분류하는 함수.
+
+    Args:
+        text(str): 공고 요약문         
+        llm_name(str): 사용할 LLM 모델 이름
+
+    Returns:
+        tuple: 
+            - category_dict(List[dict]): 분류된 IT 관련 기술과 참조 텍스트의 리스트 
+            - category_list(List[str]): 분류된 IT 관련 기술 이름 리스트 
+            - execution_time(float): 실행 시간 
+            - total_tokens(int 또는 None): LLM이 사용한 총 토큰 수 
+    """
+    return category_classification_stage(llm_name).run(text)
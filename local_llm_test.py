@@ -1,61 +1,101 @@
-from dotenv import load_dotenv
-from local_llm_prompt.local_llm_summary import llm_summary
-from local_llm_prompt.local_llm_classification import llm_category_classification
+import asyncio
+import argparse
+from local_llm_prompt.local_llm_summary import summary_stage
+from local_llm_prompt.local_llm_classification import category_classification_stage
 from function_list.basic_options import mongo_setting
-from local_llm_prompt.local_llm_it_notice_check import llm_it_notice_check
-import json
-
-# MongoDB 연결 설정
-load_dotenv()
-
-import json
-
-collection = mongo_setting("llm_notice_test","test_notice_dataset")
-results = collection.find({}, {"_id": 0, "notice_id": 1})
-
-llm_list = ['ko-gemma-2:latest','llama-3.2-Korean-Bllossom-3B:latest','EEVE-Korean-Instruct-10.8B:latest']
-for llm_element in llm_list:
-    collection = mongo_setting("llm_notice_test",llm_element)
-    results = collection.find({}, {"_id": 0, "notice_id": 1})
-    id_list = [i["notice_id"] for i in results]
-    for i in results:
-        try:
-            if i["notice_id"] not in id_list and i['notice_text'].replace('\n','').replace(' ','') != '':
-                context = i["notice_text"]
-                # LLM 모델 초기화
-                # notice_type = notice_keyword_search(context)
-                it_notice_check,check_time,check_token = llm_it_notice_check(context,llm_element)
-                if it_notice_check.lower() == 'true':
-                    summary,summary_time,summary_token = llm_summary(context,llm_element)
-                    category_dict, category_list,category_time,category_token = llm_category_classification(summary,llm_element)
-                    collection.insert_one(
-                        {
-                            "notice_id": i["notice_id"],
-                            "notice_text": i["notice_text"],
-                            "notice_check": it_notice_check,
-                            "check_time":round(check_time,2),
-                            "check_token":check_token,
-                            "summary": summary,
-                            "summary_time":round(summary_time,2),
-                            "summary_token":summary_token,
-                            "category": category_dict,
-                            "category_time":round(category_time,2),
-                            "category_token":category_token
-                        }
-                    )
-                else:
-                    collection.insert_one(
-                        {
-                            "notice_id": i["notice_id"],
-                            "notice_text": i["notice_text"],
-                            "notice_check": it_notice_check,
-                            "check_time":round(check_time,2),
-                            "check_token":check_token,
-                            "category": [],
-
-                            }
-                    )                
-            else:
-                pass
-        except:
-            pass
+from function_list.llm_executor import LLMExecutor
+from function_list.llm_stage import load_environment, prompt_layout
+from function_list.llm_cache import default_response_cache
+from local_llm_prompt.local_llm_it_notice_check import it_notice_check_stage
+from llm_test import pending_notices
+
+# 공고 하나의 LLM 분석 함수
+async def notice_process(executor, notice, llm_name):
+    """
+    IT 공고 판단, 요약, 기술 분류를 차례로 실행하여 저장할 문서를 만듭니다.
+
+    Args:
+        executor (LLMExecutor): LLM 요청을 실행할 비동기 실행기.
+        notice (dict): notice_id와 notice_text를 가진 공고.
+        llm_name (str): 사용할 LLM 모델 이름.
+
+    Returns:
+        dict 또는 None: 저장할 문서. 처리 중 오류가 발생하면 None.
+    """
+    try:
+        context = notice["notice_text"]
+        it_notice_check,check_time,check_token = await executor.acall(it_notice_check_stage(llm_name), context)
+        if it_notice_check.lower() == 'true':
+            summary,summary_time,summary_token = await executor.acall(summary_stage(llm_name), context)
+            category_dict, category_list,category_time,category_token = await executor.acall(
+                category_classification_stage(llm_name), summary
+            )
+            return {
+                "notice_id": notice["notice_id"],
+                "notice_text": notice["notice_text"],
+                "notice_check": it_notice_check,
+                "check_time":round(check_time,2),
+                "check_token":check_token,
+                "summary": summary,
+                "summary_time":round(summary_time,2),
+                "summary_token":summary_token,
+                "category": category_dict,
+                "category_time":round(category_time,2),
+                "category_token":category_token
+            }
+        return {
+            "notice_id": notice["notice_id"],
+            "notice_text": notice["notice_text"],
+            "notice_check": it_notice_check,
+            "check_time":round(check_time,2),
+            "check_token":check_token,
+            "category": [],
+        }
+    except:
+        return None
+
+# 공고 목록 LLM 분석 함수
+async def notice_test(collection, notices, executor, llm_name):
+    """
+    공고를 동시에 분석하고, 끝난 순서대로 결과 컬렉션에 저장합니다.
+
+    Args:
+        collection (Collection): 결과를 저장할 MongoDB 컬렉션.
+        notices (List[dict]): 분석할 공고 목록.
+        executor (LLMExecutor): LLM 요청을 실행할 비동기 실행기.
+        llm_name (str): 사용할 LLM 모델 이름.
+    """
+    tasks = [asyncio.create_task(notice_process(executor, notice, llm_name)) for notice in notices]
+    for task in asyncio.as_completed(tasks):
+        document = await task
+        if document is not None:
+            collection.replace_one({"notice_id": document["notice_id"]}, document, upsert=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ollama 모델로 테스트 공고를 분석합니다.")
+    parser.add_argument('--concurrency', type=int, default=4, help="최대 동시 요청 수 (Ollama OLLAMA_NUM_PARALLEL에 맞춤)")
+    parser.add_argument('--cache-bypass', action='store_true',
+                        help="LLM_CACHE_PATH 응답 캐시의 저장된 응답을 사용하지 않고 새 응답으로 덮어씀")
+    args = parser.parse_args()
+
+    # 환경 변수 로드
+    load_environment()
+    print(f"프롬프트 배치 방식: {prompt_layout()}")
+    cache = default_response_cache()
+    if cache is not None and args.cache_bypass:
+        cache.bypass = True
+
+    dataset = mongo_setting("llm_notice_test","test_notice_dataset")
+    llm_list = ['ko-gemma-2:latest','llama-3.2-Korean-Bllossom-3B:latest','EEVE-Korean-Instruct-10.8B:latest']
+    for llm_element in llm_list:
+        collection = mongo_setting("llm_notice_test",llm_element)
+        notices = pending_notices(dataset, collection)
+        executor = LLMExecutor(max_concurrency=args.concurrency, initial_concurrency=min(4, args.concurrency))
+        asyncio.run(notice_test(collection, notices, executor, llm_element))
+        print(f"{llm_element}: 공고 {len(notices)}개 처리: {executor.summary()}")
+        for name, stage in (('check', it_notice_check_stage(llm_element)), ('summary', summary_stage(llm_element)),
+                            ('category', category_classification_stage(llm_element))):
+            print(f"  {name} 토큰 사용량: {stage.usage_stats()}")
+    if cache is not None:
+        print(f"응답 캐시: {cache.stats()}")